@@ -10,3 +10,41 @@ import os
 from os import getcwd
 
 DATA_ROOT = os.path.join(getcwd(), "notes")
+
+# Open collections lazily: read only collection.json and load each note body
+# from disk the first time it is viewed or exported.
+LAZY_LOAD = True
+
+# Number of threads used to read note files when a collection is loaded
+# eagerly (1 = serial). Helps most on network-mounted note folders.
+LOAD_WORKERS = 8
+
+# Default durability of persistence writes: "none" (no fsync), "file" (fsync
+# written files) or "file+dir" (also fsync the collection folder). Can be
+# overridden with --durability or per collection in collection.json.
+DURABILITY = "file+dir"
+
+# Autosave: seconds without edits before dirty notes are written in the
+# background (0 disables autosave). Can be overridden with --autosave-delay.
+AUTOSAVE_DELAY = 2.0
+
+# Keep a snapshot of each JSON collection (collection.snapshot, plain JSON),
+# written when it is opened and closed, so it can be reopened with a single read.
+SNAPSHOT_CACHE = True
+
+# Journal storage: fold collection.journal into the note files once it grows
+# past this many bytes.
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+# Sidebar filter: seconds of typing pause before the Meeting Notes list is
+# filtered.
+FILTER_DEBOUNCE = 0.15
+
+# Keep a SQLite FTS5 full-text index (collection.fts) of every saved
+# collection. Collections that already have one are always kept in sync;
+# it serves searches of large or closed collections without loading notes.
+FTS_INDEX = False
+
+# Workspace search (all collections below DATA_ROOT): number of worker
+# threads searching collections in parallel (0 = the thread pool default).
+WORKSPACE_SEARCH_WORKERS = 4
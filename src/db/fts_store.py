@@ -0,0 +1,348 @@
+###
+# File:   src\db\fts_store.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import logging
+import re
+import sqlite3
+from contextlib import closing
+from os import path
+from threading import Lock
+from time import perf_counter
+from traceback import format_exc
+from typing import Iterable, List, Tuple
+from config.config import FTS_INDEX
+from logic.pattern.observer import Observable
+from logic.persistence import NOTE_DELETED, NOTE_RENAMED, NOTES_SAVED
+from models.notes import MeetingNote, NotesCollection
+
+
+# constants
+FTS_FILENAME = "collection.fts"
+
+# Searchable columns of notes_fts, in order, with their bm25 weights
+_FTS_COLUMNS = ("title", "topic", "location", "participants", "notes", "todos")
+_WEIGHTS = (8.0, 4.0, 1.0, 2.0, 1.0, 1.0)
+
+# docs holds one row per note; its rowid is the rowid of the note in notes_fts
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    rowid INTEGER PRIMARY KEY,
+    note_id TEXT NOT NULL UNIQUE,
+    filename TEXT,
+    title TEXT,
+    date TEXT,
+    time TEXT
+);
+CREATE INDEX IF NOT EXISTS docs_filename ON docs (filename);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+    title, topic, location, participants, notes, todos,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_SEARCH = f"""
+SELECT d.note_id, d.filename, d.title, d.date, d.time,
+       bm25(notes_fts, {", ".join(str(w) for w in _WEIGHTS)}) AS rank,
+       snippet(notes_fts, 4, :open, :close, '…', :tokens) AS notes_snippet,
+       snippet(notes_fts, 5, :open, :close, '…', :tokens) AS todos_snippet
+FROM notes_fts JOIN docs d ON d.rowid = notes_fts.rowid
+WHERE notes_fts MATCH :query
+ORDER BY rank
+LIMIT :limit
+"""
+
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Markers around matched words in snippets (Markdown bold, as rendered by the preview)
+HIGHLIGHT = ("**", "**")
+
+# Markers SQLite puts around matched words; control characters never occur in
+# indexed text (see _text), so note text containing "**" is not taken for a match
+_MARKERS = ("\x02", "\x03")
+_NO_MARKERS = str.maketrans("", "", "".join(_MARKERS))
+
+
+# variables
+# Collection folder -> lock serializing builds of its index (see ensure_index)
+_build_locks = {}
+_build_locks_lock = Lock()
+
+
+# functions/classes
+def fts_path(collection_path: str) -> str:
+    """Return the path of the full-text index of a collection folder."""
+    return path.join(collection_path, FTS_FILENAME)
+
+
+def connect(collection_path: str) -> sqlite3.Connection:
+    """Open (and create if needed) the full-text index of a collection.
+
+    The index can always be rebuilt from the notes, so it is written
+    without syncing.
+    """
+    conn = sqlite3.connect(fts_path(collection_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _text(value) -> str:
+    """Return a field value (a string or a list of lines) as text, without snippet markers."""
+    if not value:
+        return ""
+    if not isinstance(value, str):
+        value = "\n".join(str(v) for v in value if v)
+    return value.translate(_NO_MARKERS)
+
+
+def _note_fields(note: MeetingNote) -> dict:
+    """Return the indexed fields of a note; a lazy stub's body is read without faulting it in.
+
+    A stub's loader returns its file data with the journal records replayed
+    on top (see db.journal_store.replay); its title, date and time are the
+    ones held in memory.
+    """
+    if note.loaded:
+        return {name: getattr(note, name, None) for name in _FTS_COLUMNS}
+    data = note.loader()
+    data.update(title=note.title, date=note.date, time=note.time)
+    return data
+
+
+def _find(conn: sqlite3.Connection, note_id: str, filename: str = None) -> sqlite3.Row:
+    """Return the docs row of a note by id, else by file name (notes stored
+    before ids existed get a new id on every load until they are saved)."""
+    row = conn.execute("SELECT rowid FROM docs WHERE note_id = ?", (note_id,)).fetchone()
+    if row is None and filename:
+        row = conn.execute("SELECT rowid FROM docs WHERE filename = ?", (filename,)).fetchone()
+    return row
+
+
+def _upsert(conn: sqlite3.Connection, note: MeetingNote, fields: dict) -> None:
+    values = [_text(fields.get(name)) for name in _FTS_COLUMNS]
+    row = _find(conn, note.id, note.filename)
+    if row is None:
+        rowid = conn.execute(
+            "INSERT INTO docs (note_id, filename, title, date, time) VALUES (?, ?, ?, ?, ?)",
+            (note.id, note.filename, note.title, note.date, note.time),
+        ).lastrowid
+    else:
+        rowid = row["rowid"]
+        conn.execute("DELETE FROM notes_fts WHERE rowid = ?", (rowid,))
+        conn.execute(
+            "UPDATE docs SET note_id = ?, filename = ?, title = ?, date = ?, time = ? WHERE rowid = ?",
+            (note.id, note.filename, note.title, note.date, note.time, rowid),
+        )
+    conn.execute(
+        f"INSERT INTO notes_fts (rowid, {', '.join(_FTS_COLUMNS)}) VALUES (?{', ?' * len(_FTS_COLUMNS)})",
+        [rowid] + values,
+    )
+
+
+def index_notes(collection_path: str, notes: Iterable[MeetingNote]) -> Tuple[bool, str]:
+    """Add or replace notes in the full-text index (one transaction)."""
+    try:
+        count = 0
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                for note in notes:
+                    try:
+                        fields = _note_fields(note)
+                    except Exception as e:
+                        logging.warning(f"Full-text index: could not read note '{note.title}' ({note.filename}): {e}")
+                        continue
+                    _upsert(conn, note, fields)
+                    count += 1
+        return True, f"Indexed {count} note(s) in {fts_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to update full-text index: {e}\n{tb}"
+
+
+def rename_note(collection_path: str, note: MeetingNote, new_filename: str = None) -> Tuple[bool, str]:
+    """Record the new title (and file name) of a note; its text is unchanged."""
+    try:
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                row = _find(conn, note.id, note.filename)
+                if row is None:
+                    return True, f"Note '{note.title}' is not indexed"
+                conn.execute("UPDATE docs SET title = ?, filename = COALESCE(?, filename) WHERE rowid = ?",
+                             (note.title, new_filename, row["rowid"]))
+                conn.execute("UPDATE notes_fts SET title = ? WHERE rowid = ?", (note.title, row["rowid"]))
+        return True, f"Renamed note '{note.title}' in {fts_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to rename note in full-text index: {e}\n{tb}"
+
+
+def delete_note(collection_path: str, note_id: str, filename: str = None) -> Tuple[bool, str]:
+    """Drop a note from the full-text index."""
+    try:
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                row = _find(conn, note_id, filename)
+                if row is not None:
+                    conn.execute("DELETE FROM notes_fts WHERE rowid = ?", (row["rowid"],))
+                    conn.execute("DELETE FROM docs WHERE rowid = ?", (row["rowid"],))
+        return True, f"Deleted note {note_id} from {fts_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to delete note from full-text index: {e}\n{tb}"
+
+
+def _build_lock(collection_path: str) -> Lock:
+    """Return the lock serializing index builds of a collection folder."""
+    key = path.normcase(path.abspath(collection_path))
+    with _build_locks_lock:
+        return _build_locks.setdefault(key, Lock())
+
+
+def ensure_index(collection_path: str) -> Tuple[bool, str]:
+    """Build the full-text index of a collection folder unless it exists.
+
+    Concurrent searches wait for a single build instead of racing on it.
+    """
+    with _build_lock(collection_path):
+        if path.exists(fts_path(collection_path)):
+            return True, f"Full-text index of {collection_path} exists"
+        return _rebuild(collection_path)
+
+
+def rebuild(collection_path: str) -> Tuple[bool, str]:
+    """(Re)create the full-text index of a collection folder from its notes (any storage)."""
+    with _build_lock(collection_path):
+        return _rebuild(collection_path)
+
+
+def _rebuild(collection_path: str) -> Tuple[bool, str]:
+    """rebuild without locking."""
+    from db.handler import load_notes_collection
+
+    started = perf_counter()
+    collection = load_notes_collection(collection_path, lazy=True)
+    if collection is None:
+        return False, f"No collection at {collection_path}"
+
+    try:
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                conn.execute("DELETE FROM notes_fts")
+                conn.execute("DELETE FROM docs")
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to reset full-text index: {e}\n{tb}"
+
+    ok, msg = index_notes(collection_path, collection.notes)
+    if ok:
+        msg += f" in {(perf_counter() - started) * 1000:.1f} ms"
+    return ok, msg
+
+
+def _fts_query(query: str) -> str:
+    """Translate a search query (see logic.search) into FTS5 syntax.
+
+    Words and phrases are quoted, so punctuation ("2025-10-08", "c++")
+    never breaks the query; OR, AND, NOT and trailing * keep their meaning.
+    """
+    parts = []
+    for phrase, word in _QUERY_RE.findall(query or ""):
+        if word in ("OR", "AND", "NOT"):
+            if parts and parts[-1] not in ("OR", "AND", "NOT"):
+                parts.append(word)
+            continue
+        text = phrase or word
+        prefix = not phrase and text.endswith("*")
+        text = text.rstrip("*") if prefix else text
+        if not text.strip():
+            continue
+        parts.append('"' + text.replace('"', '""') + '"' + ("*" if prefix else ""))
+    while parts and parts[-1] in ("OR", "AND", "NOT"):
+        parts.pop()
+    return " ".join(parts)
+
+
+def _highlighted(snippet: str, highlight: Tuple[str, str]) -> str:
+    """Return a snippet with its matches marked by `highlight`, or None if it contains no match."""
+    if not snippet or _MARKERS[0] not in snippet:
+        return None
+    return snippet.replace(_MARKERS[0], highlight[0]).replace(_MARKERS[1], highlight[1])
+
+
+def search(collection_path: str, query: str, limit: int = 20, highlight: Tuple[str, str] = HIGHLIGHT,
+           snippet_tokens: int = 12) -> List[dict]:
+    """Return the best matches of `query` in a collection folder, best first.
+
+    Each hit is a dict with id, filename, title, date, time, score and the
+    highlighted `notes_snippet` / `todos_snippet` (None where the field has
+    no match). No note is loaded: the collection need not be open. A
+    missing index is built first.
+    """
+    match = _fts_query(query)
+    if not match:
+        return []
+    # the index file exists while it is being built: wait for a running build
+    if not path.exists(fts_path(collection_path)) or _build_lock(collection_path).locked():
+        ok, msg = ensure_index(collection_path)
+        (logging.info if ok else logging.error)(msg)
+        if not ok:
+            return []
+
+    params = {"query": match, "limit": limit, "open": _MARKERS[0], "close": _MARKERS[1], "tokens": snippet_tokens}
+    try:
+        with closing(connect(collection_path)) as conn:
+            rows = conn.execute(_SEARCH, params).fetchall()
+    except sqlite3.Error as e:
+        logging.error(f"Full-text search for {query!r} in '{collection_path}' failed: {e}")
+        return []
+
+    return [
+        {
+            "id": row["note_id"],
+            "filename": row["filename"],
+            "title": row["title"],
+            "date": row["date"],
+            "time": row["time"],
+            "score": -row["rank"],
+            "notes_snippet": _highlighted(row["notes_snippet"], highlight),
+            "todos_snippet": _highlighted(row["todos_snippet"], highlight),
+        }
+        for row in rows
+    ]
+
+
+def _enabled(collection_path: str) -> bool:
+    """Keep the index of a collection in sync when enabled in config or once it exists."""
+    return bool(collection_path) and (FTS_INDEX or path.exists(fts_path(collection_path)))
+
+
+def _on_notes_saved(name: str, collection: NotesCollection, notes: List[MeetingNote], collection_path: str) -> None:
+    """NOTES_SAVED observer: re-index the saved notes."""
+    if _enabled(collection_path):
+        ok, msg = index_notes(collection_path, notes)
+        (logging.debug if ok else logging.error)(msg)
+
+
+def _on_note_renamed(name: str, collection: NotesCollection, note: MeetingNote, collection_path: str) -> None:
+    """NOTE_RENAMED observer: record the new title and file name of the note."""
+    if _enabled(collection_path):
+        ok, msg = rename_note(collection_path, note, note.filename)
+        (logging.debug if ok else logging.error)(msg)
+
+
+def _on_note_deleted(name: str, collection: NotesCollection, note: MeetingNote, collection_path: str) -> None:
+    """NOTE_DELETED observer: drop the note from the index."""
+    if _enabled(collection_path):
+        ok, msg = delete_note(collection_path, note.id, note.filename)
+        (logging.debug if ok else logging.error)(msg)
+
+
+Observable(NOTES_SAVED).register(_on_notes_saved)
+Observable(NOTE_RENAMED).register(_on_note_renamed)
+Observable(NOTE_DELETED).register(_on_note_deleted)
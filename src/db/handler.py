@@ -8,9 +8,17 @@ import json
 import logging
 import os
 import shutil
+import tracemalloc
 import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+from typing import Tuple
 from dataclasses import asdict, is_dataclass
-from models.notes import NotesCollection, MeetingNote
+from config.config import LOAD_WORKERS, SNAPSHOT_CACHE
+from db import snapshot
+from models.dates import date_ordinal, report_unparseable
+from models.notes import NotesCollection, MeetingNote, STORAGE_JOURNAL, STORAGE_SQLITE
 
 class DataclassJSONEncoder(json.JSONEncoder):
     """A custom JSON encoder for dataclasses."""
@@ -39,12 +47,219 @@ def save_notes_collection(collection: NotesCollection, filepath: str) -> None:
         json.dump(collection, f, cls=DataclassJSONEncoder, indent=4)
     logging.info(f"Notes collection saved to '{filepath}'")
 
-def load_notes_collection(directory_path: str) -> NotesCollection | None:
+def _read_note_json(note_filepath: str) -> dict:
+    """Read and parse a single per-note JSON file."""
+    with open(note_filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _load_note_file(directory_path: str, note_meta: dict) -> MeetingNote | None:
+    """Load one note listed in collection.json; returns None (and logs) if it is missing or malformed."""
+    note_filepath = os.path.join(directory_path, note_meta["filename"])
+    if not os.path.exists(note_filepath):
+        return None
+
+    try:
+        # Parse JSON note files created by the new save flow
+        try:
+            note_json = _read_note_json(note_filepath)
+        except Exception as e:
+            logging.error(f"Error parsing JSON note '{note_filepath}': {e}")
+            # Do not silently accept malformed files; skip and report
+            return None
+
+        try:
+            note = MeetingNote.from_dict(note_json)
+        except Exception as e:
+            logging.error(f"Invalid note data in '{note_filepath}': {e}")
+            # Skip malformed note files rather than fabricating content
+            return None
+
+        note.filename = note_meta["filename"]
+        note.content_hash = note_meta.get("hash")
+        if note_meta.get("id") and not note_json.get("id"):
+            note.id = note_meta["id"]
+        return note
+    except Exception as _e:
+        logging.exception(f"Error loading note file '{note_filepath}'")
+        # skip problematic note and continue
+        return None
+
+
+def _note_stub(directory_path: str, note_meta: dict) -> MeetingNote:
+    """Build a metadata-only note whose body is read from its file on first use."""
+    note_filepath = os.path.join(directory_path, note_meta["filename"])
+    note = MeetingNote(
+        title=note_meta["title"],
+        category="",
+        date=note_meta.get("date"),
+        time=note_meta.get("time"),
+        filename=note_meta["filename"],
+        content_hash=note_meta.get("hash"),
+        loader=partial(_read_note_json, note_filepath),
+    )
+    if note_meta.get("id"):
+        note.id = note_meta["id"]
+    return note
+
+
+def _seed_stubs(collection: NotesCollection, stubs: list) -> None:
+    """Seed the open-todo column and the todo, participant and location indexes
+    of (stub, note_meta) pairs from collection.json.
+
+    Stubs without stored open todos or names (older files) are marked
+    pending in the indexes unless their todo count is known to be zero.
+    """
+    for note, note_meta in stubs:
+        if note.loaded:
+            continue
+        count = note_meta.get("open_todos")
+        if count is not None:
+            collection.columns.update(note, count)
+        items = note_meta.get("open_todo_items")
+        if items is not None:
+            collection.todos.set_items(note.id, date_ordinal(note.date), items)
+        elif count is None or count > 0:
+            collection.todos.mark_pending(note.id)
+        collection.seed_names(note, note_meta.get("participants"), note_meta.get("location"))
+
+
+def _load_note_files(directory_path: str, notes_meta: list, workers: int) -> list:
+    """Load the note files listed in `notes_meta`, keeping their order.
+
+    With `workers` > 1 the reads and parses are fanned out over a bounded
+    thread pool (the work is I/O bound, so threads overlap the file reads).
+    Missing or malformed files yield None entries.
+    """
+    if workers <= 1 or len(notes_meta) < 2:
+        return [_load_note_file(directory_path, meta) for meta in notes_meta]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(notes_meta)), thread_name_prefix="note-loader") as pool:
+        # map() yields results in submission order, i.e. collection.json order
+        return list(pool.map(lambda meta: _load_note_file(directory_path, meta), notes_meta))
+
+
+def compare_note_loaders(directory_path: str, workers: int = LOAD_WORKERS) -> Tuple[float, float]:
+    """Time the serial and the threaded note loader on a collection and log the comparison.
+
+    Returns (serial_ms, parallel_ms).
+    """
+    with open(os.path.join(directory_path, "collection.json"), 'r', encoding='utf-8') as f:
+        notes_meta = json.load(f).get("notes", [])
+
+    started = perf_counter()
+    _load_note_files(directory_path, notes_meta, 1)
+    serial_ms = (perf_counter() - started) * 1000
+
+    started = perf_counter()
+    _load_note_files(directory_path, notes_meta, workers)
+    parallel_ms = (perf_counter() - started) * 1000
+
+    logging.info(
+        f"Loading {len(notes_meta)} notes from '{directory_path}': serial {serial_ms:.1f} ms, "
+        f"{workers} threads {parallel_ms:.1f} ms ({serial_ms / max(parallel_ms, 1e-6):.2f}x)"
+    )
+    return serial_ms, parallel_ms
+
+
+def _restore_snapshot(directory_path: str, snap: dict, lazy: bool, workers: int) -> NotesCollection:
+    """Rebuild a collection from its snapshot, re-reading only note files that changed."""
+    started = perf_counter()
+    collection = snap["collection"]
+    notes = []
+    stale = []
+    for filename, stamp, note, meta in snap["notes"]:
+        if note is not None and stamp == snapshot.file_stamp(os.path.join(directory_path, filename)):
+            notes.append(note)
+            continue
+
+        if meta is None:
+            meta = {"id": note.id, "title": note.title, "date": note.date, "time": note.time,
+                    "filename": filename, "hash": note.content_hash}
+        stale.append((len(notes), meta))
+        notes.append(None)
+
+    if lazy:
+        reloaded = [_note_stub(directory_path, meta) for _pos, meta in stale]
+    else:
+        reloaded = _load_note_files(directory_path, [meta for _pos, meta in stale], workers)
+    for (pos, _meta), note in zip(stale, reloaded):
+        notes[pos] = note
+
+    collection.notes = [note for note in notes if note is not None]
+    collection.reindex()
+    _seed_stubs(collection, [(note, meta) for (_pos, meta), note in zip(stale, reloaded) if note is not None])
+    elapsed_ms = (perf_counter() - started) * 1000
+    logging.info(
+        f"Notes collection restored from snapshot '{snapshot.snapshot_path(directory_path)}' in {elapsed_ms:.1f} ms "
+        f"({len(collection.notes) - len(stale)} cached, {len(stale)} {'stubbed' if lazy else 're-read'})"
+    )
+    return collection
+
+
+def measure_notes_memory(directory_path: str, lazy: bool = False) -> float:
+    """Load a collection under tracemalloc and log the traced bytes per note.
+
+    Returns the bytes per note (notes, their fields and the collection indexes).
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        collection = load_notes_collection(directory_path, lazy=lazy, workers=1, use_snapshot=False)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    count = len(collection.notes) if collection else 0
+    per_note = used / count if count else 0.0
+    logging.info(f"{count} notes from '{directory_path}' use {used} bytes traced ({per_note:.0f} bytes/note, {'lazy' if lazy else 'eager'})")
+    return per_note
+
+
+def load_notes_collection(directory_path: str, lazy: bool = False, workers: int | None = None,
+                          use_snapshot: bool = SNAPSHOT_CACHE) -> NotesCollection | None:
     """
     Loads a notes collection from a directory.
     Returns None if the directory or collection.json does not exist.
+
+    Journal storage collections load their note files as the checkpoint and
+    then replay `collection.journal` (see db.journal_store).
+
+    With `use_snapshot` a valid `collection.snapshot` (see db.snapshot) is
+    restored with a single read; only note files whose mtime or size changed
+    since it was written are read again.
+
+    With `lazy=True` only collection.json is read: every note is created as a
+    stub from its metadata (title, date, time, filename) and its body is
+    faulted in from disk by `MeetingNote.ensure_loaded()` on first use.
+
+    Otherwise the note files are read by `workers` threads (defaults to
+    `config.LOAD_WORKERS`; 1 loads serially).
+
+    Dates and times that cannot be parsed are reported as a single warning
+    (see models.dates.report_unparseable).
     """
+    collection = _load_notes_collection(directory_path, lazy, workers, use_snapshot)
+    if collection is not None:
+        report_unparseable(collection.notes, directory_path)
+    return collection
+
+
+def _load_notes_collection(directory_path: str, lazy: bool, workers: int | None,
+                           use_snapshot: bool) -> NotesCollection | None:
     json_filepath = os.path.join(directory_path, "collection.json")
+    workers = LOAD_WORKERS if workers is None else workers
+    if use_snapshot:
+        snap = snapshot.read_snapshot(directory_path)
+        if snap is not None:
+            try:
+                return _restore_snapshot(directory_path, snap, lazy, workers)
+            except Exception as e:
+                logging.warning(f"Failed to restore snapshot of '{directory_path}', loading files: {e}")
+
     try:
         if not os.path.exists(json_filepath):
             logging.error(f"Collection file '{json_filepath}' does not exist.")
@@ -58,31 +273,43 @@ def load_notes_collection(directory_path: str) -> NotesCollection | None:
         logging.exception(f"Failed to load collection from '{json_filepath}': {e}")
         return None
 
-    for note_meta in collection_data.get("notes", []):
-        note_filepath = os.path.join(directory_path, note_meta["filename"])
-        if os.path.exists(note_filepath):
+    if collection.storage == STORAGE_SQLITE:
+        from db import sqlite_store
+        return sqlite_store.load_notes_collection(directory_path, collection)
+
+    if lazy:
+        stubs = []
+        for note_meta in collection_data.get("notes", []):
             try:
-                with open(note_filepath, 'r', encoding='utf-8') as f:
-                    # Parse JSON note files created by the new save flow
-                    try:
-                        note_json = json.load(f)
-                    except Exception as e:
-                        logging.error(f"Error parsing JSON note '{note_filepath}': {e}")
-                        # Do not silently accept malformed files; skip and report
-                        continue
-
-                try:
-                    note = MeetingNote.from_dict(note_json)
-                except Exception as e:
-                    logging.error(f"Invalid note data in '{note_filepath}': {e}")
-                    # Skip malformed note files rather than fabricating content
-                    continue
-
-                collection.notes.append(note)
-            except Exception as _e:
-                logging.exception(f"Error loading note file '{note_filepath}'")
-                # skip problematic note and continue
+                stubs.append((_note_stub(directory_path, note_meta), note_meta))
+            except Exception as e:
+                logging.error(f"Invalid note entry in '{json_filepath}': {e}")
                 continue
-    
+
+        collection.notes.extend(note for note, _meta in stubs)
+        overlaid = set()
+        if collection.storage == STORAGE_JOURNAL:
+            from db import journal_store
+            journal_store.replay(directory_path, collection, overlaid)
+        collection.reindex()
+        # stubs changed by the journal are resolved from their loader, not collection.json
+        present = set(map(id, collection.notes))
+        _seed_stubs(collection, [(note, {} if note.id in overlaid else meta) for note, meta in stubs if id(note) in present])
+
+        logging.info(f"Notes collection loaded lazily from '{directory_path}' ({len(collection.notes)} notes)")
+        return collection
+
+    started = perf_counter()
+    collection.notes.extend(n for n in _load_note_files(directory_path, collection_data.get("notes", []), workers) if n is not None)
+    elapsed_ms = (perf_counter() - started) * 1000
+    logging.info(f"Loaded {len(collection.notes)} note files in {elapsed_ms:.1f} ms ({'serial' if workers <= 1 else f'{workers} threads'})")
+
+    if collection.storage == STORAGE_JOURNAL:
+        from db import journal_store
+        journal_store.replay(directory_path, collection)
+    collection.reindex()
+    if use_snapshot and collection.storage != STORAGE_JOURNAL:
+        snapshot.write_snapshot(collection, directory_path)
+
     logging.info(f"Notes collection loaded from '{directory_path}'")
     return collection
\ No newline at end of file
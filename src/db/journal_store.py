@@ -0,0 +1,329 @@
+###
+# File:   src\db\journal_store.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import json
+import logging
+import os
+from functools import partial
+from traceback import format_exc
+from typing import Callable, Optional, Tuple
+from config.config import JOURNAL_COMPACT_BYTES
+from models.notes import NotesCollection, MeetingNote, NOTE_FIELDS, STORAGE_JOURNAL
+
+
+# constants
+JOURNAL_FILENAME = "collection.journal"
+
+# Record types of the journal (one JSON object per line, key "op")
+OP_CREATE = "create"
+OP_UPDATE = "update"
+OP_RENAME = "rename"
+OP_DELETE = "delete"
+OP_COLLECTION = "collection"
+
+# Collection attributes carried by OP_COLLECTION records
+_COLLECTION_KEYS = ("categories", "tags", "locations", "durability")
+
+# Note fields a lazy stub holds in memory (the rest is read by its loader)
+_STUB_FIELDS = ("title", "date", "time")
+
+
+# functions/classes
+def journal_path(collection_path: str) -> str:
+    """Return the path of the journal of a collection folder."""
+    return os.path.join(collection_path, JOURNAL_FILENAME)
+
+
+def _append(collection_path: str, records: list, durability: str) -> int:
+    """Append `records` with a single write; returns the journal size afterwards."""
+    from logic.persistence import _sync_dir, _sync_file
+
+    target = journal_path(collection_path)
+    created = not os.path.exists(target)
+    data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    with open(target, 'a', encoding='utf-8') as f:
+        f.write(data)
+        _sync_file(f, durability)
+        size = f.tell()
+    if created:
+        _sync_dir(collection_path, durability)
+    return size
+
+
+def _collection_record(collection: NotesCollection) -> dict:
+    record = {"op": OP_COLLECTION}
+    for key in _COLLECTION_KEYS:
+        value = getattr(collection, key, None)
+        record[key] = list(value) if isinstance(value, list) else value
+    return record
+
+
+def read_journal(collection_path: str) -> list:
+    """Return the records of a collection's journal.
+
+    A torn last line (crash during an append) is ignored.
+    """
+    target = journal_path(collection_path)
+    if not os.path.exists(target):
+        return []
+
+    records = []
+    with open(target, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logging.warning(f"Ignoring unreadable journal record {lineno} in '{target}'")
+    return records
+
+
+def _overlay(loader: Callable[[], dict], fields: dict) -> dict:
+    """Loader of a stub with a journal delta: its file data with `fields` on top."""
+    data = loader()
+    data.update(fields)
+    return data
+
+
+def replay(collection_path: str, collection: NotesCollection, overlaid: Optional[set] = None) -> int:
+    """Apply the journal on top of a collection loaded from its checkpoint.
+
+    Deltas of lazy stubs are not faulted in: they are layered over the
+    stub's loader, and its title, date and time are updated in place. The
+    ids of those stubs are added to `overlaid` (their collection.json
+    metadata is out of date). The caller reindexes the collection.
+
+    Replay is idempotent: records that were already folded into the JSON
+    files by an interrupted compaction apply cleanly a second time.
+    Returns the number of records applied.
+    """
+    from logic.persistence import _serialize_note_for_write
+
+    records = read_journal(collection_path)
+    if not records:
+        return 0
+
+    position = {note.filename: i for i, note in enumerate(collection.notes)}
+    notes = list(collection.notes)
+    for record in records:
+        op = record.get("op")
+        filename = record.get("filename")
+        if op == OP_UPDATE and "fields" in record:
+            # field-level delta on top of the current state of the note
+            if filename not in position:
+                logging.warning(f"Journal update for unknown note '{filename}' ignored")
+                continue
+            current = notes[position[filename]]
+            fields = record["fields"]
+            if not current.loaded:
+                current.loader = partial(_overlay, current.loader, fields)
+                for name in _STUB_FIELDS:
+                    if name in fields:
+                        setattr(current, name, fields[name])
+                current.content_hash = record.get("hash")
+                if overlaid is not None:
+                    overlaid.add(current.id)
+                continue
+            data = _serialize_note_for_write(current)
+            data.update(fields)
+            note = MeetingNote.from_dict(data)
+            note.category, note.tags = current.category, current.tags
+            note.filename = filename
+            note.content_hash = record.get("hash")
+            notes[position[filename]] = note
+
+        elif op in (OP_CREATE, OP_UPDATE):
+            try:
+                note = MeetingNote.from_dict(record["note"])
+            except Exception as e:
+                logging.error(f"Invalid note in journal record for '{filename}': {e}")
+                continue
+            note.filename = filename
+            note.content_hash = record.get("hash")
+            if filename in position:
+                notes[position[filename]] = note
+            else:
+                position[filename] = len(notes)
+                notes.append(note)
+
+        elif op == OP_RENAME:
+            new_filename = record.get("new_filename")
+            if filename in position and new_filename not in position:
+                i = position.pop(filename)
+                notes[i].filename = new_filename
+                position[new_filename] = i
+
+        elif op == OP_DELETE:
+            if filename in position:
+                notes[position.pop(filename)] = None
+
+        elif op == OP_COLLECTION:
+            for key in _COLLECTION_KEYS:
+                if key in record:
+                    setattr(collection, key, record[key])
+
+    collection.notes = [note for note in notes if note is not None]
+    collection.filenames = {note.id: note.filename for note in collection.notes}
+    logging.info(f"Replayed {len(records)} journal record(s) from '{journal_path(collection_path)}'")
+    return len(records)
+
+
+def save_notes(collection: NotesCollection, collection_path: str, durability: str,
+               progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+    """Append one record per changed dirty note plus the collection attributes.
+
+    New notes are recorded in full, existing ones as a delta of the fields
+    in their change set. The whole save is a single append to the journal.
+    The journal is compacted once it grows past `config.JOURNAL_COMPACT_BYTES`.
+    """
+    from logic.persistence import _encode_note, _serialize_note_for_write, note_filename
+
+    try:
+        dirty = [note for note in collection.notes if note.dirty]
+        # edit counts before any note is encoded: notes edited meanwhile stay dirty
+        edits = {id(note): note.edits for note in dirty}
+        records = []
+        hashes = []
+        for done, note in enumerate(dirty):
+            if progress:
+                progress(done, len(dirty))
+            if not note.changes:
+                continue
+            _text, digest = _encode_note(note)
+            if digest == note.content_hash:
+                continue
+            filename = note_filename(note)
+            data = _serialize_note_for_write(note)
+            if note.filename:
+                fields = {name: data[name] for name in sorted(note.changes) if name in data}
+                records.append({"op": OP_UPDATE, "filename": filename, "hash": digest, "fields": fields})
+            else:
+                records.append({"op": OP_CREATE, "filename": filename, "hash": digest, "note": data})
+            hashes.append((note, filename, digest))
+
+        records.append(_collection_record(collection))
+        size = _append(collection_path, records, durability)
+
+        for note, filename, digest in hashes:
+            note.filename = filename
+            note.content_hash = digest
+            collection.filenames[note.id] = filename
+        for note in dirty:
+            note.clear_dirty(edits[id(note)])
+        if progress:
+            progress(len(dirty), len(dirty))
+
+        msg = f"Appended {len(hashes)} note record(s) to {journal_path(collection_path)} ({size} bytes)"
+        if size > JOURNAL_COMPACT_BYTES:
+            ok, cmsg = compact(collection, collection_path)
+            msg += f"; {cmsg}"
+        logging.info(msg)
+        return True, msg
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to append to journal: {e}\n{tb}"
+
+
+def update_meta(collection: NotesCollection, collection_path: str, durability: str) -> Tuple[bool, str]:
+    """Record the collection attributes (categories, tags, locations)."""
+    try:
+        _append(collection_path, [_collection_record(collection)], durability)
+        return True, f"Collection attributes appended to {journal_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to update collection attributes: {e}\n{tb}"
+
+
+def rename_note(collection: NotesCollection, collection_path: str, old_filename: str, new_filename: str,
+                durability: str) -> Tuple[bool, str]:
+    """Record that a note file was renamed; the files move on compaction.
+
+    Fails like the JSON rename if another note already uses `new_filename`.
+    """
+    try:
+        taken = set(collection.filenames.values())
+        taken.update(note.filename for note in collection.notes if note.filename and note.filename != old_filename)
+        if new_filename != old_filename and new_filename in taken:
+            return False, f"Target file already exists: {new_filename}"
+        _append(collection_path, [{"op": OP_RENAME, "filename": old_filename, "new_filename": new_filename}], durability)
+        return True, os.path.join(collection_path, new_filename)
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to rename note: {e}\n{tb}"
+
+
+def delete_note(collection_path: str, filename: str, durability: str) -> Tuple[bool, str]:
+    """Record that a note was deleted; its file is removed on compaction."""
+    try:
+        _append(collection_path, [{"op": OP_DELETE, "filename": filename}], durability)
+        return True, f"Deleted note {filename}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to delete note: {e}\n{tb}"
+
+
+def compact(collection: NotesCollection, collection_path: str) -> Tuple[bool, str]:
+    """Fold the journal into fresh note files and collection.json, then truncate it.
+
+    Only notes named in the journal are rewritten (group-committed by the
+    JSON batch writer: everything is staged before any file is swapped);
+    files of deleted or renamed-away notes are removed afterwards. If
+    anything fails the journal is kept, and a crash before it is truncated
+    is harmless: the next load simply replays it again.
+    """
+    from logic.persistence import _save_notes_batch
+
+    try:
+        records = read_journal(collection_path)
+        touched = set()
+        for record in records:
+            touched.add(record.get("filename"))
+            touched.add(record.get("new_filename"))
+
+        current = {note.filename for note in collection.notes}
+        for note in collection.notes:
+            if note.filename in touched:
+                note.content_hash = None
+                note.dirty = True
+                note.changes = note.changes | set(NOTE_FIELDS)
+        collection.content_hash = None
+
+        ok, msg = _save_notes_batch(collection, collection_path)
+        if not ok:
+            return False, f"Compaction failed: {msg}"
+
+        for filename in touched - current - {None}:
+            stale = os.path.join(collection_path, filename)
+            if os.path.exists(stale):
+                os.remove(stale)
+
+        open(journal_path(collection_path), 'w').close()
+        return True, f"Compacted {len(records)} journal record(s)"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to compact journal: {e}\n{tb}"
+
+
+def enable_journal(collection_path: str) -> Tuple[bool, str]:
+    """Switch a JSON collection to journal storage (its files become the checkpoint)."""
+    json_filepath = os.path.join(collection_path, "collection.json")
+    try:
+        with open(json_filepath, 'r', encoding='utf-8') as f:
+            collection_data = json.load(f)
+        if collection_data.get("storage") == STORAGE_JOURNAL:
+            return True, f"Collection at {collection_path} already uses journal storage"
+
+        collection_data["storage"] = STORAGE_JOURNAL
+        tmp_json = json_filepath + '.tmp'
+        with open(tmp_json, 'w', encoding='utf-8') as f:
+            json.dump(collection_data, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_json, json_filepath)
+        return True, f"Collection at {collection_path} now uses journal storage"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to enable journal storage: {e}\n{tb}"
@@ -0,0 +1,124 @@
+###
+# File:   src\db\search_cache.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import json
+import logging
+import os
+from itertools import chain
+from typing import Optional
+
+
+# constants
+SEARCH_CACHE_FILENAME = "collection.search"
+
+# Bump when the layout of the persisted index state changes incompatibly
+SEARCH_CACHE_VERSION = 4
+
+# Keys of a persisted index state (see logic.search.SearchIndex.save)
+_STATE_KEYS = ("postings", "terms", "lengths", "spans", "names", "manifest")
+
+
+# functions/classes
+def search_cache_path(collection_path: str) -> str:
+    """Return the path of the persisted search index of a collection folder."""
+    return os.path.join(collection_path, SEARCH_CACHE_FILENAME)
+
+
+def write_search_cache(state: dict, collection_path: str) -> bool:
+    """Write the state of a search index next to collection.json as plain JSON.
+
+    The file is a cache: it is written without fsync and any failure is
+    only logged.
+    """
+    target = search_cache_path(collection_path)
+    tmp = target + '.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"version": SEARCH_CACHE_VERSION, "state": state}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, target)
+        return True
+    except Exception as e:
+        logging.warning(f"Could not write search index '{target}': {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+
+
+def _optional_str(value) -> bool:
+    return value is None or isinstance(value, str)
+
+
+def _decode_state(state) -> Optional[dict]:
+    """Check the structure of a decoded index state and restore its tuples; None if malformed."""
+    if not isinstance(state, dict) or not all(isinstance(state.get(key), dict) for key in _STATE_KEYS):
+        return None
+
+    postings = state["postings"]
+    for docs in postings.values():
+        if type(docs) is not dict or not all(type(positions) is list for positions in docs.values()):
+            return None
+        # one pass over all positions of the term: only ints allowed
+        if not set(map(type, chain.from_iterable(docs.values()))) <= {int}:
+            return None
+
+    terms = {}
+    for note_id, note_terms in state["terms"].items():
+        if not isinstance(note_terms, list) or not all(isinstance(t, str) for t in note_terms):
+            return None
+        terms[note_id] = tuple(note_terms)
+
+    for key in ("lengths", "spans"):
+        if not all(isinstance(v, int) for v in state[key].values()):
+            return None
+
+    names = {}
+    for note_id, entry in state["names"].items():
+        if not (isinstance(entry, list) and len(entry) == 3 and _optional_str(entry[0]) and _optional_str(entry[1])
+                and isinstance(entry[2], list) and all(isinstance(p, str) for p in entry[2])):
+            return None
+        names[note_id] = (entry[0], entry[1], tuple(entry[2]))
+
+    manifest = {}
+    for note_id, entry in state["manifest"].items():
+        if not (isinstance(entry, list) and len(entry) == 3 and _optional_str(entry[0]) and _optional_str(entry[2])):
+            return None
+        stamp = entry[1]
+        if stamp is not None:
+            if not (isinstance(stamp, list) and len(stamp) == 2 and all(isinstance(v, int) for v in stamp)):
+                return None
+            stamp = tuple(stamp)
+        manifest[note_id] = (entry[0], stamp, entry[2])
+
+    return {"postings": postings, "terms": terms, "lengths": state["lengths"], "spans": state["spans"],
+            "names": names, "manifest": manifest}
+
+
+def read_search_cache(collection_path: str) -> Optional[dict]:
+    """Return the persisted search index state of a collection.
+
+    Returns None when there is none, or it is unreadable (corrupt, torn),
+    malformed or of another version.
+    """
+    target = search_cache_path(collection_path)
+    if not os.path.exists(target):
+        return None
+
+    try:
+        with open(target, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable search index '{target}': {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != SEARCH_CACHE_VERSION:
+        logging.info(f"Ignoring outdated search index '{target}'")
+        return None
+
+    state = _decode_state(data.get("state"))
+    if state is None:
+        logging.warning(f"Ignoring malformed search index '{target}'")
+    return state
@@ -0,0 +1,197 @@
+###
+# File:   src\db\snapshot.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import json
+import logging
+import os
+from typing import Optional, Tuple
+from models.notes import MeetingNote, NotesCollection, STORAGE_JSON
+from models.todos import open_todo_items
+
+
+# constants
+SNAPSHOT_FILENAME = "collection.snapshot"
+
+# Bump when the snapshot layout changes incompatibly
+SNAPSHOT_VERSION = 4
+
+# Collection attributes stored in a snapshot (collection.json keys)
+_COLLECTION_KEYS = ("collection_name", "created_at", "updated_at", "categories", "tags", "locations",
+                    "storage", "filenames", "durability", "content_hash")
+
+
+# functions/classes
+def snapshot_path(collection_path: str) -> str:
+    """Return the path of the snapshot cache of a collection folder."""
+    return os.path.join(collection_path, SNAPSHOT_FILENAME)
+
+
+def file_stamp(filepath: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _stamp(value) -> Optional[Tuple[int, int]]:
+    """Return a stored (mtime_ns, size) stamp as a tuple; None if absent or malformed."""
+    if isinstance(value, list) and len(value) == 2 and all(isinstance(v, int) for v in value):
+        return value[0], value[1]
+    return None
+
+
+def _note_data(note: MeetingNote) -> dict:
+    """Return every persisted field of a loaded note, plus its id."""
+    return {
+        "id": note.id, "title": note.title, "category": note.category, "tags": list(note.tags or []),
+        "topic": note.topic, "date": note.date, "time": note.time, "location": note.location,
+        "participants": list(note.participants or []), "notes": note.notes, "todos": list(note.todos or []),
+        "created_at": note.created_at, "updated_at": note.updated_at,
+    }
+
+
+def _persisted_metadata(collection_path: str) -> dict:
+    """Return the note entries of the saved collection.json by file name."""
+    try:
+        with open(os.path.join(collection_path, "collection.json"), 'r', encoding='utf-8') as f:
+            notes_meta = json.load(f).get("notes", [])
+    except Exception as e:
+        logging.warning(f"Could not read collection.json of '{collection_path}' for the snapshot: {e}")
+        return {}
+    return {meta["filename"]: meta for meta in notes_meta if isinstance(meta, dict) and meta.get("filename")}
+
+
+def write_snapshot(collection: NotesCollection, collection_path: str) -> bool:
+    """Write the loaded collection next to collection.json as plain JSON.
+
+    Each note is stored with the (mtime, size) stamp of its file. Notes that
+    are not loaded are stored as metadata only and will be read from their
+    files again; dirty notes are stored with the metadata last saved to
+    collection.json, so unsaved edits are not restored. Only JSON storage collections are
+    snapshotted. The snapshot is a cache, written when a collection is
+    opened or closed rather than on every save: it is written without
+    fsync and any failure is only logged.
+    """
+    if collection.storage != STORAGE_JSON:
+        return False
+
+    persisted = _persisted_metadata(collection_path) if any(note.dirty for note in collection.notes) else {}
+    entries = []
+    for note in collection.notes:
+        if note.dirty:
+            # unsaved edits (discarded on close) must not come back: store
+            # the last saved metadata; notes never saved are left out
+            meta = persisted.get(note.filename) if note.filename else None
+            if meta is not None:
+                entries.append({"filename": note.filename, "meta": meta})
+            continue
+        stamp = file_stamp(os.path.join(collection_path, note.filename)) if note.filename else None
+        if note.loaded and stamp is not None:
+            entries.append({"filename": note.filename, "stamp": list(stamp), "hash": note.content_hash,
+                            "note": _note_data(note)})
+        else:
+            entries.append({"filename": note.filename, "meta": {
+                "id": note.id, "title": note.title, "date": note.date, "time": note.time,
+                "filename": note.filename, "hash": note.content_hash,
+                "open_todos": collection.columns.open_todo_count(note.id),
+                "open_todo_items": open_todo_items(collection, note),
+                **collection.name_metadata(note)}})
+
+    head = {
+        "collection_name": collection.name, "created_at": collection.created_at, "updated_at": collection.updated_at,
+        "categories": list(collection.categories), "tags": list(collection.tags),
+        "locations": list(collection.locations), "storage": collection.storage,
+        "filenames": dict(collection.filenames), "durability": collection.durability,
+        "content_hash": collection.content_hash,
+    }
+    index = file_stamp(os.path.join(collection_path, "collection.json"))
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "index": list(index) if index else None,
+        "collection": head,
+        "notes": entries,
+    }
+
+    target = snapshot_path(collection_path)
+    tmp = target + '.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, target)
+        return True
+    except Exception as e:
+        logging.warning(f"Could not write snapshot '{target}': {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return False
+
+
+def _valid(data) -> bool:
+    """True if a decoded snapshot has the expected structure."""
+    if not isinstance(data, dict) or not isinstance(data.get("collection"), dict) or not isinstance(data.get("notes"), list):
+        return False
+    head = data["collection"]
+    if not all(isinstance(key, str) for key in head) or not isinstance(head.get("filenames", {}), dict):
+        return False
+    for entry in data["notes"]:
+        if not isinstance(entry, dict) or not isinstance(entry.get("filename"), (str, type(None))):
+            return False
+        if not isinstance(entry.get("note"), dict) and not isinstance(entry.get("meta"), dict):
+            return False
+    return True
+
+
+def read_snapshot(collection_path: str) -> Optional[dict]:
+    """Return the snapshot of a collection if it matches the current collection.json.
+
+    The result holds the NotesCollection under "collection" (without notes)
+    and (filename, stamp, note, meta) tuples under "notes": a loaded
+    MeetingNote with its file stamp, or the collection.json metadata of a
+    note to read again. Returns None when there is no snapshot, it is
+    unreadable or malformed, of another version, or collection.json
+    changed since it was written. Only JSON storage collections are
+    snapshotted.
+    """
+    target = snapshot_path(collection_path)
+    if not os.path.exists(target):
+        return None
+
+    try:
+        with open(target, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable snapshot '{target}': {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        logging.info(f"Ignoring outdated snapshot '{target}'")
+        return None
+    if not _valid(data) or data["collection"].get("storage", STORAGE_JSON) != STORAGE_JSON:
+        logging.warning(f"Ignoring malformed snapshot '{target}'")
+        return None
+
+    if _stamp(data.get("index")) != file_stamp(os.path.join(collection_path, "collection.json")):
+        logging.info(f"Ignoring stale snapshot '{target}' (collection.json changed)")
+        return None
+
+    try:
+        collection = NotesCollection.from_dict({key: data["collection"].get(key) for key in _COLLECTION_KEYS})
+        notes = []
+        for entry in data["notes"]:
+            note = None
+            if isinstance(entry.get("note"), dict):
+                note = MeetingNote.from_dict(entry["note"])
+                note.filename = entry["filename"]
+                note.content_hash = entry.get("hash")
+            notes.append((entry["filename"], _stamp(entry.get("stamp")), note, entry.get("meta")))
+    except (TypeError, ValueError) as e:
+        logging.warning(f"Ignoring malformed snapshot '{target}': {e}")
+        return None
+
+    return {"version": data["version"], "collection": collection, "notes": notes}
@@ -0,0 +1,289 @@
+###
+# File:   src\db\sqlite_store.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import json
+import logging
+import sqlite3
+from contextlib import closing
+from os import path, replace
+from traceback import format_exc
+from typing import Callable, Optional, Tuple
+from models.notes import NotesCollection, MeetingNote, STORAGE_SQLITE
+
+
+# constants
+DB_FILENAME = "collection.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notes (
+    filename TEXT PRIMARY KEY,
+    id TEXT,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    category TEXT,
+    tags TEXT,
+    topic TEXT,
+    date TEXT,
+    time TEXT,
+    location TEXT,
+    participants TEXT,
+    notes TEXT,
+    todos TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS notes_position ON notes (position);
+"""
+
+_UPSERT_NOTE = """
+INSERT INTO notes (filename, id, position, title, category, tags, topic, date, time, location,
+                   participants, notes, todos, created_at, updated_at)
+VALUES (:filename, :id, :position, :title, :category, :tags, :topic, :date, :time, :location,
+        :participants, :notes, :todos, :created_at, :updated_at)
+ON CONFLICT (filename) DO UPDATE SET
+    id = excluded.id, position = excluded.position, title = excluded.title, category = excluded.category,
+    tags = excluded.tags, topic = excluded.topic, date = excluded.date, time = excluded.time,
+    location = excluded.location, participants = excluded.participants, notes = excluded.notes,
+    todos = excluded.todos, created_at = excluded.created_at, updated_at = excluded.updated_at
+"""
+
+# Columns of `notes` that can be updated on their own (field-level deltas)
+_NOTE_COLUMNS = ("title", "category", "tags", "topic", "date", "time", "location",
+                 "participants", "notes", "todos", "created_at", "updated_at")
+
+# PRAGMA synchronous per durability level (see logic.persistence)
+_SYNCHRONOUS = {"none": "OFF", "file": "NORMAL", "file+dir": "FULL"}
+
+# Collection attributes kept in the meta table
+_META_KEYS = ("categories", "tags", "locations")
+
+
+# functions/classes
+def db_path(collection_path: str) -> str:
+    """Return the path of the SQLite database of a collection folder."""
+    return path.join(collection_path, DB_FILENAME)
+
+
+def connect(collection_path: str, durability: str = "file+dir") -> sqlite3.Connection:
+    """Open (and create if needed) the collection database in WAL mode.
+
+    `durability` selects how often SQLite syncs ("none", "file", "file+dir").
+    """
+    conn = sqlite3.connect(db_path(collection_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(f"PRAGMA synchronous={_SYNCHRONOUS.get(durability, 'FULL')}")
+    conn.executescript(_SCHEMA)
+    # databases created before note ids existed
+    if "id" not in {row["name"] for row in conn.execute("PRAGMA table_info(notes)")}:
+        conn.execute("ALTER TABLE notes ADD COLUMN id TEXT")
+    return conn
+
+
+def _note_row(note: MeetingNote, filename: str, position: int) -> dict:
+    """Return the row values of a note for the `notes` table."""
+    from logic.persistence import _serialize_note_for_write
+
+    data = _serialize_note_for_write(note)
+    return {
+        "filename": filename,
+        "id": note.id,
+        "position": position,
+        "title": data["title"],
+        "category": getattr(note, "category", "") or "",
+        "tags": json.dumps(list(getattr(note, "tags", []) or []), ensure_ascii=False),
+        "topic": data["topic"],
+        "date": data["date"],
+        "time": data["time"],
+        "location": data["location"],
+        "participants": json.dumps(data["participants"], ensure_ascii=False),
+        "notes": json.dumps(data["notes"], ensure_ascii=False),
+        "todos": json.dumps(data["todos"], ensure_ascii=False),
+        "created_at": data["created_at"],
+        "updated_at": data["updated_at"],
+    }
+
+
+def _note_from_row(row: sqlite3.Row) -> MeetingNote:
+    """Build a MeetingNote from a `notes` row."""
+    note = MeetingNote.from_dict({
+        "title": row["title"],
+        "category": row["category"] or "",
+        "tags": json.loads(row["tags"] or "[]"),
+        "topic": row["topic"],
+        "date": row["date"],
+        "time": row["time"],
+        "location": row["location"],
+        "participants": json.loads(row["participants"] or "[]"),
+        "notes": json.loads(row["notes"] or "[]"),
+        "todos": json.loads(row["todos"] or "[]"),
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+    })
+    note.filename = row["filename"]
+    if row["id"]:
+        note.id = row["id"]
+    return note
+
+
+def _write_meta(conn: sqlite3.Connection, collection: NotesCollection) -> None:
+    """Store the collection attributes in the meta table, skipping unchanged values."""
+    current = {r["key"]: r["value"] for r in conn.execute("SELECT key, value FROM meta")}
+    for key in _META_KEYS:
+        value = json.dumps(list(getattr(collection, key, []) or []), ensure_ascii=False)
+        if current.get(key) != value:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+def load_notes_collection(collection_path: str, collection: NotesCollection) -> NotesCollection | None:
+    """Fill `collection` (built from collection.json) with the notes stored in its database."""
+    try:
+        with closing(connect(collection_path)) as conn:
+            for row in conn.execute("SELECT key, value FROM meta"):
+                if row["key"] in _META_KEYS:
+                    setattr(collection, row["key"], json.loads(row["value"]))
+
+            for row in conn.execute("SELECT * FROM notes ORDER BY position, filename"):
+                try:
+                    collection.notes.append(_note_from_row(row))
+                except Exception as e:
+                    logging.error(f"Invalid note row '{row['filename']}' in '{db_path(collection_path)}': {e}")
+                    continue
+
+    except Exception as e:
+        logging.exception(f"Failed to load collection database '{db_path(collection_path)}': {e}")
+        return None
+
+    collection.reindex()
+    logging.info(f"Notes collection loaded from '{db_path(collection_path)}'")
+    return collection
+
+
+def save_notes(collection: NotesCollection, collection_path: str, durability: str = "file+dir",
+               progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+    """Upsert the dirty notes and the collection attributes in a single transaction.
+
+    Stored notes only get their changed columns updated; notes with an empty
+    change set are skipped. `progress(done, total)` is called as the rows
+    are written.
+    """
+    from logic.persistence import note_filename
+
+    try:
+        dirty = [(pos, note) for pos, note in enumerate(collection.notes) if note.dirty]
+        # edit counts before any note is encoded: notes edited meanwhile stay dirty
+        edits = {id(note): note.edits for _pos, note in dirty}
+        with closing(connect(collection_path, durability)) as conn:
+            with conn:
+                for done, (pos, note) in enumerate(dirty):
+                    if progress:
+                        progress(done, len(dirty))
+                    if not note.changes:
+                        continue
+                    row = _note_row(note, note_filename(note), pos)
+                    columns = [name for name in _NOTE_COLUMNS if name in note.changes]
+                    if note.filename and columns:
+                        sets = ", ".join(f"{name} = :{name}" for name in columns)
+                        if conn.execute(f"UPDATE notes SET {sets} WHERE filename = :filename", row).rowcount:
+                            continue
+                    conn.execute(_UPSERT_NOTE, row)
+                _write_meta(conn, collection)
+
+        for _pos, note in dirty:
+            note.filename = note_filename(note)
+            note.clear_dirty(edits[id(note)])
+        if progress:
+            progress(len(dirty), len(dirty))
+
+        return True, f"Saved {len(dirty)} note(s) to {db_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to save notes to database: {e}\n{tb}"
+
+
+def update_meta(collection: NotesCollection, collection_path: str) -> Tuple[bool, str]:
+    """Persist the collection attributes (categories, tags, locations) only."""
+    try:
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                _write_meta(conn, collection)
+        return True, f"Collection attributes updated in {db_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to update collection attributes: {e}\n{tb}"
+
+
+def rename_note(collection_path: str, old_filename: str, new_filename: str) -> Tuple[bool, str]:
+    """Re-key a stored note from `old_filename` to `new_filename`."""
+    try:
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                if conn.execute("SELECT 1 FROM notes WHERE filename = ?", (new_filename,)).fetchone():
+                    return False, f"Target note already exists: {new_filename}"
+                cur = conn.execute("UPDATE notes SET filename = ? WHERE filename = ?", (new_filename, old_filename))
+                if cur.rowcount == 0:
+                    return False, f"Note does not exist: {old_filename}"
+        return True, new_filename
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to rename note: {e}\n{tb}"
+
+
+def delete_note(collection_path: str, filename: str) -> Tuple[bool, str]:
+    """Delete a stored note."""
+    try:
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                conn.execute("DELETE FROM notes WHERE filename = ?", (filename,))
+        return True, f"Deleted note {filename}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to delete note: {e}\n{tb}"
+
+
+def convert_json_collection(collection_path: str) -> Tuple[bool, str]:
+    """Convert a directory-of-JSON-files collection to SQLite storage.
+
+    All notes are copied into `collection.db` in one transaction, then
+    collection.json is switched to `"storage": "sqlite"`. The note files are
+    left in place so the conversion can be undone by editing collection.json.
+    """
+    from db.handler import load_notes_collection as load_json_collection
+
+    json_filepath = path.join(collection_path, "collection.json")
+    try:
+        with open(json_filepath, 'r', encoding='utf-8') as f:
+            collection_data = json.load(f)
+        if collection_data.get("storage") == STORAGE_SQLITE:
+            return True, f"Collection at {collection_path} already uses SQLite storage"
+
+        collection = load_json_collection(collection_path, use_snapshot=False)
+        if collection is None:
+            return False, f"Could not load collection at {collection_path}"
+
+        from logic.persistence import note_filename
+
+        with closing(connect(collection_path)) as conn:
+            with conn:
+                for pos, note in enumerate(collection.notes):
+                    conn.execute(_UPSERT_NOTE, _note_row(note, note_filename(note), pos))
+                _write_meta(conn, collection)
+
+        collection_data["storage"] = STORAGE_SQLITE
+        tmp_json = json_filepath + '.tmp'
+        with open(tmp_json, 'w', encoding='utf-8') as f:
+            json.dump(collection_data, f, indent=4, ensure_ascii=False)
+        replace(tmp_json, json_filepath)
+
+        return True, f"Converted {len(collection.notes)} note(s) into {db_path(collection_path)}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to convert collection: {e}\n{tb}"
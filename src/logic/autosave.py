@@ -0,0 +1,155 @@
+###
+# File:   src\logic\autosave.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+
+# imports
+import logging
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Callable, Optional
+from logic.pattern.observer import Observable
+from logic.persistence import save_notes
+from models.notes import MeetingNote, NotesCollection, NOTE_DIRTY
+
+
+# constants
+
+
+# variables
+_worker: Optional["AutosaveWorker"] = None
+
+
+# functions/classes
+class AutosaveWorker(Thread):
+    """Write-behind saver for the open collection.
+
+    Every `MeetingNote.mark_dirty` restarts a quiet period; once no edit has
+    come in for `delay` seconds the dirty notes are flushed with `save_notes`
+    on this thread, so a burst of edits costs a single save and the UI thread
+    never waits on disk. `on_status(text)` receives progress and failures,
+    `on_saved()` is called after a flush that left nothing pending.
+    """
+
+    def __init__(self, collection: NotesCollection, data_root: str, delay: float,
+                 on_status: Callable[[str], None] = None, on_saved: Callable[[], None] = None) -> None:
+        super().__init__(name="autosave", daemon=True)
+        self.collection = collection
+        self.data_root = data_root
+        self.delay = delay
+        self.on_status = on_status
+        self.on_saved = on_saved
+        self._wakeup = Event()
+        self._stopped = Event()
+        self._lock = Lock()
+        self._last_change = 0.0
+        self._touched = {}
+
+    def note_dirty(self, note: MeetingNote, fields: set) -> None:
+        """Record an edit; called on the thread that marked the note dirty."""
+        with self._lock:
+            self._last_change = monotonic()
+            self._touched.setdefault(id(note), set()).update(fields)
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop the worker; pending edits stay dirty for an explicit save."""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            # debounce: wait until the last edit is `delay` seconds old
+            while not self._stopped.is_set():
+                with self._lock:
+                    remaining = self._last_change + self.delay - monotonic()
+                if remaining <= 0:
+                    break
+                self._stopped.wait(remaining)
+
+            if not self._stopped.is_set():
+                self.flush()
+
+    def flush(self) -> None:
+        """Save the dirty notes now and report the outcome."""
+        with self._lock:
+            self._touched = {}
+
+        pending = sum(1 for note in self.collection.notes if note.dirty)
+        if not pending:
+            return
+
+        self._report(f"Autosaving {pending} note(s)...")
+        ok, msg = save_notes(self.collection, self.data_root)
+
+        # notes edited while the save ran may have been written with older
+        # content and had their dirty flag cleared: keep them dirty
+        with self._lock:
+            touched = self._touched
+        if touched:
+            for note in self.collection.notes:
+                if id(note) in touched:
+                    note.dirty = True
+                    note.changes = note.changes | touched[id(note)]
+            self._wakeup.set()
+
+        if not ok:
+            logging.error(f"Autosave failed: {msg}")
+            self._report(f"Autosave failed: {msg.splitlines()[0]}")
+            return
+
+        logging.debug(f"Autosave: {msg}")
+        self._report(f"Autosaved {pending} note(s)")
+        if not touched and self.on_saved:
+            try:
+                self.on_saved()
+            except Exception:
+                logging.exception("Autosave: on_saved callback failed")
+
+    def _report(self, text: str) -> None:
+        if not self.on_status:
+            return
+        try:
+            self.on_status(text)
+        except Exception:
+            logging.exception("Autosave: status callback failed")
+
+
+def _on_note_dirty(name: str, note: MeetingNote, fields: set) -> None:
+    """NOTE_DIRTY observer: forward the edit to the running worker."""
+    if _worker is not None:
+        _worker.note_dirty(note, fields)
+
+
+def start(collection: NotesCollection, data_root: str, delay: float,
+          on_status: Callable[[str], None] = None, on_saved: Callable[[], None] = None) -> Optional[AutosaveWorker]:
+    """Start autosaving `collection`, replacing any running worker. A delay <= 0 disables autosave."""
+    global _worker
+
+    stop()
+    if not collection or delay <= 0:
+        return None
+
+    _worker = AutosaveWorker(collection, data_root, delay, on_status, on_saved)
+    _worker.start()
+    logging.info(f"Autosave started (quiet period {delay:g} s)")
+    return _worker
+
+
+def stop() -> None:
+    """Stop the running worker, if any."""
+    global _worker
+
+    if _worker is None:
+        return
+    _worker.stop()
+    _worker = None
+    logging.info("Autosave stopped")
+
+
+Observable(NOTE_DIRTY).register(_on_note_dirty)
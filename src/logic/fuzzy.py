@@ -0,0 +1,182 @@
+###
+# File:   src\logic\fuzzy.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+
+# imports
+import re
+import unicodedata
+from heapq import nlargest
+from math import ceil
+from threading import Lock
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+# constants
+# Default minimum similarity of a fuzzy match
+FUZZY_THRESHOLD = 0.3
+
+_WORD_RE = re.compile(r"\w+")
+_NO_ENTRIES: Set[int] = frozenset()
+
+# Similarity levels tried by TrigramIndex.search before its threshold
+_LEVELS = (0.9, 0.8, 0.7, 0.6, 0.5, 0.4)
+
+
+# functions/classes
+def fold(text: str) -> str:
+    """Case- and accent-fold text for indexing and querying."""
+    text = text.casefold()
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return text
+
+
+def trigrams(text: str) -> frozenset:
+    """Return the trigrams of a text.
+
+    Each word is folded and padded with two blanks in front and one
+    behind ("  al", " ale", ..., "ex "), so short words and word starts
+    still produce trigrams.
+    """
+    grams = set()
+    for word in _WORD_RE.findall(fold(text or "")):
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return frozenset(grams)
+
+
+def similarity(a: str, b: str) -> float:
+    """Trigram similarity (Jaccard) of two texts, 0.0 .. 1.0."""
+    ga, gb = trigrams(a), trigrams(b)
+    if not ga or not gb:
+        return 0.0
+    shared = len(ga & gb)
+    return shared / (len(ga) + len(gb) - shared)
+
+
+class TrigramIndex:
+    """Fuzzy lookup of short texts (titles, topics, names) by trigram similarity.
+
+    Every distinct text is stored once with the set of owners (e.g. note
+    ids) it was added for. `search` ranks texts by the Jaccard similarity of
+    their trigrams to the query, or with `partial=True` by the share of the
+    query's trigrams they contain (the query may be part of a longer text).
+    Candidates are only collected from the postings of the rarest query
+    trigrams (any text reaching a similarity level must contain one of
+    them), starting at a strict level, which keeps top-k lookups in the
+    millisecond range for tens of thousands of texts. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, texts: Iterable[str] = ()) -> None:
+        self._ids: Dict[str, int] = {}
+        self._texts: List[Optional[str]] = []
+        self._grams: List[frozenset] = []
+        self._owners: List[Set[Hashable]] = []
+        self._free: List[int] = []
+        self._postings: Dict[str, Set[int]] = {}
+        self._lock = Lock()
+        for text in texts:
+            self.add(text)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._ids
+
+    def add(self, text: str, owner: Hashable = None) -> None:
+        """Add a text (for `owner`, if given)."""
+        if not text:
+            return
+        with self._lock:
+            tid = self._ids.get(text)
+            if tid is None:
+                grams = trigrams(text)
+                if not grams:
+                    return
+                if self._free:
+                    tid = self._free.pop()
+                    self._texts[tid], self._grams[tid], self._owners[tid] = text, grams, set()
+                else:
+                    tid = len(self._texts)
+                    self._texts.append(text)
+                    self._grams.append(grams)
+                    self._owners.append(set())
+                self._ids[text] = tid
+                for gram in grams:
+                    self._postings.setdefault(gram, set()).add(tid)
+            if owner is not None:
+                self._owners[tid].add(owner)
+
+    def remove(self, text: str, owner: Hashable = None) -> None:
+        """Remove a text; with `owner` only that owner, dropping the text when it has none left."""
+        with self._lock:
+            tid = self._ids.get(text)
+            if tid is None:
+                return
+            owners = self._owners[tid]
+            if owner is not None:
+                owners.discard(owner)
+                if owners:
+                    return
+            del self._ids[text]
+            for gram in self._grams[tid]:
+                postings = self._postings[gram]
+                postings.discard(tid)
+                if not postings:
+                    del self._postings[gram]
+            self._texts[tid], self._grams[tid], self._owners[tid] = None, frozenset(), set()
+            self._free.append(tid)
+
+    def owners(self, text: str) -> Set[Hashable]:
+        """Return the owners a text was added for."""
+        tid = self._ids.get(text)
+        return set(self._owners[tid]) if tid is not None else set()
+
+    def search(self, query: str, k: int = 10, threshold: float = FUZZY_THRESHOLD,
+               partial: bool = False) -> List[Tuple[str, float]]:
+        """Return up to `k` (text, similarity) pairs with similarity >= `threshold`, best first."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+        size = len(grams)
+
+        # Try strict levels first: their candidate sets come from fewer,
+        # rarer postings. Once a level yields k results the top k are final,
+        # since every text scoring at least that level is among its candidates.
+        levels = [level for level in _LEVELS if level > threshold] + [threshold]
+        seen: Dict[int, tuple] = {}
+        with self._lock:
+            lists = sorted((self._postings.get(gram, _NO_ENTRIES) for gram in grams), key=len)
+            grams_of, texts = self._grams, self._texts
+            scanned = 0
+            for level in levels:
+                needed = max(1, ceil(level * size))
+                upto = size - needed + 1
+                fresh = set().union(*lists[scanned:upto]).difference(seen) if upto > scanned else ()
+                scanned = max(scanned, upto)
+                for tid in fresh:
+                    other = grams_of[tid]
+                    shared = len(grams & other)
+                    jaccard = shared / (size + len(other) - shared)
+                    # ties (e.g. partial matches) go to the closer, shorter text
+                    seen[tid] = (shared / size if partial else jaccard, jaccard, texts[tid])
+
+                scored = [entry for entry in seen.values() if entry[0] >= level]
+                if len(scored) >= k:
+                    break
+
+        return [(text, score) for score, _jaccard, text in nlargest(k, scored)]
+
+    def search_owners(self, query: str, k: int = 10, threshold: float = FUZZY_THRESHOLD,
+                      partial: bool = False) -> Set[Hashable]:
+        """Return the owners of the texts `search` finds."""
+        found = set()
+        for text, _score in self.search(query, k, threshold, partial):
+            found |= self.owners(text)
+        return found
@@ -8,14 +8,21 @@ import re
 import json
 import logging
 import unicodedata
-from os import path, rename, remove, makedirs, listdir, fsync, replace, getcwd
+from hashlib import sha256
+from os import path, rename, remove, makedirs, fsync, replace, getcwd, close, O_RDONLY
+from os import open as os_open
+from threading import RLock
+from time import perf_counter
 from datetime import datetime, timezone
 from traceback import format_exc
 from pathlib import Path
-from typing import Tuple, Optional
-from db import registry
-from config.config import DATA_ROOT
-from models.notes import NotesCollection, MeetingNote
+from typing import Callable, Tuple, Optional
+from db import registry, snapshot
+from logic.pattern.observer import Observable
+from config.config import DATA_ROOT, DURABILITY, SNAPSHOT_CACHE
+from models.columns import count_open_todos
+from models.todos import open_todo_items
+from models.notes import NotesCollection, MeetingNote, STORAGE_JOURNAL, STORAGE_SQLITE
 from datetime import datetime
 
 def slugify(text: str) -> str:
@@ -42,15 +49,188 @@ def slugify(text: str) -> str:
     return text
 
 
+def note_filename(note: MeetingNote) -> str:
+    """Return the file name (storage key) a note is saved under.
+
+    Notes keep the file they were loaded from or last saved to; new notes
+    get a name derived from their title.
+    """
+    if getattr(note, 'filename', None):
+        return note.filename
+
+    base_filename = slugify(getattr(note, 'title', 'note')) or 'note'
+    return f"{base_filename}.json"
+
+
+def _notes_metadata(collection: NotesCollection) -> list:
+    """Build the collection.json note entries and rebuild the note id -> filename index.
+
+    File names come from the collection's persistent index, so no directory
+    listing or existence check is needed.
+    """
+    filenames = {}
+    notes_metadata = []
+    for note in collection.notes:
+        title = getattr(note, 'title', '')
+        filename = getattr(note, 'filename', None) or collection.filenames.get(note.id) or note_filename(note)
+        filenames[note.id] = filename
+        notes_metadata.append({
+            "id": note.id,
+            "title": title,
+            "filename": filename,
+            "date": getattr(note, 'date', None),
+            "time": getattr(note, 'time', None),
+            "hash": getattr(note, 'content_hash', None),
+            "open_todos": count_open_todos(note.todos) if note.loaded else collection.columns.open_todo_count(note.id),
+            "open_todo_items": open_todo_items(collection, note),
+            **collection.name_metadata(note),
+        })
+
+    collection.filenames = filenames
+    return notes_metadata
+
+
+def _content_hash(text: str) -> str:
+    """Return the content hash of a serialized document."""
+    return sha256(text.encode('utf-8')).hexdigest()
+
+
+def _encode_note(note: MeetingNote) -> Tuple[str, str]:
+    """Serialize a note for its JSON file; returns (text, content hash)."""
+    text = json.dumps(_serialize_note_for_write(note), indent=2, ensure_ascii=False)
+    return text, _content_hash(text)
+
+
+def _encode_collection(collection: NotesCollection) -> Tuple[str, str]:
+    """Serialize collection.json; returns (text, content hash).
+
+    The hash leaves out `updated_at` so an unchanged index hashes the same
+    on every save; it is stored in the document as `content_hash`.
+    """
+    content = _collection_json_content(collection)
+    stable = {k: v for k, v in content.items() if k != "updated_at"}
+    digest = _content_hash(json.dumps(stable, indent=4, ensure_ascii=False))
+    content["content_hash"] = digest
+    return json.dumps(content, indent=4, ensure_ascii=False), digest
+
+
+def _collection_json_content(collection: NotesCollection) -> dict:
+    """Return the collection.json document for a collection."""
+    notes_metadata = _notes_metadata(collection)
+    now = f"{datetime.now(tz=timezone.utc).isoformat()}Z"
+    return {
+        "collection_name": collection.name,
+        "slug": slugify(collection.name),
+        "created_at": getattr(collection, "created_at", now),
+        "updated_at": now,
+        "notes": notes_metadata,
+        "note_count": len(notes_metadata),
+        "categories": getattr(collection, "categories", []),
+        "tags": getattr(collection, "tags", []),
+        "locations": getattr(collection, "locations", []),
+        "storage": collection.storage,
+        "filenames": collection.filenames,
+        "durability": collection.durability,
+    }
+
+
+DURABILITY_NONE = "none"          # no fsync at all (tmpfs, CI, scripted imports)
+DURABILITY_FILE = "file"          # fsync written files
+DURABILITY_FILE_DIR = "file+dir"  # fsync written files and their directory
+DURABILITY_LEVELS = (DURABILITY_NONE, DURABILITY_FILE, DURABILITY_FILE_DIR)
+
+# Serializes saves from the UI thread (Ctrl+S) and the autosave worker
+_save_lock = RLock()
+
+# Subjects notified after notes were persisted: (collection, [notes],
+# collection_path), (collection, note, collection_path) for a renamed note
+# file and for a deleted note
+NOTES_SAVED = "persistence.notes.saved"
+NOTE_RENAMED = "persistence.note.renamed"
+NOTE_DELETED = "persistence.note.deleted"
+
+
+def resolve_durability(collection: NotesCollection = None) -> str:
+    """Return the durability level for writes: the collection's own setting,
+    else the one given on the command line (registry.durability), else
+    config.DURABILITY.
+    """
+    for level in (getattr(collection, "durability", None), registry.durability, DURABILITY):
+        if level in DURABILITY_LEVELS:
+            return level
+        if level:
+            logging.warning(f"Unknown durability level {level!r}; expected one of {DURABILITY_LEVELS}")
+    return DURABILITY_FILE_DIR
+
+
+def _sync_file(f, durability: str) -> int:
+    """Flush a file opened for writing and fsync it if the durability level asks for it.
+
+    Returns the number of fsyncs done.
+    """
+    f.flush()
+    if durability == DURABILITY_NONE:
+        return 0
+    fsync(f.fileno())
+    return 1
+
+
+def _fsync_dir(dir_path: str) -> bool:
+    """fsync a directory so renames inside it are durable.
+
+    Returns False where directories cannot be opened (e.g. on Windows).
+    """
+    try:
+        fd = os_open(dir_path, O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fsync(fd)
+    finally:
+        close(fd)
+    return True
+
+
+def _sync_dir(dir_path: str, durability: str) -> int:
+    """fsync a directory if the durability level asks for it; returns the number of fsyncs done."""
+    if durability != DURABILITY_FILE_DIR:
+        return 0
+    return 1 if _fsync_dir(dir_path) else 0
+
+
 def rename_note_file(old_title: str, new_title: str) -> Tuple[bool, str]:
     """Renames a note file based on a new title.
 
-    Returns (True, new_path) on success or (False, error_msg).
+    Returns (True, new_path) on success or (False, error_msg). Observers of
+    NOTE_RENAMED receive the renamed note, whose `filename` is already the
+    new one.
     """
+    collection = registry.notes_collection
+    note = collection.note_by_filename(f"{old_title}.json") if collection else None
+    ok, msg = _rename_note_file(old_title, new_title)
+    if ok and note is not None:
+        note.filename = path.basename(msg)
+        collection.filenames[note.id] = note.filename
+        collection.update_note(note)
+        Observable(NOTE_RENAMED).notify(collection, note, path.join(DATA_ROOT, slugify(collection.name)))
+    return ok, msg
+
+
+def _rename_note_file(old_title: str, new_title: str) -> Tuple[bool, str]:
+    """rename_note_file without notification."""
     try:
         collection_slug = slugify(registry.notes_collection.name)
         collection_path = path.join(DATA_ROOT, collection_slug)
 
+        if registry.notes_collection.storage == STORAGE_SQLITE:
+            from db import sqlite_store
+            return sqlite_store.rename_note(collection_path, f"{old_title}.json", f"{new_title}.json")
+
+        if registry.notes_collection.storage == STORAGE_JOURNAL:
+            from db import journal_store
+            return journal_store.rename_note(registry.notes_collection, collection_path, f"{old_title}.json", f"{new_title}.json",
+                                             resolve_durability(registry.notes_collection))
+
         old_path = f"{path.join(collection_path, old_title)}.json"
         if not path.exists(old_path):
             return False, f"Old path does not exist: {old_path}"
@@ -83,43 +263,24 @@ def update_notes(collection: NotesCollection, collection_path: str = None, check
         json_filepath = path.join(collection_path, "collection.json")
         if check_exists and not path.exists(json_filepath):
             return False, f"collection.json does not exist at {json_filepath}"
+
+        if collection.storage == STORAGE_SQLITE:
+            from db import sqlite_store
+            return sqlite_store.update_meta(collection, collection_path)
+
+        if collection.storage == STORAGE_JOURNAL:
+            from db import journal_store
+            return journal_store.update_meta(collection, collection_path, resolve_durability(collection))
         
         # After saving notes, update collection.json
         okc, msgc = True, ""
         try:
             # reuse collection.json writing from save_collection: build metadata
-            notes_metadata = []
-            for note in collection.notes:
-                # find file by title/date/time-based naming - best-effort
-                base_filename = slugify(getattr(note, 'title', 'note')) or 'note'
-                filename = f"{base_filename}.json"
-                if not path.exists(path.join(collection_path, filename)):
-                    # fallback: pick any matching by prefix
-                    for f in listdir(collection_path):
-                        if f.startswith(base_filename):
-                            filename = f
-                            break
-
-                notes_metadata.append({
-                    "title": getattr(note, 'title', ''),
-                    "filename": filename
-                })
-
-            now = f"{datetime.now(tz=timezone.utc).isoformat()}Z"
-            collection_slug = slugify(collection.name)
-            collection_json_content = {
-                "collection_name": collection.name,
-                "slug": collection_slug,
-                "created_at": getattr(collection, "created_at", now),
-                "updated_at": now,
-                "notes": notes_metadata,
-                "note_count": len(notes_metadata),
-                "categories": getattr(collection, "categories", []),
-                "tags": getattr(collection, "tags", []),
-                "locations": getattr(collection, "locations", []),
-            }
-
             json_filepath = path.join(collection_path, "collection.json")
+            text, digest = _encode_collection(collection)
+            if digest == collection.content_hash and path.exists(json_filepath):
+                return True, f"collection.json unchanged (hash {digest[:12]})"
+
             tmp_json = json_filepath + '.tmp'
 
             backup_path = path.join(collection_path, f"collection.json.bak")
@@ -129,18 +290,21 @@ def update_notes(collection: NotesCollection, collection_path: str = None, check
             if path.exists(json_filepath):
                 rename(json_filepath, backup_path)
 
+            durability = resolve_durability(collection)
             with open(tmp_json, 'w', encoding='utf-8') as f:
-                json.dump(collection_json_content, f, indent=4, ensure_ascii=False)
-                f.flush()
-                fsync(f.fileno())
+                f.write(text)
+                _sync_file(f, durability)
 
             replace(tmp_json, json_filepath)
+            _sync_dir(collection_path, durability)
+            collection.content_hash = digest
+            msgc = f"hash {digest[:12]}"
 
         except Exception as e:
             okc = False
             msgc = str(e)
 
-        return True, f"Notes saved; collection updated: {msgc}" if okc else (False, f"Failed updating collection.json: {msgc}")
+        return (True, f"Notes saved; collection updated: {msgc}") if okc else (False, f"Failed updating collection.json: {msgc}")
 
     except Exception as e:
         tb = format_exc()
@@ -149,6 +313,10 @@ def update_notes(collection: NotesCollection, collection_path: str = None, check
 
 def _serialize_note_for_write(note: MeetingNote) -> dict:
     """Return a dict representation of a MeetingNote for JSON writing."""
+    # A lazily loaded stub must never overwrite its file with an empty body
+    if not note.ensure_loaded() or not note.loaded:
+        raise ValueError(f"Body of note '{note.title}' could not be loaded")
+
     now = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
     notes = getattr(note, 'notes', None) or None
     if notes is None:
@@ -167,6 +335,7 @@ def _serialize_note_for_write(note: MeetingNote) -> dict:
         _todos = todos
 
     return {
+        "id": note.id,
         "title": note.title,
         "created_at": note.created_at,
         "updated_at": note.updated_at or now,
@@ -180,22 +349,34 @@ def _serialize_note_for_write(note: MeetingNote) -> dict:
     }
 
 
-def save_note(note: MeetingNote, collection_path: str) -> Tuple[bool, str]:
+def save_note(note: MeetingNote, collection_path: str, durability: str = None,
+              collection: NotesCollection = None) -> Tuple[bool, str]:
     """Save a single MeetingNote if its `dirty` flag is True.
 
+    `durability` defaults to `resolve_durability(collection)` (pass the
+    note's collection so its own durability setting applies).
     Returns (True, message) on success or (False, error_msg).
     """
     try:
         if not getattr(note, 'dirty', False):
             return True, "Skipped (not dirty)"
+        if not note.ensure_loaded():
+            return False, f"Not saving note '{note.title}': its body could not be loaded"
 
         # Prepare filename
-        base_filename = slugify(getattr(note, 'title', 'note')) or 'note'
-        filename = f"{base_filename}.json"
+        filename = note_filename(note)
         
         dst = path.join(collection_path, filename)
         tmp = dst + '.tmp'
 
+        # serialize first: a lazily loaded note still reads its body from dst
+        edits = note.edits
+        text, digest = _encode_note(note)
+        if digest == note.content_hash and path.exists(dst):
+            note.filename = filename
+            note.clear_dirty(edits)
+            return True, f"Skipped {dst} (unchanged, hash {digest[:12]})"
+
         backup_path = path.join(collection_path, f"{filename}.bak")
         if path.exists(backup_path):
             remove(backup_path)
@@ -203,28 +384,173 @@ def save_note(note: MeetingNote, collection_path: str) -> Tuple[bool, str]:
         if path.exists(dst):
             rename(dst, backup_path)
 
-        data = _serialize_note_for_write(note)
         # atomic write
+        durability = durability or resolve_durability(collection)
         with open(tmp, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.flush()
-            fsync(f.fileno())
+            f.write(text)
+            _sync_file(f, durability)
         replace(tmp, dst)
+        _sync_dir(collection_path, durability)
+        note.filename = filename
+        note.content_hash = digest
         try:
-            note.clear_dirty()
+            note.clear_dirty(edits)
         except Exception:
             pass
-        return True, f"Saved note to {dst}"
+        return True, f"Saved note to {dst} (hash {digest[:12]})"
     except Exception as e:
         tb = format_exc()
         return False, f"Failed to save note: {e}\n{tb}"
 
 
-def save_notes(collection: NotesCollection, data_root: str) -> Tuple[bool, str]:
+def _remove_temp_files(paths) -> None:
+    """Remove leftover temp files of an aborted save (best effort)."""
+    for tmp in paths:
+        try:
+            if path.exists(tmp):
+                remove(tmp)
+        except OSError as e:
+            logging.warning(f"Could not remove temp file {tmp}: {e}")
+
+
+def _save_notes_batch(collection: NotesCollection, collection_path: str,
+                      progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+    """Group-commit all dirty notes and collection.json.
+
+    Every changed note and the new collection.json are first written to temp
+    files and fsynced together; only then are they swapped into place (notes
+    first, collection.json last, so the index never points at a file that
+    is not there yet) and the directory is fsynced once. A crash leaves each
+    file either old or new, plus at most some stray .tmp files. If a swap
+    fails, the remaining temp files are removed and the notes not swapped
+    keep their dirty flag and previous hash. Notes with an empty change set
+    or an unchanged content hash are not written at all. Notes edited while
+    the save runs stay dirty (see MeetingNote.clear_dirty).
+    """
+    started = perf_counter()
+    durability = resolve_durability(collection)
+    fsyncs = 0
+    # (temp file, destination, note or None for collection.json, content hash)
+    staged = []
+    files = []
+    destinations = {}
+    dirty = [note for note in collection.notes if note.dirty]
+    # edit counts before any note is encoded
+    edits = {id(note): note.edits for note in dirty}
+    skipped = 0
+    done = 0
+    try:
+        for note in dirty:
+            filename = note_filename(note)
+            note.filename = filename
+            collection.filenames[note.id] = filename
+            if progress:
+                progress(done, len(dirty))
+            done += 1
+            if not note.changes:
+                skipped += 1
+                continue
+            dst = path.join(collection_path, filename)
+            text, digest = _encode_note(note)
+            if digest == note.content_hash and path.exists(dst):
+                skipped += 1
+                continue
+            if dst in destinations:
+                # two notes on one file: fail before anything is swapped in
+                raise ValueError(f"Notes '{destinations[dst]}' and '{note.title}' share the file {filename}")
+            destinations[dst] = note.title
+
+            tmp = dst + '.tmp'
+            f = open(tmp, 'w', encoding='utf-8')
+            files.append(f)
+            staged.append((tmp, dst, note, digest))
+            f.write(text)
+
+        json_filepath = path.join(collection_path, "collection.json")
+        text, digest = _encode_collection(collection)
+        index_changed = digest != collection.content_hash or not path.exists(json_filepath)
+        if index_changed:
+            tmp_json = json_filepath + '.tmp'
+            f = open(tmp_json, 'w', encoding='utf-8')
+            files.append(f)
+            staged.append((tmp_json, json_filepath, None, digest))
+            f.write(text)
+
+        # group flush: all data is durable before any file is swapped in
+        for f in files:
+            fsyncs += _sync_file(f, durability)
+            f.close()
+    except Exception as e:
+        for f in files:
+            f.close()
+        _remove_temp_files(tmp for tmp, _dst, _note, _digest in staged)
+        tb = format_exc()
+        return False, f"Failed to stage notes: {e}\n{tb}"
+
+    # hashes are only taken over once a file is in place, so a failed swap
+    # leaves its note dirty and written again by the next save
+    swapped = 0
+    try:
+        for tmp, dst, note, file_digest in staged:
+            replace(tmp, dst)
+            swapped += 1
+            if note is not None:
+                note.content_hash = file_digest
+                note.clear_dirty(edits[id(note)])
+            else:
+                collection.content_hash = file_digest
+    except Exception as e:
+        _remove_temp_files(tmp for tmp, _dst, _note, _digest in staged[swapped:])
+        if swapped:
+            _sync_dir(collection_path, durability)
+        staged_notes = {id(note) for _tmp, _dst, note, _digest in staged if note is not None}
+        for note in dirty:
+            if id(note) not in staged_notes:
+                # unchanged notes need no write either way
+                note.clear_dirty(edits[id(note)])
+        tb = format_exc()
+        return False, f"Failed to swap in saved notes ({swapped} of {len(staged)} file(s) replaced): {e}\n{tb}"
+    if staged:
+        fsyncs += _sync_dir(collection_path, durability)
+    collection.content_hash = digest
+
+    for note in dirty:
+        note.clear_dirty(edits[id(note)])
+    if progress:
+        progress(len(dirty), len(dirty))
+
+    elapsed_ms = (perf_counter() - started) * 1000
+    msg = (
+        f"Saved {len(dirty) - skipped} note(s), skipped {skipped} unchanged; "
+        f"collection.json {'written' if index_changed else 'unchanged'} (hash {digest[:12]}) "
+        f"in {elapsed_ms:.1f} ms with {fsyncs} fsync(s) (batched, durability={durability})"
+    )
+    logging.info(msg)
+    return True, msg
+
+
+def save_notes(collection: NotesCollection, data_root: str, batch: bool = True,
+               progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
     """Save only notes marked dirty in the collection.
 
-    Writes individual note files and updates collection.json.
+    Writes individual note files and updates collection.json. With `batch`
+    (the default) the writes are group-committed by `_save_notes_batch`;
+    otherwise every note is saved on its own by `save_note`. Safe to call
+    from a worker thread; concurrent saves run one after the other.
+    `progress(done, total)` is called as dirty notes are written.
+    Observers of NOTES_SAVED receive the notes that were dirty.
     """
+    with _save_lock:
+        dirty = [note for note in collection.notes if note.dirty] if collection else []
+        ok, msg = _save_dirty_notes(collection, data_root, batch, progress)
+        if ok and dirty:
+            Observable(NOTES_SAVED).notify(collection, dirty, path.join(data_root, slugify(collection.name)))
+        return ok, msg
+
+
+def _save_dirty_notes(collection: NotesCollection, data_root: str, batch: bool,
+                      progress: Optional[Callable[[int, int], None]]) -> Tuple[bool, str]:
+    """save_notes without locking and notification."""
     try:
         if not collection or not collection.name:
             return False, "Invalid collection"
@@ -233,27 +559,70 @@ def save_notes(collection: NotesCollection, data_root: str) -> Tuple[bool, str]:
         collection_path = path.join(data_root, collection_slug)
         makedirs(collection_path, exist_ok=True)
 
-        # Save all dirty notes
-        results = []
-        for note in collection.notes:
-            if not note.dirty:
-                continue
+        if collection.storage == STORAGE_SQLITE:
+            from db import sqlite_store
+            return sqlite_store.save_notes(collection, collection_path, resolve_durability(collection), progress)
 
-            ok, msg = save_note(note, collection_path)
-            results.append((ok, msg))
+        if collection.storage == STORAGE_JOURNAL:
+            from db import journal_store
+            return journal_store.save_notes(collection, collection_path, resolve_durability(collection), progress)
+
+        if batch:
+            return _save_notes_batch(collection, collection_path, progress)
+
+        # Save all dirty notes
+        started = perf_counter()
+        durability = resolve_durability(collection)
+        written, skipped = 0, 0
+        dirty = [note for note in collection.notes if note.dirty]
+        for done, note in enumerate(dirty):
+            if progress:
+                progress(done, len(dirty))
+            ok, msg = save_note(note, collection_path, durability, collection)
+            if ok:
+                collection.filenames[note.id] = note.filename
+                if msg.startswith("Skipped"):
+                    skipped += 1
+                else:
+                    written += 1
+
+        if progress:
+            progress(len(dirty), len(dirty))
 
         # After saving notes, update collection.json
+        index_hash = collection.content_hash
         okc, msgc = update_notes(collection, collection_path)
         if not okc:
-            return False, "Some notes failed to save:\n" + "\n".join(msgc)
-        
-        return True, "All dirty notes saved successfully."
+            return False, "Some notes failed to save:\n" + msgc
+        index_written = collection.content_hash != index_hash
+
+        # per written file: one fsync, plus one for the directory with file+dir
+        per_file = {DURABILITY_NONE: 0, DURABILITY_FILE: 1, DURABILITY_FILE_DIR: 2}[durability]
+        elapsed_ms = (perf_counter() - started) * 1000
+        msg = (
+            f"Saved {written} note(s), skipped {skipped} unchanged; "
+            f"collection.json {'written' if index_written else 'unchanged'} (hash {(collection.content_hash or '')[:12]}) "
+            f"in {elapsed_ms:.1f} ms with {(written + index_written) * per_file} fsync(s) (durability={durability})"
+        )
+        logging.info(msg)
+        return True, msg
 
     except Exception as e:
         tb = format_exc()
         return False, f"Error in save_changed_notes: {e}\n{tb}"
 
 
+def write_snapshot_cache(collection: NotesCollection, data_root: str = DATA_ROOT) -> bool:
+    """Write the snapshot cache of a JSON collection (see db.snapshot), e.g. when it is closed.
+
+    Saves do not rewrite the snapshot; until the next one is written it is
+    stale and the collection is loaded from its files.
+    """
+    if not SNAPSHOT_CACHE or collection is None or not collection.name:
+        return False
+    return snapshot.write_snapshot(collection, path.join(data_root, slugify(collection.name)))
+
+
 def save_collection_view(collection: NotesCollection, data_root: str) -> Tuple[bool, str]:
     """Force an update of collection.json (index) without touching note files."""
     try:
@@ -263,46 +632,28 @@ def save_collection_view(collection: NotesCollection, data_root: str) -> Tuple[b
         collection_path = path.join(data_root, collection_slug)
         makedirs(collection_path, exist_ok=True)
 
-        notes_metadata = []
-        for note in collection.notes:
-            base_filename = slugify(getattr(note, 'title', 'note')) or 'note'
-            time_part = ''
-            if getattr(note, 'time', None):
-                t = re.sub(r"[^0-9]", "", str(getattr(note, 'time')))
-                if t:
-                    time_part = f"_{t}"
-            filename = f"{base_filename}{time_part}.json"
-            if not path.exists(path.join(collection_path, filename)):
-                for f in listdir(collection_path):
-                    if f.startswith(base_filename):
-                        filename = f
-                        break
-            notes_metadata.append({
-                "title": getattr(note, 'title', ''),
-                "filename": filename
-            })
-
-        now = datetime.utcnow().isoformat() + "Z"
-        collection_json_content = {
-            "collection_name": collection.name,
-            "slug": collection_slug,
-            "created_at": getattr(collection, "created_at", now),
-            "updated_at": now,
-            "notes": notes_metadata,
-            "note_count": len(notes_metadata),
-            "categories": getattr(collection, "categories", []),
-            "tags": getattr(collection, "tags", []),
-            "locations": getattr(collection, "locations", []),
-        }
+        if collection.storage == STORAGE_SQLITE:
+            from db import sqlite_store
+            return sqlite_store.update_meta(collection, collection_path)
+
+        if collection.storage == STORAGE_JOURNAL:
+            from db import journal_store
+            return journal_store.update_meta(collection, collection_path, resolve_durability(collection))
 
         json_filepath = path.join(collection_path, "collection.json")
+        text, digest = _encode_collection(collection)
+        if digest == collection.content_hash and path.exists(json_filepath):
+            return True, f"collection.json unchanged (hash {digest[:12]})"
+
         tmp_json = json_filepath + '.tmp'
+        durability = resolve_durability(collection)
         with open(tmp_json, 'w', encoding='utf-8') as f:
-            json.dump(collection_json_content, f, indent=4, ensure_ascii=False)
-            f.flush()
-            fsync(f.fileno())
+            f.write(text)
+            _sync_file(f, durability)
         replace(tmp_json, json_filepath)
-        return True, f"collection.json updated at {json_filepath}"
+        _sync_dir(collection_path, durability)
+        collection.content_hash = digest
+        return True, f"collection.json updated at {json_filepath} (hash {digest[:12]})"
     except Exception as e:
         tb = format_exc()
         return False, f"Failed to update collection view: {e}\n{tb}"
@@ -310,6 +661,46 @@ def save_collection_view(collection: NotesCollection, data_root: str) -> Tuple[b
     # end save_collection
 
 
+def delete_note(collection: NotesCollection, note: MeetingNote, data_root: str) -> Tuple[bool, str]:
+    """Remove a note from the collection and from storage.
+
+    For JSON storage the note file is deleted and collection.json updated.
+    """
+    try:
+        if not collection or not collection.name:
+            return False, "Invalid collection"
+
+        collection_slug = slugify(collection.name)
+        collection_path = path.join(data_root, collection_slug)
+        filename = getattr(note, 'filename', None) or note_filename(note)
+
+        if not collection.remove_note(note) and note in collection.notes:
+            collection.notes.remove(note)
+        collection.filenames.pop(note.id, None)
+        Observable(NOTE_DELETED).notify(collection, note, collection_path)
+
+        if collection.storage == STORAGE_SQLITE:
+            from db import sqlite_store
+            return sqlite_store.delete_note(collection_path, filename)
+
+        if collection.storage == STORAGE_JOURNAL:
+            from db import journal_store
+            return journal_store.delete_note(collection_path, filename, resolve_durability(collection))
+
+        note_path = path.join(collection_path, filename)
+        if path.exists(note_path):
+            remove(note_path)
+
+        okc, msgc = update_notes(collection, collection_path)
+        if not okc:
+            return False, msgc
+
+        return True, f"Deleted note {note_path}"
+    except Exception as e:
+        tb = format_exc()
+        return False, f"Failed to delete note: {e}\n{tb}"
+
+
 def export_markdown(text: str, default_filename: str = "export.md", out_dir: Optional[str] = None) -> str:
     """
     Save the provided markdown text to a file and return the full path.
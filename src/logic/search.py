@@ -0,0 +1,478 @@
+###
+# File:   src\logic\search.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+
+# imports
+import logging
+import os
+import re
+from bisect import bisect_left
+from math import log
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from db import fts_store
+from db.search_cache import read_search_cache, write_search_cache
+from db.snapshot import file_stamp
+from logic.fuzzy import TrigramIndex, fold
+from logic.pattern.observer import Observable
+from logic.persistence import NOTE_DELETED, NOTE_RENAMED, NOTES_SAVED
+from models.notes import MeetingNote, NotesCollection, STORAGE_JSON
+
+
+# constants
+# Indexed note fields, in position order; the name fields come first
+NAME_FIELDS = ("title", "topic", "participants")
+SEARCH_FIELDS = NAME_FIELDS + ("location", "notes", "todos")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Most vocabulary terms a single "prefix*" query term expands to
+MAX_PREFIX_TERMS = 200
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+# variables
+_index: Optional["SearchIndex"] = None
+
+
+# functions/classes
+def tokenize(text: str) -> List[str]:
+    """Split text into folded word tokens."""
+    return _TOKEN_RE.findall(fold(text)) if text else []
+
+
+def _note_text(values) -> Iterable[str]:
+    """Yield the text chunks of a field value (a string or a list of lines)."""
+    if not values:
+        return
+    if isinstance(values, str):
+        yield values
+    else:
+        for value in values:
+            if value:
+                yield str(value)
+
+
+def _note_positions(fields: dict) -> Tuple[Dict[str, List[int]], int]:
+    """Return term -> positions of a note and the end of its name fields.
+
+    Fields and list entries are separated by a gap so phrases never match
+    across them. Positions below the returned span belong to NAME_FIELDS.
+    """
+    positions: Dict[str, List[int]] = {}
+    pos = span = 0
+    for name in SEARCH_FIELDS:
+        for chunk in _note_text(fields.get(name)):
+            for token in tokenize(chunk):
+                positions.setdefault(token, []).append(pos)
+                pos += 1
+            pos += 1
+        if name in NAME_FIELDS:
+            span = pos
+    return positions, span
+
+
+def _note_fields(note: MeetingNote) -> dict:
+    """Return the indexed fields of a note without faulting in a lazy stub's body."""
+    if not note.loaded:
+        try:
+            data = note.loader()
+        except Exception as e:
+            logging.warning(f"Search: could not read note '{note.title}' ({note.filename}): {e}")
+            data = {}
+        data = {name: data.get(name) for name in SEARCH_FIELDS}
+        data["title"] = note.title
+        return data
+    return {name: getattr(note, name, None) for name in SEARCH_FIELDS}
+
+
+def _note_names(fields: dict) -> tuple:
+    """Return (title, topic, participants) of a note's indexed fields."""
+    participants = fields.get("participants") or ()
+    if isinstance(participants, str):
+        participants = participants.splitlines()
+    return fields.get("title"), fields.get("topic"), tuple(p for p in participants if p)
+
+
+class SearchIndex:
+    """In-memory inverted index over the notes of one collection.
+
+    Postings map each term to the notes containing it and the term's
+    positions there (for phrase queries). Notes are indexed by id, so
+    renames keep their postings. Queries are ranked by BM25; see `search`
+    for the query syntax. All methods are thread-safe.
+
+    With a `collection_path` the index is persisted there (see
+    db.search_cache) together with a manifest of note id -> (file name,
+    file stamp, content hash); `build` then only re-tokenizes notes whose
+    entry no longer matches.
+
+    `names` and `participants` are trigram indexes (see logic.fuzzy) of the
+    name fields and of the participant names, owned by note id.
+    """
+
+    def __init__(self, collection: NotesCollection, collection_path: str = None) -> None:
+        self.collection = collection
+        self.collection_path = collection_path
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._spans: Dict[str, int] = {}
+        self._names: Dict[str, tuple] = {}
+        # fuzzy lookup of the name fields (titles, topics, participants) and
+        # of participants alone; owners are note ids
+        self.names = TrigramIndex()
+        self.participants = TrigramIndex()
+        self._total_length = 0
+        self._manifest: Dict[str, tuple] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._changed = False
+        self._lock = Lock()
+        self.ready = Event()
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def build(self) -> None:
+        """Index all notes of the collection, reusing the persisted index where it is current."""
+        started = perf_counter()
+        notes = list(self.collection.notes)
+        state = read_search_cache(self.collection_path) if self.collection_path else None
+        if state is not None and not self._restore(state):
+            logging.warning(f"Search index of '{self.collection_path}' is corrupt, rebuilding it")
+
+        current = {note.id for note in notes}
+        for note_id in set(self._lengths) - current:
+            self.remove_note(note_id)
+
+        reused = 0
+        for note in notes:
+            if self._is_current(note):
+                reused += 1
+            else:
+                self.add_note(note)
+
+        elapsed_ms = (perf_counter() - started) * 1000
+        logging.info(f"Search index built for {len(notes)} note(s) ({len(notes) - reused} tokenized, {reused} reused), "
+                     f"{len(self._postings)} term(s) in {elapsed_ms:.1f} ms")
+        self.ready.set()
+        self.save()
+
+    def save(self) -> bool:
+        """Persist the index if it changed since it was read or last saved."""
+        if not self.collection_path or not self._changed:
+            return False
+        with self._lock:
+            state = {
+                "postings": self._postings,
+                "terms": self._terms,
+                "lengths": self._lengths,
+                "spans": self._spans,
+                "names": self._names,
+                "manifest": self._manifest,
+            }
+            ok = write_search_cache(state, self.collection_path)
+        if ok:
+            self._changed = False
+        return ok
+
+    def _restore(self, state: dict) -> bool:
+        """Adopt a persisted index state; False (and an empty index) if it is inconsistent.
+
+        The trigram indexes are not persisted, they are rebuilt from the
+        stored name fields.
+        """
+        try:
+            postings, terms, lengths, manifest = state["postings"], state["terms"], state["lengths"], state["manifest"]
+            spans, names = state["spans"], state["names"]
+            if not (set(terms) == set(lengths) == set(spans) == set(names) == set(manifest)):
+                raise ValueError("note sets differ")
+            for note_id, note_terms in terms.items():
+                for term in note_terms:
+                    postings[term][note_id]
+        except Exception as e:
+            logging.debug(f"Search index state rejected: {e}")
+            return False
+
+        with self._lock:
+            self._postings, self._terms, self._lengths, self._manifest = postings, terms, lengths, manifest
+            self._spans = spans
+            self._names, self.names, self.participants = {}, TrigramIndex(), TrigramIndex()
+            for note_id, note_names in names.items():
+                self._add_names(note_id, note_names)
+            self._total_length = sum(lengths.values())
+            self._vocabulary = None
+        return True
+
+    def _stamp(self, note: MeetingNote) -> tuple:
+        """Return the manifest entry of a note as currently stored."""
+        stamp = None
+        if self.collection_path and note.filename and self.collection.storage == STORAGE_JSON:
+            stamp = file_stamp(os.path.join(self.collection_path, note.filename))
+        return note.filename, stamp, note.content_hash
+
+    def _is_current(self, note: MeetingNote) -> bool:
+        # current when file name, file stamp and content hash all still match;
+        # an entry with neither stamp nor hash proves nothing
+        entry = self._manifest.get(note.id)
+        return entry is not None and (entry[1], entry[2]) != (None, None) and entry == self._stamp(note)
+
+    def add_note(self, note: MeetingNote, fields: dict = None) -> None:
+        """Index a note, replacing its previous postings."""
+        fields = fields if fields is not None else _note_fields(note)
+        positions, span = _note_positions(fields)
+        entry = self._stamp(note)
+        with self._lock:
+            self._remove(note.id)
+            self._manifest[note.id] = entry
+            self._changed = True
+            for term, where in positions.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    self._vocabulary = None
+                postings[note.id] = where
+            length = sum(len(where) for where in positions.values())
+            self._terms[note.id] = tuple(positions)
+            self._lengths[note.id] = length
+            self._spans[note.id] = span
+            self._add_names(note.id, _note_names(fields))
+            self._total_length += length
+
+    update_note = add_note
+
+    def remove_note(self, note_id: str) -> None:
+        """Drop a note from the index."""
+        with self._lock:
+            self._remove(note_id)
+            self._changed = True
+
+    def _remove(self, note_id: str) -> None:
+        self._manifest.pop(note_id, None)
+        for term in self._terms.pop(note_id, ()):
+            postings = self._postings[term]
+            del postings[note_id]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+        self._total_length -= self._lengths.pop(note_id, 0)
+        self._spans.pop(note_id, None)
+        title, topic, participants = self._names.pop(note_id, (None, None, ()))
+        for text in (title, topic) + participants:
+            self.names.remove(text, note_id)
+        for text in participants:
+            self.participants.remove(text, note_id)
+
+    def _add_names(self, note_id: str, names: tuple) -> None:
+        title, topic, participants = self._names[note_id] = names
+        for text in (title, topic) + participants:
+            self.names.add(text, note_id)
+        for text in participants:
+            self.participants.add(text, note_id)
+
+    def _expand(self, prefix: str, limit: Optional[int] = MAX_PREFIX_TERMS) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        terms = []
+        i = bisect_left(vocabulary, prefix)
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix) and (limit is None or len(terms) < limit):
+            terms.append(vocabulary[i])
+            i += 1
+        return terms
+
+    def match_names(self, query: str) -> Set[str]:
+        """Return the ids of notes whose title, topic or participants match every word of `query` as a prefix."""
+        matched: Optional[Set[str]] = None
+        with self._lock:
+            spans = self._spans
+            for word in set(tokenize(query)):
+                ids = set()
+                for term in self._expand(word, limit=None):
+                    for doc, where in self._postings[term].items():
+                        if where[0] < spans[doc]:
+                            ids.add(doc)
+                matched = ids if matched is None else matched & ids
+                if not matched:
+                    break
+        return matched or set()
+
+    def _bm25(self, term: str, docs: Iterable[str] = None) -> Dict[str, float]:
+        postings = self._postings.get(term)
+        if not postings:
+            return {}
+        n = len(self._lengths)
+        idf = log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+        avg = self._total_length / n if n else 1.0
+        lengths = self._lengths
+        scores = {}
+        for doc in (postings if docs is None else docs):
+            tf = len(postings[doc])
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / avg)
+            scores[doc] = idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    def _term(self, term: str) -> Dict[str, float]:
+        return self._bm25(term)
+
+    def _prefix(self, prefix: str) -> Dict[str, float]:
+        scores: Dict[str, float] = {}
+        for term in self._expand(prefix):
+            for doc, score in self._bm25(term).items():
+                scores[doc] = scores.get(doc, 0.0) + score
+        return scores
+
+    def _phrase(self, terms: List[str]) -> Dict[str, float]:
+        if len(terms) == 1:
+            return self._term(terms[0])
+        postings = [self._postings.get(term) for term in terms]
+        if not all(postings):
+            return {}
+        docs = set.intersection(*(set(p) for p in sorted(postings, key=len)))
+        matches = []
+        for doc in docs:
+            starts = set(postings[0][doc])
+            for offset, p in enumerate(postings[1:], 1):
+                starts &= {pos - offset for pos in p[doc]}
+                if not starts:
+                    break
+            if starts:
+                matches.append(doc)
+        scores: Dict[str, float] = dict.fromkeys(matches, 0.0)
+        for term in set(terms):
+            for doc, score in self._bm25(term, matches).items():
+                scores[doc] += score
+        return scores
+
+    def search(self, query: str, limit: int = 50) -> List[Tuple[str, float]]:
+        """Return (note id, score) of the best matches of `query`, best first.
+
+        Words must all match (AND); `OR` between words or groups of words
+        makes either side match. `"quoted words"` match as a phrase and a
+        trailing `*` matches a prefix (`budg*`). Words are case- and
+        accent-insensitive.
+        """
+        groups: List[List[Tuple[str, object]]] = [[]]
+        for phrase, word in _QUERY_RE.findall(query or ""):
+            if word == "OR":
+                groups.append([])
+            elif word == "AND":
+                continue
+            elif word and word.endswith("*") and tokenize(word):
+                groups[-1].append(("prefix", tokenize(word)[-1]))
+            else:
+                terms = tokenize(phrase or word)
+                if terms:
+                    groups[-1].append(("phrase", terms))
+
+        results: Dict[str, float] = {}
+        with self._lock:
+            for clauses in groups:
+                if not clauses:
+                    continue
+                matched: Optional[Dict[str, float]] = None
+                for kind, arg in clauses:
+                    scores = self._prefix(arg) if kind == "prefix" else self._phrase(arg)
+                    if matched is None:
+                        matched = scores
+                    else:
+                        matched = {doc: score + scores[doc] for doc, score in matched.items() if doc in scores}
+                    if not matched:
+                        break
+                for doc, score in (matched or {}).items():
+                    results[doc] = results.get(doc, 0.0) + score
+
+        return sorted(results.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def search(query: str, limit: int = 50) -> List[Tuple[MeetingNote, float]]:
+    """Search the attached collection; returns (note, score), best first."""
+    if _index is None:
+        return []
+    hits = []
+    for note_id, score in _index.search(query, limit):
+        note = _index.collection.get_note(note_id)
+        if note is not None:
+            hits.append((note, score))
+    return hits
+
+
+def search_archive(collection_path: str, query: str, limit: int = 20) -> List[dict]:
+    """Search any collection folder, open or not, with its SQLite FTS5 index.
+
+    Returns ranked hits with highlighted snippets; see db.fts_store.search.
+    """
+    return fts_store.search(collection_path, query, limit)
+
+
+def current() -> Optional[SearchIndex]:
+    """Return the index of the attached collection, if any."""
+    return _index
+
+
+def attach(collection: NotesCollection, collection_path: str = None, background: bool = True) -> Optional[SearchIndex]:
+    """Index `collection` and keep the index current as its notes are saved, renamed or deleted.
+
+    With `collection_path` the index persisted there is reused and only
+    changed notes are re-tokenized; a missing, stale or corrupt index is
+    rebuilt. With `background` this happens on a daemon thread and queries
+    see the notes indexed so far. Lazily loaded notes are read from their
+    files without keeping their bodies in memory.
+    """
+    global _index
+
+    detach()
+    if not collection:
+        return None
+
+    _index = SearchIndex(collection, collection_path)
+    if background:
+        Thread(target=_index.build, name="search-index", daemon=True).start()
+    else:
+        _index.build()
+    return _index
+
+
+def detach() -> None:
+    """Persist and drop the index of the attached collection, if any."""
+    global _index
+
+    index, _index = _index, None
+    if index is not None:
+        index.save()
+
+
+def _on_notes_saved(name: str, collection: NotesCollection, notes: List[MeetingNote], collection_path: str) -> None:
+    """NOTES_SAVED observer: re-index the saved notes."""
+    index = _index
+    if index is None or index.collection is not collection:
+        return
+    for note in notes:
+        index.update_note(note)
+
+
+def _on_note_renamed(name: str, collection: NotesCollection, note: MeetingNote, collection_path: str) -> None:
+    """NOTE_RENAMED observer: re-index the renamed note (its title changed)."""
+    index = _index
+    if index is not None and index.collection is collection and note is not None:
+        index.update_note(note)
+
+
+def _on_note_deleted(name: str, collection: NotesCollection, note: MeetingNote, collection_path: str) -> None:
+    """NOTE_DELETED observer: drop the deleted note from the index."""
+    index = _index
+    if index is not None and index.collection is collection:
+        index.remove_note(note.id)
+
+
+Observable(NOTES_SAVED).register(_on_notes_saved)
+Observable(NOTE_RENAMED).register(_on_note_renamed)
+Observable(NOTE_DELETED).register(_on_note_deleted)
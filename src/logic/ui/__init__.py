@@ -10,6 +10,10 @@ from enum import Enum
 
 
 # constants
+# Subject notified (with the page) after the open todos of the collection changed
+TODOS_CHANGED = "ui.todos.changed"
+
+
 class NoteItems(Enum):
     ITEM_TYPE_MEETINGS : str = "meetings"
     ITEM_TYPE_TEMPLATES : str = "templates"
@@ -9,10 +9,13 @@
 from os import path
 import logging
 from enum import Enum
+from threading import Lock, Thread
+from time import monotonic
 from flet import ControlEvent, Page, Icon, Colors, Text
-from config.config import DATA_ROOT
+from config.config import AUTOSAVE_DELAY, DATA_ROOT, LAZY_LOAD
 from db import register, registry
-from logic.persistence import save_notes
+from logic import autosave, search
+from logic.persistence import save_notes, slugify, write_snapshot_cache
 from db.handler import create_default_collection, load_notes_collection
 from db.messages import getError
 from logic.ui import ContentAction, NoteState
@@ -21,6 +24,9 @@ from ui.dialogs import about as aboutDialog
 from ui.dialogs import confirm as confirmDialog
 from ui.dialogs import file as fileDialog
 from ui.dialogs import notescollection as notesCollectionDialog
+from ui.dialogs import workspace_search as workspaceSearchDialog
+from ui.panels.status import updateProgress, updateStatus
+from models.dates import unparseable
 from ui.views import sidebar
 
 
@@ -33,6 +39,9 @@ class MenuState(Enum):
 
 
 # variables
+_save_lock = Lock()
+_save_in_flight = False
+_save_again = False
 
 
 # functions/classes
@@ -55,10 +64,10 @@ def handle_menu_item_click(event:str, e:ControlEvent) -> None:
 
         case "Quit"|"ui.menu.file.quit":
             if registry.changed:
-                confirmDialog.show(e.page, lambda: e.page.window.destroy())
+                confirmDialog.show(e.page, lambda: _quit(e.page))
             
             else:
-                e.page.window.destroy()
+                _quit(e.page)
 
         case "Close"|"ui.menu.file.close":
             if registry.changed:
@@ -67,10 +76,20 @@ def handle_menu_item_click(event:str, e:ControlEvent) -> None:
             else:
                 setMenuState(e.page, MenuState.CLOSED)
 
+        case "ui.menu.search":
+            workspaceSearchDialog.show(e.page, _open_search_hit)
+
         case _:
             logging.warning(f"Unknown event: {event}")
 
 
+def _quit(page:Page) -> None:
+    """Close the window, keeping a snapshot of the open collection"""
+
+    write_snapshot_cache(registry.notes_collection)
+    page.window.destroy()
+
+
 def new_callback(event:str, e:ControlEvent) -> None:
     """New notes collection"""
     
@@ -143,6 +162,111 @@ def save_callback(event:str, e: ControlEvent) -> None:
 #     fileDialog.showSave(e.page, setMenuState, MenuState.SAVED)
 
 
+def _open_search_hit(page:Page, hit:dict) -> None:
+    """Show a workspace search result, opening its collection if none is open"""
+
+    _folder = path.normpath(hit["collection"])
+    _open = registry.notes_collection
+    if _open is None:
+        register("notesFile", path.join(_folder, "collection.json"))
+        register("notesFileRoot", _folder)
+        register("notesName", path.basename(_folder))
+        setMenuState(page, MenuState.OPENED)
+
+    elif path.normpath(path.join(DATA_ROOT, slugify(_open.name))) != _folder:
+        updateStatus(f"Close '{registry.notesName}' to open '{path.basename(_folder)}'")
+        return
+
+    if not sidebar.show_note(page, hit["id"], hit["filename"]):
+        updateStatus(f"Note '{hit['title']}' not found in '{path.basename(_folder)}'")
+
+
+def _start_autosave(page:Page, collection) -> None:
+    """Autosave the open collection in the background"""
+
+    def _saved() -> None:
+        updateWindowState(page, WindowState.Saved)
+        updateWindowTitle(page, registry.notesName)
+
+    _delay = registry.autosave_delay if registry.autosave_delay is not None else AUTOSAVE_DELAY
+    autosave.start(collection, DATA_ROOT, _delay, on_status=updateStatus, on_saved=_saved)
+
+
+def _set_file_menu_busy(page:Page, busy:bool) -> None:
+    """Disable the file menu while a save is in flight"""
+
+    registry.ui.menu.file.new.disabled = True
+    registry.ui.menu.file.open.disabled = True
+    registry.ui.menu.file.save.disabled = busy
+    registry.ui.menu.file.close.disabled = busy
+    page.update()
+
+
+def _save_in_background(page:Page, collection) -> None:
+    """Save the dirty notes on a worker thread.
+
+    A save requested while one is in flight is coalesced: it sets a flag and
+    the worker runs exactly one more save when the current one finishes.
+    """
+    global _save_in_flight, _save_again
+
+    with _save_lock:
+        if _save_in_flight:
+            _save_again = True
+            logging.info("Save already in progress, coalescing request")
+            return
+        _save_in_flight = True
+
+    _set_file_menu_busy(page, True)
+    Thread(target=_save_worker, args=(page, collection), name="save", daemon=True).start()
+
+
+def _save_worker(page:Page, collection) -> None:
+    """Worker thread of _save_in_background"""
+    global _save_in_flight, _save_again
+
+    _last_update = [0.0]
+
+    def _progress(done:int, total:int) -> None:
+        # throttle status bar round-trips to ~10 per second
+        _now = monotonic()
+        if 0 < done < total and _now - _last_update[0] < 0.1:
+            return
+        _last_update[0] = _now
+        updateStatus(f"Saving {done}/{total} note(s)...")
+        updateProgress(done, total)
+
+    try:
+        while True:
+            success, msg = save_notes(collection, DATA_ROOT, progress=_progress)
+            with _save_lock:
+                if not (success and _save_again):
+                    break
+                _save_again = False
+
+        updateProgress(0, 0)
+        if success:
+            if not any(note.dirty for note in collection.notes):
+                updateWindowState(page, WindowState.Saved)
+            updateWindowTitle(page, registry.notesName)
+            updateStatus("Save succeeded")
+            logging.info(msg)
+        else:
+            updateStatus(f"Save failed: {msg.splitlines()[0]}")
+            logging.error(f"Save failed: {msg}")
+
+    except Exception:
+        logging.exception("Save worker failed")
+
+    finally:
+        with _save_lock:
+            _save_in_flight = False
+            _save_again = False
+        # Re-enable menu items
+        _set_file_menu_busy(page, False)
+        page.window.to_front()
+
+
 def setMenuState(page:Page, state_:MenuState=None) -> None:
     """Set the menu states"""
 
@@ -153,6 +277,8 @@ def setMenuState(page:Page, state_:MenuState=None) -> None:
             collection = create_default_collection(registry.notesName)
             register("notes_collection", collection)
             register("notesFileRoot", DATA_ROOT)
+            _start_autosave(page, collection)
+            search.attach(collection, path.join(DATA_ROOT, slugify(collection.name)))
             registry.ui.menu.drawer.disabled = False
             registry.ui.menu.file.new.disabled = True
             registry.ui.menu.file.open.disabled = True
@@ -193,9 +319,11 @@ def setMenuState(page:Page, state_:MenuState=None) -> None:
 
         case MenuState.OPENED:
             logging.info("Menu is opened")
-            collection = load_notes_collection(registry.notesFileRoot)
+            collection = load_notes_collection(registry.notesFileRoot, lazy=LAZY_LOAD)
             register("notes_collection", collection)
             register("notesFile", path.join(registry.notesFileRoot, "collection.json"))
+            _start_autosave(page, collection)
+            search.attach(collection, registry.notesFileRoot)
             registry.ui.menu.drawer.disabled = False
             registry.ui.menu.file.new.disabled = True
             registry.ui.menu.file.open.disabled = True
@@ -211,6 +339,11 @@ def setMenuState(page:Page, state_:MenuState=None) -> None:
             registry.ui.sidebar.container.visible = True
             page.update()
 
+            # Dates/times that could not be parsed were logged by the loader; point at them
+            _bad = unparseable(collection.notes) if collection else []
+            if _bad:
+                updateStatus(f"{len(_bad)} unrecognized date/time value(s), see log")
+
             # Populate Meeting Notes list from loaded collection (delegated to sidebar)
             try:
                 sidebar.populate_meeting_notes(page, collection)
@@ -243,6 +376,9 @@ def setMenuState(page:Page, state_:MenuState=None) -> None:
         
         case MenuState.CLOSED:
             logging.info("Menu is closed")
+            autosave.stop()
+            write_snapshot_cache(registry.notes_collection)
+            search.detach()
             registry.ui.menu.drawer.disabled = True
             registry.ui.menu.file.new.disabled = False
             registry.ui.menu.file.open.disabled = False
@@ -293,36 +429,7 @@ def setMenuState(page:Page, state_:MenuState=None) -> None:
                 logging.warning("No changes to save.")
                 return
 
-            success, msg = save_notes(registry.notes_collection, DATA_ROOT)
-            if success:
-                registry.changed = False
-                updateWindowTitle(page, registry.notesName)
-                updateWindowState(page, WindowState.Saved)
-                try:
-                    # update status bar if present
-                    if hasattr(registry, 'ui') and getattr(registry.ui, 'status', None):
-                        registry.ui.status.current.value = "Save succeeded"
-                        registry.ui.status.current.update()
-                except Exception:
-                    pass
-                
-                logging.info(msg)
-            else:
-                try:
-                    if hasattr(registry, 'ui') and getattr(registry.ui, 'status', None):
-                        registry.ui.status.current.value = f"Save failed: {msg}"
-                        registry.ui.status.current.update()
-                except Exception:
-                    pass
-
-                logging.error(f"Save failed: {msg}")
-            
-            # Re-enable menu items
-            registry.ui.menu.file.new.disabled = True
-            registry.ui.menu.file.open.disabled = True
-            registry.ui.menu.file.save.disabled = False
-            registry.ui.menu.file.close.disabled = False
-            page.window.to_front()
+            _save_in_background(page, registry.notes_collection)
 
         case _:
             logging.info("Menu is unknown")
@@ -0,0 +1,174 @@
+###
+# File:   src\logic\workspace.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import logging
+import os
+from bisect import insort
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import count
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Callable, Iterator, List, Optional, Tuple
+from config.config import DATA_ROOT, WORKSPACE_SEARCH_WORKERS
+from db import fts_store
+
+
+# constants
+COLLECTION_FILENAME = "collection.json"
+
+# Hits kept per collection and in the merged result list
+WORKSPACE_LIMIT = 50
+
+
+# variables
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = Lock()
+
+
+# functions/classes
+def find_collections(root: str = DATA_ROOT) -> List[str]:
+    """Return every collection folder (one holding a collection.json) below `root`, sorted.
+
+    Hidden folders are skipped and collection folders are not searched for
+    nested collections.
+    """
+    found = []
+    if not os.path.isdir(root):
+        return found
+    for folder, dirs, files in os.walk(root):
+        if COLLECTION_FILENAME in files:
+            found.append(folder)
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+    return sorted(found)
+
+
+def _search_collection(collection_path: str, query: str, limit: int) -> Tuple[str, List[dict], Optional[str]]:
+    """Worker: full-text search one collection folder; returns (collection_path, hits, error)."""
+    try:
+        return collection_path, fts_store.search(collection_path, query, limit), None
+    except Exception as e:
+        return collection_path, [], str(e)
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the thread pool of workspace searches, started on first use and kept warm.
+
+    Threads rather than processes: the work is SQLite and file I/O, which
+    release the GIL, and the frozen app cannot re-launch itself as workers.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=WORKSPACE_SEARCH_WORKERS or None, thread_name_prefix="workspace-search")
+        return _pool
+
+
+def shutdown() -> None:
+    """Stop the worker threads (a later search starts new ones)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_search(query: str, limit: int = WORKSPACE_LIMIT, root: str = DATA_ROOT, cancelled: Event = None,
+                collections: List[str] = None) -> Iterator[Tuple[str, List[dict]]]:
+    """Search every collection below `root` in parallel, yielding (collection_path, hits) as each finishes.
+
+    Each hit dict (see fts_store.search) gets a "collection" key holding
+    its collection folder. Collections are searched on worker threads
+    (SQLite releases the GIL); a missing collection.fts is built once, by
+    the first search that needs it (see fts_store.ensure_index). Setting `cancelled` stops the iteration and drops
+    searches that have not started yet. `collections` overrides the
+    folders found below `root`.
+    """
+    if collections is None:
+        collections = find_collections(root)
+    if not collections or not query.strip():
+        return
+
+    pool = _get_pool()
+    futures: List[Future] = [pool.submit(_search_collection, c, query, limit) for c in collections]
+    try:
+        for future in as_completed(futures):
+            if cancelled is not None and cancelled.is_set():
+                break
+            try:
+                collection_path, hits, error = future.result()
+            except Exception as e:
+                # the pool is unusable afterwards (e.g. shut down meanwhile)
+                logging.error(f"Workspace search for {query!r} failed: {e}")
+                shutdown()
+                break
+            if error:
+                logging.error(f"Workspace search in '{collection_path}' failed: {error}")
+            for hit in hits:
+                hit["collection"] = collection_path
+            yield collection_path, hits
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+class WorkspaceSearch:
+    """A workspace search running on a background thread.
+
+    `on_results(hits, done, total)` is called after every finished
+    collection with the merged hits so far (best first, at most `limit`),
+    so the slowest collection never holds back the others. Scores are bm25
+    ranks of separate indexes and only roughly comparable between
+    collections. `cancel()` stops delivering results; a new search in the
+    UI should cancel the previous one.
+    """
+
+    def __init__(self, query: str, on_results: Callable[[List[dict], int, int], None],
+                 limit: int = WORKSPACE_LIMIT, root: str = DATA_ROOT) -> None:
+        self.query = query
+        self.limit = limit
+        self.root = root
+        self._on_results = on_results
+        self._cancelled = Event()
+        self._thread = Thread(target=self._run, name="workspace-search", daemon=True)
+
+    def start(self) -> "WorkspaceSearch":
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _run(self) -> None:
+        started = perf_counter()
+        collections = find_collections(self.root)
+        total = len(collections)
+        merged: List[Tuple[float, int, dict]] = []
+        arrival = count()
+        done = 0
+        try:
+            if total == 0:
+                self._on_results([], 0, 0)
+                return
+            for _collection_path, hits in iter_search(self.query, self.limit, self.root, self._cancelled, collections):
+                done += 1
+                for hit in hits:
+                    # (negated score, arrival) keeps the list best-first and stable
+                    insort(merged, (-hit["score"], next(arrival), hit))
+                del merged[self.limit:]
+                if self.cancelled:
+                    return
+                self._on_results([hit for _score, _n, hit in merged], done, total)
+            logging.info(f"Workspace search for {self.query!r}: {len(merged)} hit(s) in {done} collection(s) "
+                         f"in {(perf_counter() - started) * 1000:.1f} ms")
+        except Exception:
+            logging.exception(f"Workspace search for {self.query!r} failed")
@@ -9,6 +9,7 @@
 #from pathlib import Path
 from argparse import ArgumentParser, Namespace
 from db import register
+from logic.persistence import DURABILITY_LEVELS
 from ui import app
 import logging
 
@@ -25,6 +26,13 @@ def parse_arguments():
 
     parser = ArgumentParser(description="Notes Manager.")
     parser.add_argument("--web", action="store_true", help="Run in web browser.")
+    parser.add_argument("--durability", choices=DURABILITY_LEVELS, help="Durability of writes (default: config.DURABILITY).")
+    parser.add_argument("--autosave-delay", type=float, metavar="SECONDS", help="Quiet period before autosaving, 0 disables (default: config.AUTOSAVE_DELAY).")
+    parser.add_argument("--to-sqlite", metavar="COLLECTION_DIR", help="Convert a JSON collection folder to SQLite storage and exit.")
+    parser.add_argument("--to-journal", metavar="COLLECTION_DIR", help="Switch a JSON collection folder to journal storage and exit.")
+    parser.add_argument("--fts-rebuild", metavar="COLLECTION_DIR", help="(Re)build the full-text index of a collection folder and exit.")
+    parser.add_argument("--search", nargs=2, metavar=("COLLECTION_DIR", "QUERY"), help="Full-text search a collection folder, print the hits and exit.")
+    parser.add_argument("--bench-load", metavar="COLLECTION_DIR", help="Time the serial and the threaded note loader, measure the memory per note of a collection folder and exit.")
     # parser.add_argument("data_folder", type=str, default="data", help="Path to the input data folder containing PDF files.")
     # parser.add_action("out_folder", type=str, default="out", help="Path to the output folder for Markdown files.")
     args = parser.parse_args()
@@ -44,8 +52,45 @@ def parse_arguments():
 
 def main(args_:Namespace) -> None:
     """ Main function """
+    if args_.to_sqlite:
+        from db.sqlite_store import convert_json_collection
+        ok, msg = convert_json_collection(args_.to_sqlite)
+        (logging.info if ok else logging.error)(msg)
+        return
+
+    if args_.to_journal:
+        from db.journal_store import enable_journal
+        ok, msg = enable_journal(args_.to_journal)
+        (logging.info if ok else logging.error)(msg)
+        return
+
+    if args_.fts_rebuild:
+        from db.fts_store import rebuild
+        ok, msg = rebuild(args_.fts_rebuild)
+        (logging.info if ok else logging.error)(msg)
+        return
+
+    if args_.search:
+        from db.fts_store import search
+        for hit in search(*args_.search):
+            print(f"{hit['score']:6.2f}  {hit['date'] or '':10}  {hit['title']}  ({hit['filename']})")
+            for snippet in (hit["notes_snippet"], hit["todos_snippet"]):
+                if snippet:
+                    print("        " + snippet.replace("\n", " / "))
+        return
+
+    if args_.bench_load:
+        from db.handler import compare_note_loaders, measure_notes_memory
+        serial_ms, parallel_ms = compare_note_loaders(args_.bench_load)
+        print(f"serial {serial_ms:.1f} ms, threaded {parallel_ms:.1f} ms ({serial_ms / max(parallel_ms, 1e-6):.2f}x)")
+        eager, lazy = measure_notes_memory(args_.bench_load), measure_notes_memory(args_.bench_load, lazy=True)
+        print(f"memory: eager {eager:.0f} bytes/note, lazy {lazy:.0f} bytes/note")
+        return
+
     logging.info("Hello world! This is Notes Manager!")
     register("args", args_)
+    register("durability", args_.durability)
+    register("autosave_delay", args_.autosave_delay)
     register("dirty", False)
     app.run(args_.web)
 
@@ -0,0 +1,169 @@
+###
+# File:   src\models\columns.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+from array import array
+from datetime import date as date_cls
+from typing import Dict, Iterable, List, Optional
+from models.dates import NO_DATE, date_key, date_ordinal, time_minutes
+
+
+# constants
+# Column value of a note without location
+NO_LOCATION = -1
+
+
+# functions/classes
+def count_open_todos(todos) -> int:
+    """Count the unchecked ("[ ]") entries of a note's todo lines."""
+    if not todos:
+        return 0
+    if isinstance(todos, str):
+        todos = todos.splitlines()
+    return sum(1 for line in todos if "[ ]" in line)
+
+
+class NoteColumns:
+    """Column-oriented side table of note metadata.
+
+    One row per note, stored in parallel arrays (date ordinal, time in
+    minutes, title id, location id, open-todo count) next to the note id.
+    Titles and locations are kept as ids into a symbol table. Rows are
+    maintained incrementally by NotesCollection (add/update/remove are
+    O(1); removal moves the last row into the hole), so sorting, filtering
+    and grouping the note list never touches the MeetingNote objects.
+    """
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.date_ord = array('l')
+        self.time_min = array('l')
+        self.title_id = array('l')
+        self.location_id = array('l')
+        self.open_todos = array('l')
+        self._row: Dict[str, int] = {}
+        self._symbols: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, note_id: str) -> bool:
+        return note_id in self._row
+
+    def symbol(self, name: str) -> int:
+        """Return the id of a title/location string, adding it if new."""
+        sid = self._symbols.get(name)
+        if sid is None:
+            sid = self._symbols[name] = len(self._names)
+            self._names.append(name)
+        return sid
+
+    def name(self, sid: int) -> Optional[str]:
+        """Return the string of a symbol id (None for NO_LOCATION)."""
+        return self._names[sid] if sid >= 0 else None
+
+    def _values(self, note, open_todos: Optional[int]) -> tuple:
+        if open_todos is None:
+            open_todos = count_open_todos(note.todos) if note.loaded else 0
+        return (
+            date_ordinal(note.date),
+            time_minutes(note.time),
+            self.symbol(note.title or ""),
+            self.symbol(note.location) if note.location else NO_LOCATION,
+            open_todos,
+        )
+
+    def add(self, note, open_todos: Optional[int] = None) -> None:
+        """Append a row for `note` (or refresh it if the note has one)."""
+        if note.id in self._row:
+            self.update(note, open_todos)
+            return
+        d, t, title, location, todos = self._values(note, open_todos)
+        self._row[note.id] = len(self.ids)
+        self.ids.append(note.id)
+        self.date_ord.append(d)
+        self.time_min.append(t)
+        self.title_id.append(title)
+        self.location_id.append(location)
+        self.open_todos.append(todos)
+
+    def update(self, note, open_todos: Optional[int] = None) -> None:
+        """Refresh the row of `note` after an edit."""
+        row = self._row.get(note.id)
+        if row is None:
+            self.add(note, open_todos)
+            return
+        if open_todos is None and not note.loaded:
+            open_todos = self.open_todos[row]
+        (self.date_ord[row], self.time_min[row], self.title_id[row],
+         self.location_id[row], self.open_todos[row]) = self._values(note, open_todos)
+
+    def remove(self, note_id: str) -> None:
+        """Drop the row of a note; the last row takes its place."""
+        row = self._row.pop(note_id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        if row != last:
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self._row[moved] = row
+            for column in (self.date_ord, self.time_min, self.title_id, self.location_id, self.open_todos):
+                column[row] = column[last]
+        self.ids.pop()
+        for column in (self.date_ord, self.time_min, self.title_id, self.location_id, self.open_todos):
+            column.pop()
+
+    def open_todo_count(self, note_id: str) -> int:
+        """Return the open-todo count of a note from the columns (0 if unknown)."""
+        row = self._row.get(note_id)
+        return 0 if row is None else self.open_todos[row]
+
+    def title(self, note_id: str) -> Optional[str]:
+        """Return the title of a note from the columns."""
+        row = self._row.get(note_id)
+        return None if row is None else self._names[self.title_id[row]]
+
+    def sorted_rows(self, rows: Optional[Iterable[int]] = None, newest_first: bool = True) -> List[int]:
+        """Return `rows` (default: all) ordered by date and time."""
+        date_ord, time_min = self.date_ord, self.time_min
+        rows = range(len(self.ids)) if rows is None else rows
+        return sorted(rows, key=lambda r: date_key(date_ord[r], time_min[r]), reverse=newest_first)
+
+    def filter_rows(self, location: Optional[str] = None, open_todos: bool = False,
+                    date_from: Optional[date_cls] = None, date_to: Optional[date_cls] = None) -> List[int]:
+        """Return the rows matching all given criteria."""
+        rows = range(len(self.ids))
+        if location is not None:
+            sid = self._symbols.get(location, -2)
+            rows = [r for r in rows if self.location_id[r] == sid]
+        if open_todos:
+            rows = [r for r in rows if self.open_todos[r] > 0]
+        if date_from is not None:
+            lo = date_from.toordinal()
+            rows = [r for r in rows if self.date_ord[r] >= lo]
+        if date_to is not None:
+            hi = date_to.toordinal()
+            rows = [r for r in rows if NO_DATE < self.date_ord[r] <= hi]
+        return list(rows)
+
+    def group_rows_by_month(self, rows: Optional[Iterable[int]] = None) -> Dict[str, List[int]]:
+        """Group rows by "YYYY-MM" of their date ("" for notes without a date)."""
+        groups: Dict[str, List[int]] = {}
+        months: Dict[int, str] = {}
+        for r in (range(len(self.ids)) if rows is None else rows):
+            d = self.date_ord[r]
+            key = months.get(d)
+            if key is None:
+                key = months[d] = date_cls.fromordinal(d).strftime("%Y-%m") if d > NO_DATE else ""
+            groups.setdefault(key, []).append(r)
+        return groups
+
+    def note_ids(self, rows: Iterable[int]) -> List[str]:
+        """Map rows to note ids."""
+        ids = self.ids
+        return [ids[r] for r in rows]
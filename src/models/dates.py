@@ -0,0 +1,144 @@
+###
+# File:   src\models\dates.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import logging
+import re
+from datetime import date as date_cls, datetime, time as time_cls
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+
+# constants
+# Date formats accepted for note dates, tried in order after ISO 8601
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d.%m.%y", "%d-%m-%Y", "%m/%d/%Y", "%Y/%m/%d", "%Y%m%d")
+
+# "HH:MM", "H.MM", "HH:MM:SS", "9:30 pm", "9 am"
+_TIME_RE = re.compile(r"^(\d{1,2})(?:[:.h](\d{2}))?(?::(\d{2}))?\s*([ap])?\.?(?:m\.?)?$", re.IGNORECASE)
+
+# Key value of a missing or unparseable date / time
+NO_DATE = 0
+NO_TIME = -1
+
+# Date weight of a sort key: the minutes of a day plus one slot for "no time",
+# so the keys of consecutive days never overlap
+_DAY = 1440 + 1
+
+# Number of offending values listed by report_unparseable
+_REPORT_SAMPLES = 10
+
+
+# functions/classes
+@lru_cache(maxsize=4096)
+def parse_date(value: Optional[str]) -> Optional[date_cls]:
+    """Parse a note date string (ISO or one of DATE_FORMATS); None if empty or unparseable."""
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=2048)
+def parse_time(value: Optional[str]) -> Optional[time_cls]:
+    """Parse a note time string ("HH:MM", "H.MM", "9:30 pm", ...); None if empty or unparseable."""
+    if not value or not value.strip():
+        return None
+    m = _TIME_RE.match(value.strip())
+    if m is None or (m.group(2) is None and m.group(4) is None):
+        return None
+    hours, minutes = int(m.group(1)), int(m.group(2) or 0)
+    meridiem = (m.group(4) or "").lower()
+    if meridiem:
+        if not 1 <= hours <= 12:
+            return None
+        hours = hours % 12 + (12 if meridiem == "p" else 0)
+    if hours > 23 or minutes > 59:
+        return None
+    return time_cls(hours, minutes)
+
+
+def date_ordinal(value: Optional[str]) -> int:
+    """Return the proleptic ordinal of a note date string, or NO_DATE."""
+    parsed = parse_date(value)
+    return NO_DATE if parsed is None else parsed.toordinal()
+
+
+def time_minutes(value: Optional[str]) -> int:
+    """Return minutes after midnight of a note time string, or NO_TIME."""
+    parsed = parse_time(value)
+    return NO_TIME if parsed is None else parsed.hour * 60 + parsed.minute
+
+
+def sort_key(date: Optional[str], time: Optional[str]) -> int:
+    """Return the canonical sortable key of a note's date and time.
+
+    Notes without a date sort before all dated ones; within a day notes
+    without a time sort first, and all keys of a day lie in
+    [day_key(d), day_key(d + 1)):
+
+    >>> last = sort_key("2025-10-31", "23:59")
+    >>> day_key(date_ordinal("2025-10-31")) <= last < day_key(date_ordinal("2025-11-01"))
+    True
+    >>> last < sort_key("2025-11-01", None) == day_key(date_ordinal("2025-11-01"))
+    True
+    """
+    return date_key(date_ordinal(date), time_minutes(time))
+
+
+def date_key(date_ord: int, time_min: int = NO_TIME) -> int:
+    """Return the sort key of a date ordinal and minutes after midnight (see sort_key)."""
+    return date_ord * _DAY + time_min + 1
+
+
+def day_key(date_ord: int) -> int:
+    """Return the smallest sort key of a day (its notes without a time)."""
+    return date_key(date_ord, NO_TIME)
+
+
+def iso_date(value: Optional[str]) -> Optional[str]:
+    """Return a note date as "YYYY-MM-DD", or None if it cannot be parsed."""
+    parsed = parse_date(value)
+    return None if parsed is None else parsed.isoformat()
+
+
+def iso_time(value: Optional[str]) -> Optional[str]:
+    """Return a note time as "HH:MM", or None if it cannot be parsed."""
+    parsed = parse_time(value)
+    return None if parsed is None else parsed.strftime("%H:%M")
+
+
+def unparseable(notes: Iterable) -> List[Tuple[object, str, str]]:
+    """Return (note, field, value) for every non-empty date/time that cannot be parsed."""
+    bad = []
+    for note in notes:
+        if note.date and parse_date(note.date) is None:
+            bad.append((note, "date", note.date))
+        if note.time and parse_time(note.time) is None:
+            bad.append((note, "time", note.time))
+    return bad
+
+
+def report_unparseable(notes: Iterable, source: str = "") -> List[Tuple[object, str, str]]:
+    """Log all unparseable dates/times of `notes` as one warning and return them.
+
+    Such notes keep their original strings and sort as undated/untimed.
+    """
+    bad = unparseable(notes)
+    if bad:
+        samples = ", ".join(f"'{note.title}' {name}={value!r}" for note, name, value in bad[:_REPORT_SAMPLES])
+        more = f" (+{len(bad) - _REPORT_SAMPLES} more)" if len(bad) > _REPORT_SAMPLES else ""
+        where = f" in '{source}'" if source else ""
+        logging.warning(f"{len(bad)} unrecognized date/time value(s){where}: {samples}{more}")
+    return bad
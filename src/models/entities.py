@@ -0,0 +1,151 @@
+###
+# File:   src\models\entities.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+from bisect import bisect_left, bisect_right, insort
+from datetime import date as date_cls
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from models.dates import NO_DATE, date_ordinal
+
+
+# constants
+# Date bound of a query: a note date string (any accepted format) or a date
+DateBound = Optional[Union[str, date_cls]]
+
+
+# functions/classes
+def normalize_name(name: Optional[str]) -> str:
+    """Return the index key of a participant or location: case-folded, single-spaced."""
+    return " ".join((name or "").split()).casefold()
+
+
+def date_bound(value: DateBound) -> Optional[int]:
+    """Return the date ordinal of a query bound, None for no (or an unparseable) bound."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, date_cls):
+        return value.toordinal()
+    ordinal = date_ordinal(value)
+    return None if ordinal == NO_DATE else ordinal
+
+
+class EntityIndex:
+    """Inverted index of a free-form note field (participants, location).
+
+    Every normalized name maps to a posting list of (date ordinal, note id)
+    sorted by date, so "all meetings of X between A and B" is two bisects
+    and a slice. The first spelling seen is kept for display. Maintained
+    incrementally by NotesCollection; lazy stubs are seeded from
+    collection.json, stubs of older files are `pending` until their names
+    are read.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, List[Tuple[int, str]]] = {}
+        self._display: Dict[str, str] = {}
+        # note id -> (date ordinal, names as entered)
+        self._entries: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+        self.pending: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def __contains__(self, note_id: str) -> bool:
+        return note_id in self._entries
+
+    def set(self, note_id: str, date_ord: int, names: Iterable[Optional[str]]) -> None:
+        """Replace the names of a note."""
+        self.remove(note_id)
+        entered = []
+        keys = set()
+        for name in names or ():
+            key = normalize_name(name)
+            if key and key not in keys:
+                keys.add(key)
+                entered.append(name.strip())
+                insort(self._postings.setdefault(key, []), (date_ord, note_id))
+                self._display.setdefault(key, " ".join(name.split()))
+        self._entries[note_id] = (date_ord, tuple(entered))
+
+    def update(self, note, names: Iterable[Optional[str]]) -> None:
+        """Re-index a note; a lazy stub keeps its known names under its current date."""
+        date_ord = date_ordinal(note.date)
+        if note.loaded:
+            self.pending.discard(note.id)
+            self.set(note.id, date_ord, names)
+        elif note.id in self._entries and self._entries[note.id][0] != date_ord:
+            self.set(note.id, date_ord, self._entries[note.id][1])
+
+    def mark_pending(self, note_id: str) -> None:
+        """Record a stub whose names are not known yet."""
+        self.pending.add(note_id)
+
+    def remove(self, note_id: str) -> None:
+        self.pending.discard(note_id)
+        entry = self._entries.pop(note_id, None)
+        if entry is None:
+            return
+        date_ord, names = entry
+        for key in {normalize_name(name) for name in names}:
+            postings = self._postings.get(key)
+            if postings is None:
+                continue
+            i = bisect_left(postings, (date_ord, note_id))
+            if i < len(postings) and postings[i] == (date_ord, note_id):
+                del postings[i]
+            if not postings:
+                del self._postings[key]
+                self._display.pop(key, None)
+
+    def names_of(self, note_id: str) -> Optional[List[str]]:
+        """Return the names of a note as entered (collection.json metadata), None if unknown."""
+        entry = self._entries.get(note_id)
+        return None if entry is None else list(entry[1])
+
+    def _range(self, key: str, date_from: DateBound, date_to: DateBound) -> Tuple[List[Tuple[int, str]], int, int]:
+        """Return the posting list of a key and the bounds of a date range in it."""
+        postings = self._postings.get(key, [])
+        lo_ord, hi_ord = date_bound(date_from), date_bound(date_to)
+        if lo_ord is None and hi_ord is None:
+            return postings, 0, len(postings)
+        # a date range never includes undated notes
+        lo = bisect_left(postings, (max(lo_ord or 0, NO_DATE + 1), ""))
+        hi = bisect_right(postings, (hi_ord, "\uffff")) if hi_ord is not None else len(postings)
+        return postings, lo, hi
+
+    def note_ids(self, name: str, date_from: DateBound = None, date_to: DateBound = None) -> List[str]:
+        """Return the ids of the notes naming `name`, oldest first, optionally within a date range."""
+        postings, lo, hi = self._range(normalize_name(name), date_from, date_to)
+        return [note_id for _date_ord, note_id in postings[lo:hi]]
+
+    def count(self, name: str, date_from: DateBound = None, date_to: DateBound = None) -> int:
+        """Return the number of notes naming `name` within a date range."""
+        _postings, lo, hi = self._range(normalize_name(name), date_from, date_to)
+        return max(0, hi - lo)
+
+    def match(self, query: str) -> List[str]:
+        """Return the keys whose words start with the words of `query` ("alex" -> "alex s")."""
+        words = normalize_name(query).split()
+        if not words:
+            return []
+        key = " ".join(words)
+        if key in self._postings:
+            return [key]
+        found = []
+        for candidate in self._postings:
+            parts = candidate.split()
+            if all(any(part.startswith(word) for part in parts) for word in words):
+                found.append(candidate)
+        return found
+
+    def display(self, name: str) -> Optional[str]:
+        """Return the display spelling of a name."""
+        return self._display.get(normalize_name(name))
+
+    def names(self) -> List[Tuple[str, int]]:
+        """Return (display name, number of notes) pairs, most frequent first."""
+        counts = [(self._display[key], len(postings)) for key, postings in self._postings.items()]
+        return sorted(counts, key=lambda pair: (-pair[1], pair[0].casefold()))
@@ -4,9 +4,17 @@
 # Author: Gemini
 ###
 
+import logging
 from dataclasses import dataclass, field
-from typing import List, Union, Optional
+from typing import Callable, Dict, FrozenSet, List, Set, Tuple, Union, Optional
+from uuid import uuid4
 from datetime import datetime, timezone
+from logic.pattern.observer import Observable
+from models.columns import NoteColumns
+from models.dates import date_ordinal, sort_key
+from models.entities import DateBound, EntityIndex
+from models.timeline import Timeline
+from models.todos import TodoIndex
 
 # Default values as specified
 DEFAULT_CATEGORIES = ["Standard", "Official", "Information", "Consulting"]
@@ -21,19 +29,27 @@ DEFAULT_TEMPLATES = {
     }
 }
 
-@dataclass
+# Storage engines of a collection (collection.json "storage" key)
+STORAGE_JSON = "json"
+STORAGE_SQLITE = "sqlite"
+STORAGE_JOURNAL = "journal"
+
+# Subject notified with the note whenever a note is marked dirty
+NOTE_DIRTY = "model.note.dirty"
+
+@dataclass(slots=True)
 class Module:
     """A Module contains a name and a list of text entries."""
     name: str
     content: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Template:
     """A Template is composed of one or more Modules."""
     name: str
     modules: List[Module] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class MeetingNote:
     """
     A MeetingNote holds the main content.
@@ -42,8 +58,9 @@ class MeetingNote:
     title: str
     category: str
     tags: List[str] = field(default_factory=list)
-    # The content can be one of these types (legacy / fallback)
-    content: Union[List[str], Template, List[Module], str] = field(default_factory=list)
+    # The content can be one of these types (legacy / fallback, unused by the
+    # JSON format; an empty string default costs no per-note list)
+    content: Union[List[str], Template, List[Module], str] = ""
 
     # Structured fields (one field per module) for easier persistence and flexibility
     topic: Optional[str] = None
@@ -56,20 +73,99 @@ class MeetingNote:
     # Timestamps
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    # Stable unique id, persisted with the note (survives renames)
+    id: str = field(default_factory=lambda: uuid4().hex, compare=False)
     # Dirty flag for optimized saving
     dirty: bool = False
+    # Names of the fields changed since the last persist (see mark_dirty);
+    # a shared empty frozenset until the first change
+    changes: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+    # Number of times the note was marked dirty (see clear_dirty)
+    edits: int = field(default=0, repr=False, compare=False)
+    # File name of the note inside its collection folder (if known)
+    filename: Optional[str] = field(default=None, compare=False)
+    # Content hash of the last persisted serialization (skips unchanged writes)
+    content_hash: Optional[str] = field(default=None, repr=False, compare=False)
+    # Lazy loading: returns the on-disk JSON dict of this note; None once loaded
+    loader: Optional[Callable[[], dict]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def loaded(self) -> bool:
+        """True when the note body (notes, todos, participants, ...) is in memory."""
+        return self.loader is None
+
+    @property
+    def sort_key(self) -> int:
+        """Canonical sortable key of `date` and `time` (see models.dates.sort_key).
+
+        The strings are kept as entered for display; parsing is cached, so
+        the key is computed once per distinct value.
+        """
+        return sort_key(self.date, self.time)
+
+    def ensure_loaded(self) -> bool:
+        """Fault in the note body from disk if this note is a metadata-only stub.
+
+        Returns True when the body is available, False if reading the note
+        file failed (the stub and its loader are kept, so a later call can
+        retry and the empty stub body is never taken for the real one).
+        """
+        loader = self.loader
+        if loader is None:
+            return True
 
-    def mark_dirty(self) -> None:
-        """Mark this note as modified and needing save."""
+        try:
+            full = MeetingNote.from_dict(loader())
+        except Exception as e:
+            logging.error(f"Failed to load body of note '{self.title}' ({self.filename}): {e}")
+            self.loader = loader
+            return False
+
+        for name in _BODY_FIELDS:
+            setattr(self, name, getattr(full, name))
+        self.loader = None
+        return True
+
+    def mark_dirty(self, *fields: str) -> None:
+        """Mark this note as modified and needing save; notifies NOTE_DIRTY observers.
+
+        `fields` names the changed attributes; without it every persisted
+        field counts as changed.
+        """
+        changed = set(fields) if fields else set(NOTE_FIELDS)
         try:
             self.dirty = True
+            self.changes = self.changes | changed
+            self.edits += 1
         except Exception:
             pass
 
-    def clear_dirty(self) -> None:
-        """Clear the dirty flag after successful save."""
+        Observable(NOTE_DIRTY).notify(self, changed)
+
+    def update_fields(self, **values) -> Set[str]:
+        """Assign the given fields, marking dirty only those whose value changed.
+
+        Returns the set of changed field names (empty if nothing changed).
+        """
+        changed = {name for name, value in values.items() if getattr(self, name) != value}
+        for name in changed:
+            setattr(self, name, values[name])
+        if changed:
+            self.mark_dirty(*changed)
+        return changed
+
+    def clear_dirty(self, edits: Optional[int] = None) -> None:
+        """Clear the dirty flag and the change set after successful save.
+
+        `edits` is the edit count read before the note was encoded for the
+        save: if it was marked dirty again since (an edit while the save
+        ran), the note stays dirty so the next save writes the edit.
+        """
+        if edits is not None and edits != self.edits:
+            return
         try:
             self.dirty = False
+            self.changes = frozenset()
         except Exception:
             pass
 
@@ -117,7 +213,7 @@ class MeetingNote:
         created_at = data.get("created_at")
         updated_at = data.get("updated_at")
 
-        return cls(
+        note = cls(
             title=title,
             category=category,
             tags=list(tags),
@@ -132,6 +228,19 @@ class MeetingNote:
             created_at=created_at,
             updated_at=updated_at,
         )
+        # notes written before ids existed get a fresh one
+        if data.get("id"):
+            note.id = data["id"]
+        return note
+
+# Fields copied from the note file when a lazily loaded note is faulted in
+_BODY_FIELDS = (
+    "category", "tags", "topic", "date", "time", "location",
+    "participants", "notes", "todos", "created_at", "updated_at",
+)
+
+# Persisted fields of a note (change-set vocabulary of mark_dirty)
+NOTE_FIELDS = ("title",) + _BODY_FIELDS
 
 @dataclass
 class NotesCollection:
@@ -145,6 +254,182 @@ class NotesCollection:
     locations: List[str] = field(default_factory=lambda: ["Online", "Office", "Conference Room"])
     created_at: str = field(default_factory=lambda: f"{datetime.now(timezone.utc).isoformat()}Z")
     updated_at: str = field(default_factory=lambda: f"{datetime.now(timezone.utc).isoformat()}Z")
+    # Storage engine of the collection: STORAGE_JSON, STORAGE_SQLITE or STORAGE_JOURNAL
+    storage: str = STORAGE_JSON
+    # Persistent note id -> note file name index (collection.json "filenames")
+    filenames: Dict[str, str] = field(default_factory=dict)
+    # Durability level of writes ("none", "file", "file+dir"); None uses the app default
+    durability: Optional[str] = None
+    # Content hash of the last persisted collection.json (skips unchanged writes)
+    content_hash: Optional[str] = field(default=None, repr=False, compare=False)
+    # Lookup indexes over `notes` (see reindex); keys of each note for updates
+    _by_id: Dict[str, "MeetingNote"] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_filename: Dict[str, "MeetingNote"] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_title_date: Dict[Tuple[str, Optional[str]], "MeetingNote"] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _keys: Dict[str, Tuple[Optional[str], Tuple[str, Optional[str]]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Column-oriented metadata of the notes for sorting/filtering (see models.columns)
+    columns: NoteColumns = field(default_factory=NoteColumns, init=False, repr=False, compare=False)
+    # Open todos of the notes by note, owner and date (see models.todos)
+    todos: TodoIndex = field(default_factory=TodoIndex, init=False, repr=False, compare=False)
+    # Participant / location -> date-sorted note ids (see models.entities)
+    participant_index: EntityIndex = field(default_factory=EntityIndex, init=False, repr=False, compare=False)
+    location_index: EntityIndex = field(default_factory=EntityIndex, init=False, repr=False, compare=False)
+    # Notes by date and time with month / ISO week buckets (see models.timeline)
+    timeline: Timeline = field(default_factory=Timeline, init=False, repr=False, compare=False)
+    # String table shared by the notes (participants, locations, categories, tags)
+    _strings: Dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def intern(self, value):
+        """Return the collection's shared copy of a string (other values pass through)."""
+        if not isinstance(value, str):
+            return value
+        return self._strings.setdefault(value, value)
+
+    def _intern_note(self, note: MeetingNote) -> None:
+        note.category = self.intern(note.category)
+        note.location = self.intern(note.location)
+        note.time = self.intern(note.time)
+        if note.participants:
+            note.participants[:] = [self.intern(p) for p in note.participants]
+        if note.tags:
+            note.tags[:] = [self.intern(t) for t in note.tags]
+
+    def reindex(self) -> None:
+        """Rebuild the lookup indexes from `notes` (after loading or bulk changes).
+
+        Also interns the repeated strings of the notes; bodies of lazy stubs
+        are interned when their note is next indexed.
+        """
+        self._by_id, self._by_filename, self._by_title_date, self._keys = {}, {}, {}, {}
+        self.columns = NoteColumns()
+        self.todos = TodoIndex()
+        self.participant_index = EntityIndex()
+        self.location_index = EntityIndex()
+        self.timeline = Timeline()
+        for note in self.notes:
+            self._index(note)
+
+    def _index(self, note: MeetingNote) -> None:
+        self._intern_note(note)
+        key = (note.title, note.date)
+        self._by_id[note.id] = note
+        if note.filename:
+            self._by_filename[note.filename] = note
+        self._by_title_date.setdefault(key, note)
+        self._keys[note.id] = (note.filename, key)
+        self.columns.add(note)
+        self.todos.update(note)
+        self.participant_index.update(note, note.participants)
+        self.location_index.update(note, [note.location])
+        self.timeline.update(note)
+
+    def _unindex(self, note: MeetingNote) -> None:
+        filename, key = self._keys.pop(note.id, (None, None))
+        self._by_id.pop(note.id, None)
+        if filename and self._by_filename.get(filename) is note:
+            del self._by_filename[filename]
+        if key and self._by_title_date.get(key) is note:
+            del self._by_title_date[key]
+
+    def get_note(self, note_id: str) -> Optional[MeetingNote]:
+        """Return the note with the given id, or None."""
+        return self._by_id.get(note_id)
+
+    def note_by_filename(self, filename: str) -> Optional[MeetingNote]:
+        """Return the note stored in `filename`, or None."""
+        return self._by_filename.get(filename)
+
+    def find_note(self, title: str, date: Optional[str] = None) -> Optional[MeetingNote]:
+        """Return the (first) note with the given title and date, or None."""
+        return self._by_title_date.get((title, date))
+
+    def add_note(self, note: MeetingNote) -> MeetingNote:
+        """Append a note and index it."""
+        self.notes.append(note)
+        self._index(note)
+        return note
+
+    def remove_note(self, note: MeetingNote) -> bool:
+        """Remove a note; returns False if it is not part of the collection."""
+        if self._by_id.get(note.id) is not note:
+            return False
+        self._unindex(note)
+        self.columns.remove(note.id)
+        self.todos.remove(note.id)
+        self.participant_index.remove(note.id)
+        self.location_index.remove(note.id)
+        self.timeline.remove(note.id)
+        self.notes.remove(note)
+        return True
+
+    def update_note(self, note: MeetingNote) -> None:
+        """Refresh the index entries, columns and open todos of a note after an edit."""
+        if self._by_id.get(note.id) is not note:
+            return
+        self._unindex(note)
+        self._index(note)
+
+    def seed_names(self, note: MeetingNote, participants: Optional[List[str]], location: Optional[str]) -> None:
+        """Index the participants and location of a stub from collection.json (None: not stored)."""
+        if participants is None:
+            self.participant_index.mark_pending(note.id)
+            self.location_index.mark_pending(note.id)
+            return
+        date_ord = date_ordinal(note.date)
+        self.participant_index.set(note.id, date_ord, participants)
+        self.location_index.set(note.id, date_ord, [location])
+
+    def name_metadata(self, note: MeetingNote) -> dict:
+        """Return the participants and location of a note for collection.json (None while unknown)."""
+        if note.loaded:
+            return {"participants": list(note.participants or []), "location": note.location or None}
+        locations = self.location_index.names_of(note.id)
+        return {
+            "participants": self.participant_index.names_of(note.id),
+            "location": locations[0] if locations else None,
+        }
+
+    def resolve_names(self) -> None:
+        """Read the participants and location of stubs from older files (once), without faulting them in."""
+        for note_id in self.participant_index.pending | self.location_index.pending:
+            note = self._by_id.get(note_id)
+            self.participant_index.pending.discard(note_id)
+            self.location_index.pending.discard(note_id)
+            if note is None:
+                continue
+            try:
+                data = note.loader() if not note.loaded else {"participants": note.participants, "location": note.location}
+            except Exception as e:
+                logging.warning(f"Could not read participants of note '{note.title}' ({note.filename}): {e}")
+                continue
+            participants = data.get("participants") or []
+            if isinstance(participants, str):
+                participants = [p.strip() for p in participants.splitlines() if p.strip()]
+            self.seed_names(note, participants, data.get("location"))
+
+    def _notes_of(self, index: EntityIndex, name: str, date_from: DateBound, date_to: DateBound) -> List[MeetingNote]:
+        if index.pending:
+            self.resolve_names()
+        return [self._by_id[note_id] for note_id in index.note_ids(name, date_from, date_to)]
+
+    def notes_with(self, participant: str, date_from: DateBound = None, date_to: DateBound = None) -> List[MeetingNote]:
+        """Return the notes `participant` attended, oldest first, optionally within a date range.
+
+        Names match case- and space-insensitively; bounds are inclusive
+        note dates (strings in any accepted format or dates).
+        """
+        return self._notes_of(self.participant_index, participant, date_from, date_to)
+
+    def notes_at(self, location: str, date_from: DateBound = None, date_to: DateBound = None) -> List[MeetingNote]:
+        """Return the notes held at `location`, oldest first, optionally within a date range."""
+        return self._notes_of(self.location_index, location, date_from, date_to)
+
+    def attendance(self, date_from: DateBound = None, date_to: DateBound = None) -> List[Tuple[str, int]]:
+        """Return (participant, number of meetings) within a date range, most meetings first."""
+        if self.participant_index.pending:
+            self.resolve_names()
+        counts = [(name, self.participant_index.count(name, date_from, date_to)) for name, _total in self.participant_index.names()]
+        return sorted([pair for pair in counts if pair[1]], key=lambda pair: (-pair[1], pair[0].casefold()))
 
     @classmethod
     def from_dict(cls, data: dict) -> "NotesCollection":
@@ -165,6 +450,16 @@ class NotesCollection:
         coll.categories = list(data.get("categories", []) or [])
         coll.tags = list(data.get("tags", []) or [])
         coll.locations = list(data.get("locations", []) or [])
+        coll.storage = data.get("storage") or STORAGE_JSON
+        coll.durability = data.get("durability")
+        coll.content_hash = data.get("content_hash")
+        # Derived from the note list, which also covers older files whose
+        # "filenames" index is keyed by title
+        coll.filenames = {
+            note_meta["id"]: note_meta["filename"]
+            for note_meta in data.get("notes", []) or []
+            if isinstance(note_meta, dict) and note_meta.get("id") and note_meta.get("filename")
+        }
 
         # Notes list is handled by loader which will append MeetingNote instances.
         return coll
@@ -0,0 +1,160 @@
+###
+# File:   src\models\timeline.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+from bisect import bisect_left
+from datetime import date as date_cls
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from models.dates import NO_DATE, date_ordinal, day_key, sort_key
+from models.entities import DateBound, date_bound
+
+
+# constants
+# Bucket of notes without a (parseable) date
+NO_BUCKET = ""
+
+
+# functions/classes
+@lru_cache(maxsize=4096)
+def month_key(date_ord: int) -> str:
+    """Return the "YYYY-MM" bucket of a date ordinal (NO_BUCKET for no date)."""
+    return date_cls.fromordinal(date_ord).strftime("%Y-%m") if date_ord > NO_DATE else NO_BUCKET
+
+
+@lru_cache(maxsize=4096)
+def week_key(date_ord: int) -> str:
+    """Return the ISO week bucket "YYYY-Www" of a date ordinal (NO_BUCKET for no date)."""
+    if date_ord <= NO_DATE:
+        return NO_BUCKET
+    year, week, _day = date_cls.fromordinal(date_ord).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _bucket_days(bucket: str) -> Tuple[int, int]:
+    """Return the first day ordinal of a month/week bucket and of the one after it."""
+    if "-W" in bucket:
+        year, week = bucket.split("-W")
+        first = date_cls.fromisocalendar(int(year), int(week), 1).toordinal()
+        return first, first + 7
+    year, month = (int(part) for part in bucket.split("-"))
+    first = date_cls(year, month, 1).toordinal()
+    return first, (date_cls(year + 1, 1, 1) if month == 12 else date_cls(year, month + 1, 1)).toordinal()
+
+
+class Timeline:
+    """Notes ordered by their parsed date and time, with month and ISO week buckets.
+
+    Keeps (sort key, note id) pairs sorted (see models.dates.sort_key) plus
+    note counts per month and per week. Range, month and week queries are
+    a bisect and a slice, O(log n + k). Maintained incrementally by
+    NotesCollection; out of order additions are sorted on the next query.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[int, str]] = []
+        self._sorted = True
+        # note id -> (sort key, date ordinal)
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self.months: Dict[str, int] = {}
+        self.weeks: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, note_id: str) -> bool:
+        return note_id in self._entries
+
+    def _ordered(self) -> List[Tuple[int, str]]:
+        if not self._sorted:
+            self._keys.sort()
+            self._sorted = True
+        return self._keys
+
+    def add(self, note_id: str, date: str, time: str) -> None:
+        """Add (or move) a note by its date and time strings."""
+        key, date_ord = sort_key(date, time), date_ordinal(date)
+        entry = self._entries.get(note_id)
+        if entry == (key, date_ord):
+            return
+        if entry is not None:
+            self.remove(note_id)
+        self._entries[note_id] = (key, date_ord)
+        if self._keys and (key, note_id) < self._keys[-1]:
+            # sorted once on the next query: a bulk load sorts once, an edit is a near-sorted pass
+            self._sorted = False
+        self._keys.append((key, note_id))
+        self._count(date_ord, 1)
+
+    def update(self, note) -> None:
+        self.add(note.id, note.date, note.time)
+
+    def remove(self, note_id: str) -> None:
+        entry = self._entries.pop(note_id, None)
+        if entry is None:
+            return
+        keys = self._ordered()
+        i = bisect_left(keys, (entry[0], note_id))
+        if i < len(keys) and keys[i] == (entry[0], note_id):
+            del keys[i]
+        self._count(entry[1], -1)
+
+    def _count(self, date_ord: int, delta: int) -> None:
+        for buckets, bucket in ((self.months, month_key(date_ord)), (self.weeks, week_key(date_ord))):
+            count = buckets.get(bucket, 0) + delta
+            if count:
+                buckets[bucket] = count
+            else:
+                buckets.pop(bucket, None)
+
+    def _slice(self, lo_day: int, hi_day: int, newest_first: bool) -> List[str]:
+        """Return the ids of notes dated in [lo_day, hi_day) (day ordinals)."""
+        keys = self._ordered()
+        lo = bisect_left(keys, (day_key(lo_day), ""))
+        hi = bisect_left(keys, (day_key(hi_day), ""))
+        ids = [note_id for _key, note_id in keys[lo:hi]]
+        return ids[::-1] if newest_first else ids
+
+    def ids(self, newest_first: bool = True) -> List[str]:
+        """Return all note ids in timeline order (undated notes last when newest first)."""
+        ids = [note_id for _key, note_id in self._ordered()]
+        return ids[::-1] if newest_first else ids
+
+    def range(self, date_from: DateBound = None, date_to: DateBound = None, newest_first: bool = True) -> List[str]:
+        """Return the ids of the notes dated from `date_from` to `date_to` (inclusive; undated notes never match)."""
+        lo = date_bound(date_from)
+        hi = date_bound(date_to)
+        return self._slice(max(lo or 0, NO_DATE + 1), (hi + 1) if hi is not None else 10 ** 7, newest_first)
+
+    def bucket(self, bucket: str, newest_first: bool = True) -> List[str]:
+        """Return the ids of the notes of a month ("YYYY-MM") or ISO week ("YYYY-Www") bucket.
+
+        A note at the very end of a month stays in it:
+
+        >>> timeline = Timeline()
+        >>> timeline.add("late", "2025-10-31", "23:59")
+        >>> timeline.add("next", "2025-11-01", None)
+        >>> timeline.bucket("2025-10"), timeline.bucket_of("late"), timeline.range("2025-10-31", "2025-10-31")
+        (['late'], '2025-10', ['late'])
+        """
+        if bucket == NO_BUCKET:
+            return self._slice(NO_DATE, NO_DATE + 1, newest_first)
+        return self._slice(*_bucket_days(bucket), newest_first)
+
+    def bucket_of(self, note_id: str, weeks: bool = False) -> str:
+        """Return the month (or week) bucket of a note."""
+        entry = self._entries.get(note_id)
+        date_ord = entry[1] if entry is not None else NO_DATE
+        return week_key(date_ord) if weeks else month_key(date_ord)
+
+    def buckets(self, weeks: bool = False, newest_first: bool = True) -> List[Tuple[str, int]]:
+        """Return (bucket, note count) pairs of the months (or weeks), undated notes last."""
+        counts = self.weeks if weeks else self.months
+        dated = sorted((bucket for bucket in counts if bucket != NO_BUCKET), reverse=newest_first)
+        pairs = [(bucket, counts[bucket]) for bucket in dated]
+        if NO_BUCKET in counts:
+            pairs.append((NO_BUCKET, counts[NO_BUCKET]))
+        return pairs
@@ -0,0 +1,216 @@
+###
+# File:   src\models\todos.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import logging
+import re
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from models.dates import NO_DATE, date_ordinal
+
+
+# constants
+# Owner argument of TodoIndex.items matching every owner (None means unassigned)
+ANY = object()
+
+# "- [ ] ", "[x] ", "-[] " ... in front of a todo line
+_MARKER_RE = re.compile(r'^\s*-?\s*\[[xX\s]?\]\s*')
+
+
+# functions/classes
+def todo_text(line: str) -> str:
+    """Return a todo line without its checkbox marker."""
+    return _MARKER_RE.sub('', line).strip()
+
+
+def is_open(line: str) -> bool:
+    """True for an unchecked ("[ ]") todo line (see models.columns.count_open_todos)."""
+    return "[ ]" in line
+
+
+def _owner_patterns(participants: Iterable[str]) -> List[Tuple[re.Pattern, str]]:
+    """Patterns finding a participant (full name first, then first name) in a todo."""
+    patterns = []
+    for participant in participants or ():
+        names = [participant]
+        first = participant.split()[0] if participant.split() else ""
+        if first != participant:
+            names.append(first)
+        for name in names:
+            if len(name) >= 2:
+                patterns.append((re.compile(rf"(?<!\w)@?{re.escape(name)}(?!\w)", re.IGNORECASE), participant))
+    return patterns
+
+
+def open_todos(todos, participants: Iterable[str] = ()) -> List[Tuple[int, str, Optional[str]]]:
+    """Return (line index, text, owner) of the open todos of a note.
+
+    The owner is the first participant of the note named in the todo
+    ("Alex S", "Alex" or "@Alex"), otherwise None.
+    """
+    if not todos:
+        return []
+    if isinstance(todos, str):
+        todos = todos.splitlines()
+    patterns = None
+    found = []
+    for index, line in enumerate(todos):
+        if not line or not is_open(line):
+            continue
+        if patterns is None:
+            patterns = _owner_patterns(participants)
+        text = todo_text(line)
+        owner = next((participant for pattern, participant in patterns if pattern.search(text)), None)
+        found.append((index, text, owner))
+    return found
+
+
+def open_todo_items(collection, note) -> Optional[List[list]]:
+    """Return the open todos of a note as stored in collection.json: [index, text, owner] lists.
+
+    None for a stub whose todos are not known (pending).
+    """
+    if note.loaded:
+        return [list(item) for item in open_todos(note.todos, note.participants)]
+    if note.id in collection.todos.pending:
+        return None
+    return collection.todos.note_items(note.id)
+
+
+@dataclass(frozen=True)
+class OpenTodo:
+    """One unchecked todo line of a note."""
+    note_id: str
+    index: int
+    text: str
+    owner: Optional[str]
+    date_ord: int
+
+
+class TodoIndex:
+    """Open todos of a collection, keyed by note id, owner and date.
+
+    Maintained incrementally by NotesCollection next to its columns, so
+    listing the open todos of thousands of notes never touches a note
+    body. Lazy stubs are seeded from the open todos stored in
+    collection.json; stubs of older files only have a count and are
+    `pending` until `resolve` reads them.
+    """
+
+    def __init__(self) -> None:
+        self._items: Dict[str, Tuple[OpenTodo, ...]] = {}
+        self._date: Dict[str, int] = {}
+        # (date ordinal, note id) of every note with open todos, sorted
+        self._by_date: List[Tuple[int, str]] = []
+        # owner (None = unassigned) -> note id -> number of open todos
+        self._by_owner: Dict[Optional[str], Dict[str, int]] = {}
+        self.pending: Set[str] = set()
+        # bumped on every change, lets views skip unchanged re-renders
+        self.version = 0
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._items.values())
+
+    def __contains__(self, note_id: str) -> bool:
+        return note_id in self._items
+
+    def set_items(self, note_id: str, date_ord: int, items: Iterable[Tuple[int, str, Optional[str]]]) -> None:
+        """Replace the open todos of a note by (line index, text, owner) triples."""
+        self.remove(note_id)
+        todos = tuple(OpenTodo(note_id, index, text, owner, date_ord) for index, text, owner in items)
+        if not todos:
+            return
+        self.version += 1
+        self._items[note_id] = todos
+        self._date[note_id] = date_ord
+        insort(self._by_date, (date_ord, note_id))
+        for todo in todos:
+            owned = self._by_owner.setdefault(todo.owner, {})
+            owned[note_id] = owned.get(note_id, 0) + 1
+
+    def update(self, note) -> None:
+        """Re-index a note; a lazy stub keeps its known todos under its current date."""
+        date_ord = date_ordinal(note.date)
+        if note.loaded:
+            self.pending.discard(note.id)
+            self.set_items(note.id, date_ord, open_todos(note.todos, note.participants))
+        elif note.id in self._items and self._date[note.id] != date_ord:
+            items = [(todo.index, todo.text, todo.owner) for todo in self._items[note.id]]
+            self.set_items(note.id, date_ord, items)
+
+    def mark_pending(self, note_id: str) -> None:
+        """Record a stub with open todos whose lines are not known yet."""
+        self.pending.add(note_id)
+        self.version += 1
+
+    def remove(self, note_id: str) -> None:
+        self.pending.discard(note_id)
+        todos = self._items.pop(note_id, None)
+        if todos is None:
+            return
+        date_ord = self._date.pop(note_id)
+        i = bisect_left(self._by_date, (date_ord, note_id))
+        if i < len(self._by_date) and self._by_date[i] == (date_ord, note_id):
+            del self._by_date[i]
+        for todo in todos:
+            owned = self._by_owner.get(todo.owner)
+            if owned is not None and owned.pop(note_id, None) is not None and not owned:
+                del self._by_owner[todo.owner]
+        self.version += 1
+
+    def resolve(self, get_note: Callable[[str], object]) -> int:
+        """Read the todos of pending stubs without faulting their bodies in; returns the number read."""
+        resolved = 0
+        for note_id in list(self.pending):
+            note = get_note(note_id)
+            self.pending.discard(note_id)
+            if note is None:
+                continue
+            if note.loaded:
+                self.update(note)
+            else:
+                try:
+                    data = note.loader() or {}
+                except Exception as e:
+                    logging.warning(f"Could not read the todos of note '{note.title}' ({note.filename}): {e}")
+                    continue
+                self.set_items(note_id, date_ordinal(note.date), open_todos(data.get("todos"), data.get("participants")))
+            resolved += 1
+        return resolved
+
+    def note_items(self, note_id: str) -> List[list]:
+        """Return the open todos of a note as [index, text, owner] lists (collection.json metadata)."""
+        return [[todo.index, todo.text, todo.owner] for todo in self._items.get(note_id, ())]
+
+    def items(self, owner=ANY, date_from: Optional[str] = None, date_to: Optional[str] = None,
+              newest_first: bool = True) -> List[OpenTodo]:
+        """Return the open todos, optionally of one owner (None = unassigned) and a date range.
+
+        Undated notes are only included without a range; notes are ordered
+        by date, their todos by line.
+        """
+        lo, hi = 0, len(self._by_date)
+        if date_from or date_to:
+            lo = bisect_left(self._by_date, (max(date_ordinal(date_from), NO_DATE + 1), ""))
+        if date_to and date_ordinal(date_to) != NO_DATE:
+            hi = bisect_right(self._by_date, (date_ordinal(date_to), "\uffff"))
+        rows = self._by_date[lo:hi]
+        if newest_first:
+            rows = reversed(rows)
+
+        owned = None if owner is ANY else self._by_owner.get(owner, {})
+        found = []
+        for _date_ord, note_id in rows:
+            if owned is not None and note_id not in owned:
+                continue
+            found.extend(todo for todo in self._items[note_id] if owned is None or todo.owner == owner)
+        return found
+
+    def owners(self) -> List[Tuple[Optional[str], int]]:
+        """Return (owner, open todo count) pairs, most todos first; None is unassigned."""
+        counts = [(owner, sum(owned.values())) for owner, owned in self._by_owner.items()]
+        return sorted(counts, key=lambda pair: (-pair[1], pair[0] or ""))
@@ -196,12 +196,13 @@ def ui(page_:Page) -> None:
     registry.subjects["ui.menu.file.close"].register(handle_menu_item_click)
     registry.subjects["ui.menu.file.about"].register(handle_menu_item_click)
     registry.subjects["ui.menu.file.quit"].register(handle_menu_item_click)
+    registry.subjects["ui.menu.search"].register(handle_menu_item_click)
     register("ui.contentBar", content.build(layout(page_)))
     page_.add(registry.ui.contentBar)
-    #page_.add(register("ui.statusBar", status.build()))
+    page_.add(register("ui.statusBar", status.build()))
 
     page_.on_keyboard_event = _handle_keyboard_event
-    #status.updateStatus("Ready.")
+    status.updateStatus("Ready.")
 
 
 def run(web:bool=False) -> None:
@@ -5,9 +5,14 @@
 ###
 
 import flet as ft
+from logic.fuzzy import TrigramIndex
 
 class CustomMenu(ft.Column):
-    """A custom menu control with a dropdown, and an option to add new items."""
+    """A custom menu control with a dropdown, and an option to add new items.
+
+    While a new item is typed, similar existing items are offered (fuzzy,
+    see logic.fuzzy) so near-duplicates like "Conference room" are avoided.
+    """
 
     def __init__(self, page, items, selected_item):
         """Initializes the CustomMenu control.
@@ -21,6 +26,7 @@ class CustomMenu(ft.Column):
         self.page = page
         self.items = items
         self.selected_item = selected_item
+        self.matcher = TrigramIndex(items)
 
         self.dropdown = ft.Dropdown(
             options=[ft.dropdown.Option(item) for item in self.items],
@@ -31,7 +37,7 @@ class CustomMenu(ft.Column):
             on_click=self.add_clicked,
         )
         self.new_item_field = ft.TextField(
-            visible=False, width=200, on_submit=self.confirm_clicked
+            visible=False, width=200, on_submit=self.confirm_clicked, on_change=self.new_item_changed
         )
         self.confirm_button = ft.IconButton(
             icon=ft.Icons.CHECK,
@@ -44,6 +50,8 @@ class CustomMenu(ft.Column):
             visible=False,
         )
 
+        self.suggestions = ft.Row(visible=False, wrap=True)
+
         self.controls = [
             ft.Row(
                 controls=[
@@ -53,7 +61,8 @@ class CustomMenu(ft.Column):
                     self.confirm_button,
                     self.cancel_button,
                 ]
-            )
+            ),
+            self.suggestions,
         ]
 
     def add_clicked(self, e):
@@ -70,6 +79,7 @@ class CustomMenu(ft.Column):
         new_item = self.new_item_field.value
         if len(new_item) >= 5:
             self.items.append(new_item)
+            self.matcher.add(new_item)
             self.dropdown.options.append(ft.dropdown.Option(new_item))
             self.dropdown.value = new_item
             self.selected_item = new_item
@@ -78,6 +88,22 @@ class CustomMenu(ft.Column):
             self.new_item_field.error_text = "Item must be at least 5 characters long!"
             self.page.update()
 
+    def new_item_changed(self, e):
+        """Offers existing items similar to the one being typed."""
+        value = (self.new_item_field.value or "").strip()
+        hits = [item for item, _score in self.matcher.search(value, k=5, partial=True)] if len(value) >= 2 else []
+        self.suggestions.controls = [
+            ft.TextButton(item, on_click=lambda e, item=item: self.suggestion_clicked(item)) for item in hits
+        ]
+        self.suggestions.visible = bool(hits)
+        self.page.update()
+
+    def suggestion_clicked(self, item):
+        """Selects an existing item instead of adding a new one."""
+        self.dropdown.value = item
+        self.selected_item = item
+        self.hide_new_item_widgets()
+
     def cancel_clicked(self, e):
         """Handles the click event of the cancel button."""
         self.hide_new_item_widgets()
@@ -88,6 +114,7 @@ class CustomMenu(ft.Column):
         self.new_item_field.visible = False
         self.confirm_button.visible = False
         self.cancel_button.visible = False
+        self.suggestions.visible = False
         self.new_item_field.value = ""
         self.new_item_field.error_text = ""
         self.page.update()
@@ -7,6 +7,7 @@
 import flet as ft
 from datetime import datetime
 from db import registry
+from models.dates import parse_date
 
 
 class DateSelector(ft.Row):
@@ -54,18 +55,8 @@ class DateSelector(ft.Row):
             except Exception:
                 pass
 
-        # parse current date value
-        try:
-            ts = (self.date_field.value or "").strip()
-            yyyy, mm, dd = ts.split("-", 2)
-            yyyy = int(yyyy)
-            mm = int(mm)
-            dd = int(dd)
-            # create a full datetime using the parsed date 
-            _date = datetime.now().replace(year=yyyy, month=mm, day=dd).date()
-        except Exception:
-            # fallback to today's date
-            _date = datetime.now().date()
+        # parse current date value (any format models.dates accepts), fallback to today's date
+        _date = parse_date(self.date_field.value) or datetime.now().date()
 
         dialog = ft.DatePicker(
             value=_date,
@@ -79,5 +70,5 @@ class DateSelector(ft.Row):
         self.page.open(dialog)
 
     def get_value(self) -> str:
-        """Return the current date text as string (YYYY-MM-DD)."""
+        """Return the current date text as entered (the picker writes YYYY-MM-DD)."""
         return (self.date_field.value or "").strip()
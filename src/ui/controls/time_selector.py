@@ -7,6 +7,7 @@
 import flet as ft
 from datetime import datetime, time as dt_time
 from db import registry
+from models.dates import parse_time
 
 
 class TimeSelector(ft.Row):
@@ -52,16 +53,12 @@ class TimeSelector(ft.Row):
             except Exception:
                 pass
 
-        # parse current time value
-        try:
-            ts = (self.time_field.value or "").strip()
-            h_str, m_str = ts.split(":", 1)
-            h = int(h_str) % 24
-            m = int(m_str) % 60
-            # create a full datetime using today's date and the parsed time
-            _time = datetime.now().replace(hour=h, minute=m, second=0, microsecond=0)
-        except Exception:
-            # fallback to current time (rounded to second)
+        # parse current time value (any format models.dates accepts) onto today's date,
+        # fallback to current time (rounded to minute)
+        _parsed = parse_time(self.time_field.value)
+        if _parsed is not None:
+            _time = datetime.now().replace(hour=_parsed.hour, minute=_parsed.minute, second=0, microsecond=0)
+        else:
             _time = datetime.now().replace(second=0, microsecond=0)
 
         dialog = ft.TimePicker(
@@ -76,5 +73,5 @@ class TimeSelector(ft.Row):
         self.page.open(dialog)
 
     def get_value(self) -> str:
-        """Return the current time text as string (HH:MM)."""
+        """Return the current time text as entered (the picker writes HH:MM)."""
         return (self.time_field.value or "").strip()
@@ -0,0 +1,136 @@
+###
+# File:   src\ui\dialogs\workspace_search.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+
+# imports
+import logging
+from os import path
+from flet import (
+    AlertDialog, Colors, Column, ElevatedButton, FontWeight, Icons, IconButton,
+    ListTile, ListView, Page, ProgressBar, Row, Text, TextField, TextSpan, TextStyle
+)
+from db.fts_store import HIGHLIGHT
+from logic import workspace
+
+
+# constants
+_WIDTH = 720
+_HEIGHT = 480
+
+
+# variables
+_running = None
+
+
+# functions/classes
+def _snippet_text(snippet: str) -> Text:
+    """Render a search snippet with its highlighted words in bold."""
+    parts = snippet.replace("\n", " / ").split(HIGHLIGHT[0])
+    spans = [
+        TextSpan(part, TextStyle(weight=FontWeight.BOLD, color=Colors.AMBER) if i % 2 else None)
+        for i, part in enumerate(parts) if part
+    ]
+    return Text(spans=spans, size=12, color=Colors.WHITE70)
+
+
+def _hit_tile(hit: dict, on_click) -> ListTile:
+    """One result line: title, collection and date, snippets."""
+    details = [Text(f"{path.basename(hit['collection'])}  ·  {hit['date'] or 'no date'}", size=12, color=Colors.WHITE54)]
+    details += [_snippet_text(s) for s in (hit["notes_snippet"], hit["todos_snippet"]) if s]
+    return ListTile(
+        title=Text(hit["title"] or "Untitled"),
+        subtitle=Column(details, spacing=2, tight=True),
+        on_click=lambda e, hit_=hit: on_click(hit_),
+    )
+
+
+def show(page: Page, open_hit: callable) -> None:
+    """Show the workspace search dialog.
+
+    Every collection below DATA_ROOT is searched; results stream in as
+    each collection finishes. Clicking a result calls `open_hit(page, hit)`.
+    """
+
+    def _cancel_running() -> None:
+        global _running
+        if _running is not None:
+            _running.cancel()
+            _running = None
+
+    def _close(e=None) -> None:
+        _cancel_running()
+        page.close(dialog)
+
+    def _clicked(hit: dict) -> None:
+        _close()
+        open_hit(page, hit)
+
+    def _on_results(search, hits: list, done: int, total: int) -> None:
+        if search.cancelled:
+            return
+        results.controls = [_hit_tile(hit, _clicked) for hit in hits]
+        progress.visible = done < total
+        progress.value = done / total if total else None
+        if total == 0:
+            status.value = "No collections found."
+        elif done < total:
+            status.value = f"{len(hits)} result(s), searched {done} of {total} collection(s)..."
+        else:
+            status.value = f"{len(hits)} result(s) in {total} collection(s)."
+        try:
+            dialog.update()
+        except Exception:
+            # the dialog was closed meanwhile
+            logging.debug("workspace search: dialog gone, result dropped")
+
+    def _search(e=None) -> None:
+        global _running
+        _cancel_running()
+        query = (query_field.value or "").strip()
+        results.controls.clear()
+        if not query:
+            status.value = ""
+            progress.visible = False
+            dialog.update()
+            return
+
+        status.value = "Searching..."
+        progress.value = None
+        progress.visible = True
+        dialog.update()
+        search = workspace.WorkspaceSearch(query, lambda hits, done, total: _on_results(search, hits, done, total))
+        _running = search.start()
+
+    query_field = TextField(
+        hint_text='Words, "a phrase", word*, OR / NOT',
+        autofocus=True,
+        expand=True,
+        on_submit=_search,
+    )
+    status = Text("", size=12, color=Colors.WHITE70)
+    progress = ProgressBar(value=0, visible=False, color=Colors.GREEN_400, bgcolor=Colors.GREY_600)
+    results = ListView(expand=True, spacing=0)
+
+    dialog = AlertDialog(
+        title=Text("Search all collections", size=18),
+        bgcolor=Colors.GREY_900,
+        modal=True,
+        content=Column(
+            [
+                Row([query_field, IconButton(Icons.SEARCH, tooltip="Search", on_click=_search)]),
+                progress,
+                status,
+                results,
+            ],
+            width=_WIDTH,
+            height=_HEIGHT,
+        ),
+        actions=[
+            ElevatedButton("Close", on_click=_close),
+        ],
+    )
+
+    page.open(dialog)
@@ -161,6 +161,12 @@ def build(**kwargs) -> Row:
             #         )
             #     ],
             # ),
+            _search := MenuItemButton(
+                content=Icon(Icons.TRAVEL_EXPLORE),
+                style=_style,
+                tooltip="Search all collections",
+                on_click=lambda e: registry.subjects["ui.menu.search"].notify(e),
+            ),
             MenuItemButton(
                 content=registry.ui.noteTitle,
                 style=_style,
@@ -182,6 +188,7 @@ def build(**kwargs) -> Row:
         pass
 
     register("ui.menu.drawer", _hm)
+    register("ui.menu.search", _search)
     register("ui.menu.file.new", _smb.controls[0])
     register("ui.menu.file.open", _smb.controls[1])
     register("ui.menu.file.save", _smb.controls[2])
@@ -198,6 +205,7 @@ def build(**kwargs) -> Row:
     registry.subjects.register("ui.menu.file.close")
     registry.subjects.register("ui.menu.file.about")
     registry.subjects.register("ui.menu.file.quit")
+    registry.subjects.register("ui.menu.search")
     #registry.subjects.register("ui.menu.manage.categories")
     registry.subjects.register("ui.menu.drawer")
     registry.subjects["ui.menu.drawer"].register(_toggle_sidebar)
@@ -11,15 +11,20 @@ from os import path
 from pathlib import Path
 from flet import (
     Checkbox, Column, Text, Row, Colors, Divider, Container, TextField, SnackBar,
-    ScrollMode, ElevatedButton, IconButton, Icons, VerticalAlignment, MainAxisAlignment
+    ScrollMode, ElevatedButton, IconButton, Icons, VerticalAlignment, MainAxisAlignment, TextButton
     )
 from db import registry, register
 from logic.persistence import export_markdown, save_notes
+from logic import search
 from logic.log import info
+from logic.pattern.observer import Observable
+from logic.ui import TODOS_CHANGED
 from logic.ui.window import updateWindowTitle, updateWindowState, WindowState
 from ui.controls.custom_menu import CustomMenu
 from ui.controls.time_selector import TimeSelector
 from ui.controls.date_selector import DateSelector
+from ui.panels.status import updateStatus
+from models.dates import unparseable
 from ui.views import preview
 
 
@@ -38,6 +43,7 @@ def build_note_view(page, note_data: dict | None, title_fallback: str = "") -> C
     if not note_data:
         return Column(controls=[Text("(No note selected)")])
 
+    _ensure_body(note_data)
     editing = bool(note_data.get("_editing", False))
 
     header = _build_header(page, note_data, title_fallback, editing)
@@ -49,6 +55,28 @@ def build_note_view(page, note_data: dict | None, title_fallback: str = "") -> C
         )
 
 
+def _ensure_body(note_data: dict) -> None:
+    """Fault in the body of a lazily loaded note and fill `note_data` from it.
+
+    Keys missing from `note_data` (sidebar tiles only carry id and title)
+    are always filled; after a fault-in all body keys are refreshed.
+    """
+    _no = note_data.get("_note_obj")
+    if _no is None:
+        return
+
+    faulted = not _no.loaded
+    if faulted and not _no.ensure_loaded():
+        return
+
+    for key in ("topic", "date", "time", "location", "participants", "notes", "todos", "created_at", "updated_at"):
+        if faulted or key not in note_data:
+            note_data[key] = getattr(_no, key, None)
+    if faulted and registry.notes_collection:
+        # the body is known now: refresh its columns (open todos) and interned strings
+        registry.notes_collection.update_note(_no)
+
+
 def _build_header(page, note_data: dict, title_fallback: str, editing: bool) -> Row:
     """Builds the header section of the note view."""
     title = note_data.get("title") or title_fallback or "Untitled"
@@ -197,9 +225,11 @@ def _build_display_view(note_data: dict) -> Column:
                     _no = note_data.get('_note_obj')
                     if _no is not None:
                         try:
-                            _no.todos = cur_list
-                            _no.mark_dirty()
-                            registry.changed = True
+                            if _no.update_fields(todos=cur_list):
+                                registry.changed = True
+                                if registry.notes_collection:
+                                    registry.notes_collection.update_note(_no)
+                                    Observable(TODOS_CHANGED).notify(e.page)
                         except Exception:
                             logging.exception('Failed to update attached _note_obj todos')
 
@@ -346,6 +376,29 @@ def _build_edit_view(page, note_data: dict) -> Column:
         participants_value = str(_participants_raw or "")
 
     participants_tf = TextField(label="Participants", value=participants_value, multiline=True, min_lines=3, max_lines=10)
+
+    # Suggest known participant names (fuzzy, typo tolerant) for the name being typed
+    participants_suggestions = Row(wrap=True, visible=False)
+
+    def _use_participant(name):
+        text = participants_tf.value or ""
+        head = re.sub(r"[^,\n;]*$", "", text)
+        participants_tf.value = f"{head} {name}" if head and not head.endswith("\n") else f"{head}{name}"
+        participants_suggestions.visible = False
+        participants_tf.focus()
+        page.update()
+
+    def _participants_on_change(e):
+        fragment = re.split(r"[,\n;]", e.control.value or "")[-1].strip()
+        index = search.current()
+        hits = []
+        if index is not None and len(fragment) >= 2:
+            hits = [name for name, _score in index.participants.search(fragment, k=5, partial=True) if name != fragment]
+        participants_suggestions.controls = [TextButton(name, on_click=lambda ev, n=name: _use_participant(n)) for name in hits]
+        participants_suggestions.visible = bool(hits)
+        participants_suggestions.update()
+
+    participants_tf.on_change = _participants_on_change
     # Notes field with focus handlers to help keyboard shortcuts know focus
     def _notes_on_focus(e):
         try:
@@ -401,6 +454,7 @@ def _build_edit_view(page, note_data: dict) -> Column:
                 ]
             ),
             participants_tf,
+            participants_suggestions,
             Container(content=notes_tf, expand=False), # Ensure Notes field expands
             Container(content=todos_tf, expand=False), # Ensure Notes field expands
         ],
@@ -410,6 +464,7 @@ def _build_edit_view(page, note_data: dict) -> Column:
 
 _modules = ["topic", "date", "time", "location", "participants", "notes", "todos"]
 def _render_text(note_data):
+    _ensure_body(note_data)
     _text = ""
     for _module in _modules:
         val = note_data.get(_module)
@@ -588,21 +643,37 @@ def _on_save(ev, page, note_data, title_fallback):
         _no = note_data.get("_note_obj")
         if _no:
             logging.debug("[DEBUG] _on_save: updating attached _note_obj %r", getattr(_no,'title',None))
-            # Update the attached MeetingNote object with edited values
-            _no.title = note_data.get("title", title_fallback)
-            _no.topic = note_data.get("topic", "")
-            _no.date = note_data.get("date", "")
-            _no.time = note_data.get("time", "")
-            _no.location = note_data.get("location", "")
-            _no.participants = note_data.get("participants", [])
-            _no.notes = note_data.get("notes", "")
-            _no.todos = note_data.get("todos", [])
-            _no.updated_at = note_data["updated_at"]
-
-            # Mark note dirty and persist changed notes
-            _no.mark_dirty()
-            updateWindowState(page, WindowState.Changed)
-            updateWindowTitle(page, registry.notesName)
+            # Update the attached MeetingNote object with the edited values;
+            # only fields that actually changed mark the note dirty
+            _values = dict(
+                title=note_data.get("title", title_fallback),
+                topic=note_data.get("topic", ""),
+                date=note_data.get("date", ""),
+                time=note_data.get("time", ""),
+                location=note_data.get("location", ""),
+                participants=note_data.get("participants", []),
+                notes=note_data.get("notes", ""),
+                todos=note_data.get("todos", []),
+            )
+            # keep the stored value where only the form's encoding differs (None vs "", lines vs text)
+            for _key, _value in _values.items():
+                _current = getattr(_no, _key)
+                if (not _current and not _value) or (isinstance(_current, list) and _value == "\n".join(_current)):
+                    _values[_key] = _current
+            _changed = _no.update_fields(**_values)
+            if _changed:
+                _no.update_fields(updated_at=note_data["updated_at"])
+                if registry.notes_collection:
+                    registry.notes_collection.update_note(_no)
+                    if "todos" in _changed or "participants" in _changed or "date" in _changed:
+                        Observable(TODOS_CHANGED).notify(page)
+                updateWindowState(page, WindowState.Changed)
+                updateWindowTitle(page, registry.notesName)
+                _bad = [f"{_name} {_value!r}" for _n, _name, _value in unparseable([_no])]
+                if _bad:
+                    updateStatus(f"Changed: {', '.join(sorted(_changed))} (unrecognized {', '.join(_bad)})")
+                else:
+                    updateStatus(f"Changed: {', '.join(sorted(_changed))}")
             logging.debug("[DEBUG] _on_save: updated _note_obj to title=%r, topic=%r, date=%r, time=%r, location=%r, participants=%r, notes=%r, todos=%r, updated_at=%r", getattr(_no,'title',None), getattr(_no,'topic',None), getattr(_no,'date',None), getattr(_no,'time',None), getattr(_no,'location',None), getattr(_no,'participants',None), getattr(_no,'notes',None), getattr(_no,'todos',None), getattr(_no,'updated_at',None))
     else:
         info("No _controls found in note_data; skipping save of edits")
@@ -6,7 +6,7 @@
 
 
 # imports
-from flet import Row, Text, Container, Ref, MainAxisAlignment, CrossAxisAlignment, Colors, TextAlign
+from flet import Row, Text, Container, Ref, ProgressBar, MainAxisAlignment, CrossAxisAlignment, Colors, TextAlign
 from db import register, registry
 import logging
 
@@ -43,9 +43,20 @@ def build(**kwargs) -> Row:
         content=_text,
     )
 
+    register("ui.statusProgress", Ref[ProgressBar]())
+    _progress = ProgressBar(
+        width=200,
+        value=0,
+        visible=False,
+        color=Colors.GREEN_400,
+        bgcolor=Colors.GREY_600,
+        ref=registry.ui.statusProgress,
+    )
+
     _row = Row(
         [
             _container,
+            _progress,
         ], 
         height=30, 
         alignment=MainAxisAlignment.START,
@@ -58,5 +69,20 @@ def build(**kwargs) -> Row:
 def updateStatus(text: str) -> None:
     """Update the status bar text"""
     
+    if not registry.ui or not registry.ui.status or not registry.ui.status.current:
+        return
+
     registry.ui.status.current.value = text
     registry.ui.status.current.update()
+
+
+def updateProgress(done: int, total: int) -> None:
+    """Show `done` of `total` in the status bar; hidden again once done == total"""
+
+    if not registry.ui or not registry.ui.statusProgress or not registry.ui.statusProgress.current:
+        return
+
+    _bar = registry.ui.statusProgress.current
+    _bar.visible = total > 0 and done < total
+    _bar.value = done / total if total else 0
+    _bar.update()
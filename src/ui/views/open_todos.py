@@ -0,0 +1,275 @@
+###
+# File:   src\ui\views\open_todos.py
+# Date:   2026-10-18
+# Author: alexrjs
+###
+
+# imports
+import logging
+from datetime import date as date_cls
+from threading import Lock, Thread
+from flet import (
+    Checkbox, Colors, Column, Container, Dropdown, ElevatedButton, ExpansionPanel, ListTile, ListView,
+    Page, Row, Text, TextButton, TextField, dropdown, margin, padding
+)
+from db import registry, register
+from logic.pattern.observer import Observable
+from logic.ui import TODOS_CHANGED
+from logic.ui.window import updateWindowState, updateWindowTitle, WindowState
+from models.dates import NO_DATE, parse_date
+from models.todos import ANY, OpenTodo, is_open
+from ui.panels.status import updateStatus
+
+
+# constants
+# Todos rendered per page of the Open ToDos view
+PAGE_SIZE = 200
+
+# Owners listed in the sidebar summary
+_SUMMARY_OWNERS = 15
+
+# Dropdown keys of the owner filter besides participant names
+_ALL = "__all__"
+_UNASSIGNED = "__none__"
+
+
+# variables
+# (owner, date_from, date_to, show_note) of the Open ToDos view while it is shown
+_shown = None
+_view = None
+_resolving = Lock()
+
+
+# functions/classes
+def _owner_key(owner) -> str:
+    return _ALL if owner is ANY else _UNASSIGNED if owner is None else owner
+
+
+def _owner_value(key: str):
+    return ANY if key == _ALL else None if key == _UNASSIGNED else key
+
+
+def _owner_label(owner) -> str:
+    return "All" if owner is ANY else "Unassigned" if owner is None else owner
+
+
+def _date_label(date_ord: int) -> str:
+    return date_cls.fromordinal(date_ord).isoformat() if date_ord != NO_DATE else "no date"
+
+
+def close_todo(page: Page, todo: OpenTodo) -> bool:
+    """Check an open todo off in its note (faulting the body in) and mark the note changed."""
+    coll = registry.notes_collection
+    note = coll.get_note(todo.note_id) if coll is not None else None
+    if note is None or not note.ensure_loaded():
+        updateStatus("ToDo not found, the note is gone")
+        return False
+
+    lines = list(note.todos or [])
+    if todo.index >= len(lines) or not is_open(lines[todo.index]):
+        # the note was edited since the index was read
+        coll.update_note(note)
+        Observable(TODOS_CHANGED).notify(page)
+        updateStatus("ToDo changed meanwhile, list refreshed")
+        return False
+
+    lines[todo.index] = lines[todo.index].replace("[ ]", "[x]", 1)
+    if note.update_fields(todos=lines):
+        coll.update_note(note)
+        registry.changed = True
+        updateWindowTitle(page, registry.notesName)
+        updateWindowState(page, WindowState.Changed)
+    Observable(TODOS_CHANGED).notify(page)
+    return True
+
+
+def _todo_row(page: Page, todo: OpenTodo, title: str, show_note) -> Row:
+    """One open todo: checkbox with its text, date and note title (opens the note)."""
+    return Row(
+        [
+            Checkbox(value=False, on_change=lambda e, todo_=todo: close_todo(page, todo_)),
+            Column(
+                [
+                    Text(todo.text or "(empty)", color=Colors.WHITE),
+                    TextButton(
+                        f"{_date_label(todo.date_ord)}  ·  {title or 'Untitled'}" + (f"  ·  {todo.owner}" if todo.owner else ""),
+                        on_click=(lambda e, todo_=todo: show_note(page, todo_.note_id)) if show_note else None,
+                    ),
+                ],
+                spacing=0,
+                tight=True,
+                expand=True,
+            ),
+        ],
+        vertical_alignment="start",
+    )
+
+
+def _resolve_pending(page: Page) -> None:
+    """Read the todos of stubs from older collection files in the background."""
+    coll = registry.notes_collection
+    if coll is None or not _resolving.acquire(blocking=False):
+        return
+
+    def _worker() -> None:
+        try:
+            count = coll.todos.resolve(coll.get_note)
+            logging.info(f"Open ToDos: read the todos of {count} note(s)")
+        except Exception:
+            logging.exception("Open ToDos: reading pending notes failed")
+        finally:
+            _resolving.release()
+        if registry.notes_collection is coll:
+            Observable(TODOS_CHANGED).notify(page)
+
+    Thread(target=_worker, name="todo-resolve", daemon=True).start()
+
+
+def build_open_todos_view(page: Page, owner=ANY, date_from: str = None, date_to: str = None, show_note=None) -> Column:
+    """Build the Open ToDos content view.
+
+    Lists the open todos of the collection from its todo index, newest
+    notes first, `PAGE_SIZE` at a time; filters by owner (None =
+    unassigned) and note date range. `show_note(page, note_id)` opens a
+    todo's note.
+    """
+    global _shown, _view
+
+    coll = registry.notes_collection
+    if coll is None:
+        return Column([Text("No collection open.")])
+
+    index = coll.todos
+    todos = index.items(owner, date_from, date_to)
+
+    def _rerender(owner_=owner, date_from_=date_from, date_to_=date_to) -> None:
+        registry.subjects["contentView"].notify(page, [build_open_todos_view(page, owner_, date_from_, date_to_, show_note)])
+
+    def _on_owner(e) -> None:
+        _rerender(owner_=_owner_value(e.control.value))
+
+    def _on_dates(e) -> None:
+        bad = [field for field in (from_field, to_field) if field.value and parse_date(field.value) is None]
+        for field in (from_field, to_field):
+            field.error_text = "Unrecognized date" if field in bad else None
+        if bad:
+            page.update()
+            return
+        if (from_field.value or None, to_field.value or None) != (date_from, date_to):
+            _rerender(date_from_=from_field.value or None, date_to_=to_field.value or None)
+
+    owners = index.owners()
+    options = [dropdown.Option(_ALL, f"All ({len(index)})")]
+    options += [dropdown.Option(_owner_key(name), f"{_owner_label(name)} ({count})") for name, count in owners]
+    if owner is not ANY and all(name != owner for name, _count in owners):
+        options.append(dropdown.Option(_owner_key(owner), f"{_owner_label(owner)} (0)"))
+    owner_menu = Dropdown(value=_owner_key(owner), options=options, width=220, dense=True, on_change=_on_owner)
+    from_field = TextField(value=date_from or "", hint_text="From date", width=140, dense=True, on_submit=_on_dates, on_blur=_on_dates)
+    to_field = TextField(value=date_to or "", hint_text="To date", width=140, dense=True, on_submit=_on_dates, on_blur=_on_dates)
+
+    titles = coll.columns.title
+    rows = ListView(controls=[_todo_row(page, todo, titles(todo.note_id), show_note) for todo in todos[:PAGE_SIZE]],
+                    expand=True, spacing=4)
+
+    def _more(e) -> None:
+        shown = len(rows.controls)
+        rows.controls.extend(_todo_row(page, todo, titles(todo.note_id), show_note) for todo in todos[shown:shown + PAGE_SIZE])
+        more_button.visible = len(rows.controls) < len(todos)
+        status.value = _status_text()
+        page.update()
+
+    def _status_text() -> str:
+        text = f"{len(todos)} open todo(s), showing {min(len(rows.controls), len(todos))}"
+        if index.pending:
+            text += f"; reading {len(index.pending)} older note(s)..."
+        return text
+
+    more_button = ElevatedButton("Show more", on_click=_more, visible=len(todos) > PAGE_SIZE)
+    status = Text("", size=12, color=Colors.WHITE70)
+    status.value = _status_text()
+
+    if index.pending:
+        _resolve_pending(page)
+
+    _view = Column(
+        [
+            Row([Text("Open ToDos", size=20, weight="bold", expand=True), owner_menu, from_field, to_field]),
+            status,
+            rows,
+            more_button,
+        ],
+        expand=True,
+    )
+    _shown = (owner, date_from, date_to, show_note)
+    return _view
+
+
+def _on_content_view(name: str, page: Page, items: list) -> None:
+    """contentView observer: forget the Open ToDos view once something else is shown."""
+    global _shown
+    if _view is None or _view not in (items or []):
+        _shown = None
+
+
+def populate(page: Page, collection=None) -> None:
+    """Fill the sidebar Open ToDos summary (all and per owner counts) from the todo index."""
+    summary = registry.ui.sidebar.OpenTodos.list
+    if summary is None:
+        return
+
+    coll = collection if collection is not None else registry.notes_collection
+    summary.controls.clear()
+    count = registry.ui.sidebar.OpenTodos.count
+    if coll is None:
+        count.value = ""
+        page.update()
+        return
+
+    index = coll.todos
+    show_note = registry.ui.sidebar.OpenTodos.show_note
+
+    def _open(owner) -> None:
+        registry.subjects["contentView"].notify(page, [build_open_todos_view(page, owner, show_note=show_note)])
+
+    pending = "+" if index.pending else ""
+    count.value = f"{len(index)}{pending}"
+    summary.controls.append(ListTile(title=Text(f"All ({len(index)}{pending})"), dense=True, on_click=lambda e: _open(ANY)))
+    for owner, owned in index.owners()[:_SUMMARY_OWNERS]:
+        summary.controls.append(ListTile(title=Text(f"{_owner_label(owner)} ({owned})"), dense=True,
+                                         on_click=lambda e, owner_=owner: _open(owner_)))
+    page.update()
+
+
+def _on_todos_changed(name: str, page: Page) -> None:
+    """TODOS_CHANGED observer: refresh the summary and a shown Open ToDos view."""
+    try:
+        populate(page)
+        if _shown is not None:
+            owner, date_from, date_to, show_note = _shown
+            registry.subjects["contentView"].notify(page, [build_open_todos_view(page, owner, date_from, date_to, show_note)])
+    except Exception:
+        logging.exception("Open ToDos: refresh failed")
+
+
+def build_panel(page: Page, show_note=None) -> ExpansionPanel:
+    """Build the sidebar Open ToDos panel; `show_note(page, note_id)` opens a todo's note."""
+    summary = Column([], spacing=0, tight=True)
+    count = Text("", color=Colors.AMBER)
+    register("ui.sidebar.OpenTodos.list", summary)
+    register("ui.sidebar.OpenTodos.count", count)
+    register("ui.sidebar.OpenTodos.show_note", show_note)
+
+    Observable(TODOS_CHANGED).register(_on_todos_changed)
+    Observable("contentView").register(_on_content_view)
+
+    return ExpansionPanel(
+        header=ListTile(title=Row([Text("Open ToDos", expand=True), count]), bgcolor=Colors.GREY_800),
+        content=Container(
+            content=summary,
+            bgcolor=Colors.GREY_700,
+            margin=margin.symmetric(horizontal=1, vertical=1),
+            padding=padding.symmetric(horizontal=1, vertical=1),
+        ),
+        expanded=False,
+        bgcolor=Colors.GREY_800,
+    )
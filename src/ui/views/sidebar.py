@@ -5,6 +5,13 @@
 ###
 
 import logging
+import re
+from datetime import datetime
+from os import path
+from threading import Lock, Timer
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 from flet import (
     AlertDialog, 
     alignment,
@@ -14,6 +21,7 @@ from flet import (
     ElevatedButton, 
     ExpansionPanel,
     ExpansionPanelList,
+    Icon,
     IconButton,
     Icons,
     ListTile,
@@ -27,12 +35,19 @@ from flet import (
     padding,
     margin,
 )
-from datetime import datetime, date as date_cls
 from db import registry, register
+from models.dates import parse_date
 from models.notes import DEFAULT_CATEGORIES, DEFAULT_MODULES, DEFAULT_TEMPLATES, MeetingNote
+from models.timeline import NO_BUCKET
 from ui.dialogs import meeting_notes, confirm as confirm_dialog
 from ui.panels.note_view import build_note_view
-from logic.persistence import slugify, rename_note_file, update_notes
+from ui.views import open_todos
+from config.config import DATA_ROOT, FILTER_DEBOUNCE
+from logic import search
+from logic.pattern.observer import Observable
+from logic.ui import TODOS_CHANGED
+from logic.persistence import slugify, note_filename, rename_note_file, update_notes, delete_note
+from logic.ui.window import updateWindowState, WindowState
 
 
 def create_panel_header(title: str, page, enabled: bool = False, add_callback=None, edit_callback=None, delete_callback=None):
@@ -89,20 +104,15 @@ def _on_click(e, item=None):
     if getattr(item, "_is_selected", False):
         item._is_selected = False
         item.selected = False
+        register("ui.sidebar.MeetingNotes.selected", None)
         registry.ui.sidebar.MeetingNotes.edit.disabled = True
         registry.ui.sidebar.MeetingNotes.delete.disabled = True
         registry.subjects["contentView"].notify(e.page, [])
         e.page.update()
         return
 
-    # Select this item and clear others
-    meeting_list = registry.ui.sidebar.MeetingNotes.list
-    for c in meeting_list.controls:
-        c._is_selected = False
-        c.selected = False
-
-    item._is_selected = True
-    item.selected = True
+    # Select this item and clear the previous selection
+    _select_tile(item)
     registry.ui.sidebar.MeetingNotes.edit.disabled = False
     registry.ui.sidebar.MeetingNotes.delete.disabled = False
 
@@ -116,13 +126,8 @@ def _on_click(e, item=None):
         # collection (best-effort).
         try:
             if not nd.get('_note_obj') and hasattr(registry, 'notes_collection') and registry.notes_collection is not None:
-                from models.notes import MeetingNote
                 # Avoid creating duplicates: look for an existing note with same title+date
-                existing = None
-                for n in registry.notes_collection.notes:
-                    if getattr(n, 'title', None) == nd.get('title') and getattr(n, 'date', None) == nd.get('date'):
-                        existing = n
-                        break
+                existing = registry.notes_collection.find_note(nd.get('title'), nd.get('date'))
 
                 if existing:
                     nd['_note_obj'] = existing
@@ -137,7 +142,6 @@ def _on_click(e, item=None):
                         title=nd.get('title') or title,
                         category=nd.get('category', ''),
                         tags=nd.get('tags', []) or [],
-                        content=nd.get('body') or nd.get('content') or "",
                         topic=nd.get('topic') or "Meeting Note",
                         date=nd.get('date'),
                         time=nd.get('time'),
@@ -147,7 +151,7 @@ def _on_click(e, item=None):
                         todos=nd.get('todos') or [],
                         created_at=nd.get('created_at')
                     )
-                    registry.notes_collection.notes.append(note_obj)
+                    registry.notes_collection.add_note(note_obj)
                     nd['_note_obj'] = note_obj
         except Exception:
             pass
@@ -160,12 +164,387 @@ def _on_click(e, item=None):
     e.page.update()
 
 
+def _select_tile(tile) -> None:
+    """Mark `tile` as the selected meeting note (None clears the selection)."""
+    previous = registry.ui.sidebar.MeetingNotes.selected
+    if previous is not None and previous is not tile:
+        previous._is_selected = False
+        previous.selected = False
+    if tile is not None:
+        tile._is_selected = True
+        tile.selected = True
+    register("ui.sidebar.MeetingNotes.selected", tile)
+
+
+def _month_label(month: str) -> str:
+    return "No date" if month == NO_BUCKET else datetime.strptime(month, "%Y-%m").strftime("%B %Y")
+
+
+def _set_visible(control, visible: bool) -> int:
+    """Set the visibility of a control; returns 1 if it changed (for diff updates)."""
+    if control.visible == visible:
+        return 0
+    control.visible = visible
+    return 1
+
+
+def _make_tile(note_id: str, coll) -> ListTile:
+    """Create and index the tile of a note.
+
+    Tiles only carry id and title, the note view fills in the rest from
+    _note_obj.
+    """
+    nd = {
+        'id': note_id,
+        'title': coll.columns.title(note_id),
+        '_note_obj': coll.get_note(note_id),
+    }
+    lt = ListTile(title=Text(nd.get('title') or "Untitled"), selected=False)
+    lt.note_data = nd
+    lt._is_selected = False
+    lt.on_click = lambda e, item=lt: _on_click(e, item=item)
+    _add_tile(lt)
+    return lt
+
+
+class _MonthGroup:
+    """One month of the Meeting Notes list.
+
+    A header with the month's note count and a column of note tiles; the
+    tiles are created from the collection's timeline the first time the
+    month is shown.
+    """
+
+    def __init__(self, month: str) -> None:
+        self.month = month
+        self.expanded = False
+        self.built = False
+        self.label = Text("")
+        self.icon = Icon(Icons.EXPAND_MORE, size=18)
+        self.header = ListTile(title=self.label, trailing=self.icon, dense=True, bgcolor=Colors.GREY_800,
+                               on_click=lambda e: self.toggle(e.page))
+        self.body = Column([], spacing=0, visible=False)
+
+    def count(self, coll) -> int:
+        return coll.timeline.months.get(self.month, 0)
+
+    def set_label(self, coll, shown: Optional[int] = None) -> None:
+        count = self.count(coll)
+        self.label.value = f"{_month_label(self.month)} ({count if shown is None else f'{shown}/{count}'})"
+
+    def materialize(self, coll) -> None:
+        """Create the tiles of the month, newest first; a known tile (a new or moved note's) is reused."""
+        tiles = registry.ui.sidebar.MeetingNotes.tiles or {}
+        groups = registry.ui.sidebar.MeetingNotes.groups or {}
+        controls = []
+        for note_id in coll.timeline.bucket(self.month):
+            tile = tiles.get(note_id)
+            if tile is None:
+                tile = _make_tile(note_id, coll)
+            else:
+                previous = groups.get(getattr(tile, "_group", None))
+                if previous is not None and previous is not self and tile in previous.body.controls:
+                    # the note's date was edited into this month
+                    previous.body.controls.remove(tile)
+                    previous.set_label(coll)
+            tile._group = self.month
+            controls.append(tile)
+        self.body.controls = controls
+        self.built = True
+
+    def show_body(self, visible: bool) -> int:
+        self.icon.name = Icons.EXPAND_LESS if visible else Icons.EXPAND_MORE
+        return _set_visible(self.body, visible)
+
+    def expand(self, coll, expanded: bool = True) -> None:
+        self.expanded = expanded
+        if expanded and not self.built:
+            self.materialize(coll)
+        self.show_body(expanded)
+
+    def toggle(self, page: Page) -> None:
+        coll = registry.notes_collection
+        if coll is None:
+            return
+        self.expand(coll, not self.body.visible)
+        registry.ui.sidebar.MeetingNotes.list.update()
+
+    def apply_filter(self, coll, matched: Optional[set], selected_id: Optional[str]) -> int:
+        """Show the month's tiles matching a filter (None: all, in the month's collapsed state).
+
+        Returns the number of controls whose visibility changed.
+        """
+        if matched is None:
+            shown, body = None, self.expanded
+        else:
+            shown = sum(1 for note_id in coll.timeline.bucket(self.month) if note_id in matched or note_id == selected_id)
+            body = shown > 0
+        if body and not self.built:
+            self.materialize(coll)
+        changed = _set_visible(self.header, shown is None or shown > 0)
+        changed += self.show_body(body)
+        self.set_label(coll, shown)
+        for tile in self.body.controls:
+            note_id = (getattr(tile, "note_data", None) or {}).get("id")
+            changed += _set_visible(tile, matched is None or note_id in matched or getattr(tile, "_is_selected", False))
+        return changed
+
+
+def _place_tile(tile, coll) -> None:
+    """Put the tile of a new note into its month group (added if needed) and expand it."""
+    groups = registry.ui.sidebar.MeetingNotes.groups
+    lv = registry.ui.sidebar.MeetingNotes.list
+    _add_tile(tile)
+    month = coll.timeline.bucket_of(tile.note_data['id'])
+    group = groups.get(month)
+    if group is None:
+        group = _MonthGroup(month)
+        order = [bucket for bucket, _count in coll.timeline.buckets()]
+        following = next((groups[bucket] for bucket in order[order.index(month) + 1:] if bucket in groups), None)
+        at = lv.controls.index(following.header) if following is not None else len(lv.controls)
+        lv.controls[at:at] = [group.header, group.body]
+        groups[month] = group
+        ordered = {bucket: groups[bucket] for bucket in order if bucket in groups}
+        groups.clear()
+        groups.update(ordered)
+    if group.built:
+        ids = coll.timeline.bucket(month)
+        tile._group = month
+        group.body.controls.insert(ids.index(tile.note_data['id']), tile)
+    group.expand(coll)
+    group.set_label(coll)
+
+
+def _remove_tile(tile, coll) -> None:
+    """Take the tile of a deleted note out of its month group (dropping an emptied group)."""
+    groups = registry.ui.sidebar.MeetingNotes.groups or {}
+    lv = registry.ui.sidebar.MeetingNotes.list
+    group = groups.get(getattr(tile, "_group", None))
+    if group is None:
+        if tile in lv.controls:
+            lv.controls.remove(tile)
+        return
+    if tile in group.body.controls:
+        group.body.controls.remove(tile)
+    if group.count(coll) > 0:
+        group.set_label(coll)
+        return
+    del groups[group.month]
+    for control in (group.header, group.body):
+        if control in lv.controls:
+            lv.controls.remove(control)
+
+
+# Debounce timer of the Meeting Notes filter box, and the number of the
+# latest filter input (results of older inputs are dropped)
+_filter_timer = None
+_filter_lock = Lock()
+_filter_seq = 0
+
+# Fuzzy (typo tolerant) part of the filter: minimum query length, minimum
+# share of the query's trigrams a name must contain, most names matched
+_FUZZY_MIN_CHARS = 3
+_FUZZY_THRESHOLD = 0.5
+_FUZZY_LIMIT = 200
+
+# Filter operators: with:Alex, with:"Alex S", at:Kantine, from:2025-07-01, to:30.09.2025
+_FILTER_OPERATOR_RE = re.compile(r'(?<!\S)(with|at|from|to):(?:"([^"]*)"|(\S+))', re.IGNORECASE)
+
+
+def _add_tile(tile) -> None:
+    """Index a meeting note tile by note id for the filter."""
+    tiles = registry.ui.sidebar.MeetingNotes.tiles
+    note_id = (getattr(tile, "note_data", None) or {}).get("id")
+    if tiles is not None and note_id:
+        tiles[note_id] = tile
+
+
+def _parse_filter(query: str) -> Tuple[str, Dict[str, List[str]]]:
+    """Split the filter text into free text and its with:/at:/from:/to: operators."""
+    operators: Dict[str, List[str]] = {}
+
+    def _take(m) -> str:
+        operators.setdefault(m.group(1).lower(), []).append(m.group(2) if m.group(2) is not None else m.group(3))
+        return " "
+
+    return _FILTER_OPERATOR_RE.sub(_take, query).strip(), operators
+
+
+def _operator_ids(operators: Dict[str, List[str]], coll) -> set:
+    """Return the ids of the notes matching every with:/at: name within the from:/to: dates.
+
+    A name matches every participant/location whose words it starts
+    ("with:alex" finds "Alex S").
+    """
+    date_from = (operators.get("from") or [None])[-1]
+    date_to = (operators.get("to") or [None])[-1]
+    if coll.participant_index.pending or coll.location_index.pending:
+        coll.resolve_names()
+
+    matched = None
+    for key, index in (("with", coll.participant_index), ("at", coll.location_index)):
+        for name in operators.get(key, ()):
+            ids = set()
+            for entity in index.match(name):
+                ids.update(index.note_ids(entity, date_from, date_to))
+            matched = ids if matched is None else matched & ids
+
+    if matched is None:
+        # dates only
+        columns = coll.columns
+        rows = columns.filter_rows(date_from=parse_date(date_from) if date_from else None,
+                                   date_to=parse_date(date_to) if date_to else None)
+        matched = set(columns.note_ids(rows))
+    return matched
+
+
+def _matching_ids(query: str, coll) -> set:
+    """Return the ids of the notes matching the filter text.
+
+    with:NAME, at:PLACE (quoted for spaces), from:DATE and to:DATE select
+    notes through the participant and location indexes; the remaining
+    text is matched against names as below.
+    """
+    text, operators = _parse_filter(query)
+    if not operators:
+        return _text_ids(query, coll)
+    matched = _operator_ids(operators, coll)
+    if text and matched:
+        matched &= _text_ids(text, coll)
+    return matched
+
+
+def _text_ids(query: str, coll) -> set:
+    """Return the ids of the notes whose names match `query`.
+
+    Uses the name fields (title, topic, participants) of the search index:
+    every word must start a name word, or (from a few characters on) a name
+    must be similar to the query. While the index is still being built only
+    titles are matched.
+    """
+    index = search.current()
+    if index is not None and index.collection is coll and index.ready.is_set():
+        matched = index.match_names(query)
+        if len(query) >= _FUZZY_MIN_CHARS:
+            matched |= index.names.search_owners(query, k=_FUZZY_LIMIT, threshold=_FUZZY_THRESHOLD, partial=True)
+        return matched
+
+    words = search.tokenize(query)
+    columns = coll.columns
+    matched = set()
+    for note_id in columns.ids:
+        title = search.tokenize(columns.title(note_id) or "")
+        if all(any(token.startswith(word) for token in title) for word in words):
+            matched.add(note_id)
+    return matched
+
+
+def apply_filter(page: Page, query: str) -> None:
+    """Show only the tiles of notes matching `query` (all for an empty query).
+
+    Months without matches are hidden, months with matches are shown
+    open (creating their tiles if needed); an empty query restores the
+    collapsed months. Only controls whose visibility changes are touched,
+    so the update sent to the client is a diff of the list rather than a
+    rebuild.
+    """
+    coll = registry.notes_collection
+    if not registry.ui.sidebar.MeetingNotes.groups or coll is None:
+        return
+
+    started = perf_counter()
+    query = (query or "").strip()
+    _show_matches(coll, query, _matching_ids(query, coll) if query else None, started)
+
+
+def _show_matches(coll, query: str, matched: Optional[set], started: float) -> None:
+    """Apply the ids matched by a filter query to the Meeting Notes list (see apply_filter)."""
+    groups = registry.ui.sidebar.MeetingNotes.groups
+    if not groups or coll is not registry.notes_collection:
+        return
+
+    selected = registry.ui.sidebar.MeetingNotes.selected
+    selected_id = (getattr(selected, "note_data", None) or {}).get("id")
+    changed = 0
+    for group in groups.values():
+        changed += group.apply_filter(coll, matched, selected_id)
+
+    registry.ui.sidebar.MeetingNotes.list.update()
+    elapsed_ms = (perf_counter() - started) * 1000
+    logging.debug(f"sidebar filter {query!r}: {len(coll.timeline) if matched is None else len(matched)} shown, {changed} control(s) changed in {elapsed_ms:.1f} ms")
+
+
+def show_note(page: Page, note_id: str = None, filename: str = None) -> bool:
+    """Select and show a meeting note of the open collection by id (or file name).
+
+    Clears the filter if it hides the note. Returns False if the note is
+    not in the list.
+    """
+    coll = registry.notes_collection
+    groups = registry.ui.sidebar.MeetingNotes.groups or {}
+    if coll is None:
+        return False
+    if note_id not in coll.timeline and filename:
+        note = coll.note_by_filename(filename)
+        note_id = note.id if note is not None else None
+    group = groups.get(coll.timeline.bucket_of(note_id)) if note_id in coll.timeline else None
+    if group is None:
+        return False
+
+    group.expand(coll)
+    tile = (registry.ui.sidebar.MeetingNotes.tiles or {}).get(note_id)
+    if tile is None:
+        return False
+    if not tile.visible or not group.header.visible:
+        registry.ui.sidebar.MeetingNotes.filter.value = ""
+        apply_filter(page, "")
+    if not getattr(tile, "_is_selected", False):
+        _on_click(SimpleNamespace(page=page), item=tile)
+    else:
+        page.update()
+    return True
+
+
+def _filter_in_background(page: Page, query: str, seq: int) -> None:
+    """Debounce timer: match the notes on this thread, then change the controls
+    from the page's executor like an event handler does (page.run_thread).
+    Results of a query typed over in the meantime are dropped."""
+    coll = registry.notes_collection
+    if not registry.ui.sidebar.MeetingNotes.groups or coll is None:
+        return
+
+    started = perf_counter()
+    query = (query or "").strip()
+    matched = _matching_ids(query, coll) if query else None
+
+    def show() -> None:
+        if seq == _filter_seq:
+            _show_matches(coll, query, matched, started)
+
+    if seq == _filter_seq:
+        page.run_thread(show)
+
+
+def _on_filter_change(e) -> None:
+    """Debounce filter input; the list is filtered once typing pauses."""
+    global _filter_timer, _filter_seq
+
+    query = e.control.value
+    with _filter_lock:
+        if _filter_timer is not None:
+            _filter_timer.cancel()
+        _filter_seq += 1
+        _filter_timer = Timer(FILTER_DEBOUNCE, _filter_in_background, args=(e.page, query, _filter_seq))
+        _filter_timer.daemon = True
+        _filter_timer.start()
+
+
 def populate_meeting_notes(page: Page, collection=None):
     """Populate the MeetingNotes ListView from a NotesCollection.
 
     This is safe to call multiple times; it clears the current list and
-    re-adds tiles for each MeetingNote found in `collection` (or
-    `registry.notes_collection` if omitted).
+    re-adds a group per month of the notes found in `collection` (or
+    `registry.notes_collection` if omitted), newest first.
     """
     try:
         coll = collection if collection is not None else getattr(registry, 'notes_collection', None)
@@ -176,75 +555,44 @@ def populate_meeting_notes(page: Page, collection=None):
         lv = meeting_ns.list
         # clear existing entries
         lv.controls.clear()
+        register("ui.sidebar.MeetingNotes.selected", None)
+        register("ui.sidebar.MeetingNotes.tiles", {})
+        register("ui.sidebar.MeetingNotes.groups", {})
+        if getattr(meeting_ns, 'filter', None) is not None:
+            meeting_ns.filter.value = ""
+
+        if coll is None:
+            page.update()
+            return
 
-        notes = coll.notes if coll and getattr(coll, 'notes', None) is not None else []
-
-        def _to_dt(val):
-            if val is None:
-                return datetime.min
-            if isinstance(val, datetime):
-                return val
-            if isinstance(val, date_cls):
-                return datetime.combine(val, datetime.min.time())
-            if isinstance(val, str):
-            # try ISO first, then some common formats
-                try:
-                    return datetime.fromisoformat(val)
-                except Exception:
-                    for fmt in ("%Y-%m-%d", "%d-%m-%Y", "%m/%d/%Y", "%Y/%m/%d", "%d.%m.%Y"):
-                        return datetime.strptime(val, fmt)
-
-                return datetime.min
-
-            try:
-            # numeric timestamps
-                return datetime.fromtimestamp(float(val))
-            except Exception:
-                return datetime.min
-
-        # sort notes by date descending (newest first)
-        sorted_notes = sorted(notes, key=lambda n: _to_dt(getattr(n, 'date', None)), reverse=True)
-
-        for note in sorted_notes:
+        # one collapsible group per month from the collection's timeline;
+        # tiles are created when a month is first expanded
+        groups = registry.ui.sidebar.MeetingNotes.groups
+        for month, _count in coll.timeline.buckets():
             try:
-                nd = {
-                    'title': getattr(note, 'title', None),
-                    'topic': getattr(note, 'topic', None),
-                    'date': getattr(note, 'date', None),
-                    'time': getattr(note, 'time', None),
-                    'location': getattr(note, 'location', None),
-                    'participants': getattr(note, 'participants', None),
-                    'notes': getattr(note, 'notes', None),
-                    'todos': getattr(note, 'todos', None),
-                    'created_at': getattr(note, 'created_at', None),
-                    'updated_at': getattr(note, 'updated_at', None),
-                    '_note_obj': note,
-                }
-
-                lt = ListTile(
-                    title=Text(nd.get('title') or "Untitled"), 
-                    selected=False, 
-                    )
-                lt.seltected = False
-                lt.note_data = nd
-                lt._is_selected = False
-                lt.on_click = lambda e, item=lt: _on_click(e, item=item)
-                lv.controls.append(lt)
+                group = _MonthGroup(month)
+                group.set_label(coll)
+                groups[month] = group
+                lv.controls.extend((group.header, group.body))
             except Exception as _e:
-                logging.exception(f'Error adding note to sidebar list: {_e}')
+                logging.exception(f'Error adding month {month!r} to sidebar list: {_e}')
 
-        # auto-select first note
+        # open the newest month and auto-select its first note
         try:
-            if lv.controls:
-                first = lv.controls[0]
-                first._is_selected = True
-                first.selected = True
-                nd = getattr(first, 'note_data', {}) or {}
-                col = build_note_view(page, nd, title_fallback=nd.get('title'))
-                registry.subjects['contentView'].notify(page, [col])
+            if groups:
+                newest = next(iter(groups.values()))
+                newest.expand(coll)
+                if newest.body.controls:
+                    first = newest.body.controls[0]
+                    _select_tile(first)
+                    nd = getattr(first, 'note_data', {}) or {}
+                    col = build_note_view(page, nd, title_fallback=nd.get('title'))
+                    registry.subjects['contentView'].notify(page, [col])
         except Exception as _e:
             logging.exception(f'Error auto-selecting first note in sidebar: {_e}')
 
+        open_todos.populate(page, coll)
+
         page.update()
 
     except Exception:
@@ -291,22 +639,15 @@ def build(page: Page):
             lt.note_data = data
             lt._is_selected = False
             lt.on_click = lambda e, item=lt: _on_click(e, item=item)
-            meeting_list.controls.append(lt)
             # Auto-select the newly created item
             try:
-                for c in meeting_list.controls:
-                    c._is_selected = False
-                    c.selected = False
-
-                lt._is_selected = True
-                lt.selected = True
+                _select_tile(lt)
 
                 if hasattr(registry, 'notes_collection') and registry.notes_collection is not None:
                     note_obj = MeetingNote(
                         title=data.get('title', ''),
                         category=data.get('category', ''),
                         tags=data.get('tags', []) or [],
-                        content=data.get('body', '') or "",
                         topic=data.get('topic') or "Meeting Note",
                         date=data.get('date'),
                         time=data.get('time'),
@@ -317,8 +658,12 @@ def build(page: Page):
                         created_at=(f"{data.get('date')} {data.get('time')}" if data.get('date') and data.get('time') else data.get('date')),
                         updated_at=(f"{data.get('date')} {data.get('time')}" if data.get('date') and data.get('time') else data.get('date'))
                     )
-                    registry.notes_collection.notes.append(note_obj)
+                    registry.notes_collection.add_note(note_obj)
+                    data['id'] = note_obj.id
                     data['_note_obj'] = note_obj
+                    _place_tile(lt, registry.notes_collection)
+                else:
+                    meeting_list.controls.append(lt)
 
                 # Build the default note view and publish it
                 col = build_note_view(p, data or {}, title_fallback=title)
@@ -341,17 +686,22 @@ def build(page: Page):
 
     def _meeting_delete(e):
         try:
-            # find selected item
-            sel = None
-            for c in meeting_list.controls:
-                if getattr(c, "_is_selected", False):
-                    sel = c
-                    break
+            sel = registry.ui.sidebar.MeetingNotes.selected
             if not sel:
                 return
 
             def _do_delete():
-                meeting_list.controls.remove(sel)
+                register("ui.sidebar.MeetingNotes.selected", None)
+                (registry.ui.sidebar.MeetingNotes.tiles or {}).pop((getattr(sel, "note_data", None) or {}).get("id"), None)
+                _no = (getattr(sel, "note_data", None) or {}).get("_note_obj")
+                if _no is not None and registry.notes_collection is not None:
+                    ok, msg = delete_note(registry.notes_collection, _no, DATA_ROOT)
+                    if not ok:
+                        logging.error(f"Delete failed: {msg}")
+                    _remove_tile(sel, registry.notes_collection)
+                    Observable(TODOS_CHANGED).notify(page)
+                elif sel in meeting_list.controls:
+                    meeting_list.controls.remove(sel)
                 registry.ui.sidebar.MeetingNotes.edit.disabled = True
                 registry.ui.sidebar.MeetingNotes.delete.disabled = True
                 registry.subjects["contentView"].notify(page, [])
@@ -363,12 +713,7 @@ def build(page: Page):
 
     def _meeting_edit(e):
         try:
-            # find selected item
-            sel = None
-            for c in meeting_list.controls:
-                if getattr(c, "_is_selected", False):
-                    sel = c
-                    break
+            sel = registry.ui.sidebar.MeetingNotes.selected
             if not sel:
                 # no selection - inform the user with a small dialog
                 dlg = AlertDialog(title=Text("Rename"), content=Text("Please select a meeting note first."), actions=[ElevatedButton("OK", on_click=lambda ev: (page.close(dlg), page.update()))])
@@ -403,15 +748,20 @@ def build(page: Page):
                         col = build_note_view(page, nd, title_fallback=new_title)
                         registry.subjects["contentView"].notify(page, [col])
 
-                    for note in registry.notes_collection.notes:
-                        if note.title != initial:
-                            continue
-
+                    note = nd.get("_note_obj") or registry.notes_collection.get_note(nd.get("id"))
+                    if note is not None:
+                        old_file = path.splitext(note_filename(note))[0]
                         note.title = new_title
                         # try to rename underlying file in the notes folder (sanitize special chars)
-                        rename_note_file(slugify(initial), slugify(new_title))
+                        ok, new_path = rename_note_file(old_file, slugify(new_title))
+                        if ok:
+                            note.filename = path.basename(new_path)
+                        registry.notes_collection.update_note(note)
+                        registry.notes_collection.filenames.pop(note.id, None)
                         update_notes(registry.notes_collection, check_exists=True)
-                        break
+                        # the stored title changes too, so the note must be saved again
+                        note.mark_dirty("title")
+                        updateWindowState(page, WindowState.Changed)
 
                 except Exception:
                     pass
@@ -435,6 +785,11 @@ def build(page: Page):
 
     meeting_list = ListView(controls=[], spacing=0, padding=padding.all(0), divider_thickness=0, height=300)
     register("ui.sidebar.MeetingNotes.list", meeting_list)
+    register("ui.sidebar.MeetingNotes.tiles", {})
+    register("ui.sidebar.MeetingNotes.groups", {})
+
+    meeting_filter = TextField(hint_text="Filter notes (with:, at:, from:, to:)", prefix_icon=Icons.SEARCH, dense=True, on_change=_on_filter_change)
+    register("ui.sidebar.MeetingNotes.filter", meeting_filter)
 
     # Register the add callback so header resolver can find it
     register("ui.sidebar.MeetingNotes.add_callback", _meeting_add)
@@ -448,7 +803,7 @@ def build(page: Page):
             ExpansionPanel(
                 header=create_panel_header("Meeting Notes", page, enabled=enabled, add_callback=_meeting_add, edit_callback=_meeting_edit, delete_callback=_meeting_delete),
                 content=Container(
-                    content=meeting_list,#Column([meeting_list], spacing=0, run_spacing=0, tight=True),
+                    content=Column([meeting_filter, meeting_list], spacing=0, tight=True),
                     bgcolor=Colors.GREY_700,
                     margin=margin.symmetric(horizontal=1, vertical=1),
                     padding=padding.symmetric(horizontal=1, vertical=1),
@@ -456,6 +811,7 @@ def build(page: Page):
                 expanded=True,
                 bgcolor=Colors.GREY_800,
             ),
+            open_todos.build_panel(page, show_note=show_note),
             ExpansionPanel(
                 header=create_panel_header("Templates", page, enabled=enabled),
                 content=Container(